@@ -12,10 +12,12 @@ Provides:
 - Comprehensive logging
 """
 
+import atexit
 import logging
 import os
-from datetime import datetime
-from typing import List, Optional, Tuple
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
@@ -27,13 +29,130 @@ from selenium.common.exceptions import (
     TimeoutException,
     NoSuchElementException,
     StaleElementReferenceException,
-    ElementNotInteractableException
+    ElementNotInteractableException,
+    JavascriptException,
+    WebDriverException
 )
 
 
+# Below DEBUG: used for thin passthrough wrappers that would otherwise flood the logs
+TRACE = 5
+logging.addLevelName(TRACE, "TRACE")
+
+
+def _trace(logger, msg: str, *args) -> None:
+    """Log at TRACE level, skipping record creation entirely when TRACE is disabled."""
+    if logger.isEnabledFor(TRACE):
+        logger.log(TRACE, msg, *args)
+
+
+def _write_png(filepath: str, png: bytes) -> None:
+    """Write PNG bytes to disk (runs on the screenshot writer thread)."""
+    with open(filepath, 'wb') as f:
+        f.write(png)
+
+
 class WebInterface:
     """Selenium WebDriver wrapper with logging, screenshots, and enhanced wait mechanisms."""
 
+    # Shared writer pool for failure screenshots (created on first use)
+    _screenshot_pool: Optional[ThreadPoolExecutor] = None
+
+    # Shared JS locator: returns the first node matching (strategy, value) or null.
+    _LOCATE_JS = """
+        function locate(strategy, value) {
+            switch (strategy) {
+                case 'css selector':
+                    return document.querySelector(value);
+                case 'xpath':
+                    return document.evaluate(value, document, null,
+                        XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+                case 'id':
+                    return document.getElementById(value);
+                case 'name':
+                    return document.getElementsByName(value)[0] || null;
+                case 'class name':
+                    return document.getElementsByClassName(value)[0] || null;
+                case 'tag name':
+                    return document.getElementsByTagName(value)[0] || null;
+                case 'link text':
+                case 'partial link text':
+                    var links = document.getElementsByTagName('a');
+                    for (var i = 0; i < links.length; i++) {
+                        var text = links[i].innerText.trim();
+                        if (strategy === 'link text' ? text === value : text.indexOf(value) !== -1) {
+                            return links[i];
+                        }
+                    }
+                    return null;
+            }
+            return null;
+        }
+    """
+
+    # Resolves a list of [strategy, value] pairs in one round-trip.
+    # arguments[1] == true returns presence booleans instead of elements.
+    _BULK_LOCATE_JS = _LOCATE_JS + """
+        var found = arguments[0].map(function (loc) { return locate(loc[0], loc[1]); });
+        return arguments[1] ? found.map(function (el) { return el !== null; }) : found;
+    """
+
+    # Locates one element and reads its text plus requested attributes in one round-trip.
+    # Attributes resolve like WebElement.get_attribute: boolean attributes (Selenium's
+    # list, mapped to their camelCase property) give 'true' or null, others read the
+    # property first, then the attribute.
+    _LOCATE_AND_READ_JS = _LOCATE_JS + """
+        var BOOLEAN_PROPS = {
+            allowfullscreen: 'allowFullscreen', async: 'async', autofocus: 'autofocus',
+            autoplay: 'autoplay', checked: 'checked', compact: 'compact', controls: 'controls',
+            declare: 'declare', default: 'default', defaultchecked: 'defaultChecked',
+            defaultselected: 'defaultSelected', defer: 'defer', disabled: 'disabled',
+            formnovalidate: 'formNoValidate', hidden: 'hidden', indeterminate: 'indeterminate',
+            ismap: 'isMap', itemscope: 'itemScope', loop: 'loop', multiple: 'multiple',
+            muted: 'muted', nohref: 'noHref', nomodule: 'noModule', noresize: 'noResize',
+            noshade: 'noShade', novalidate: 'noValidate', nowrap: 'noWrap', open: 'open',
+            playsinline: 'playsInline', readonly: 'readOnly', required: 'required',
+            reversed: 'reversed', scoped: 'scoped', seamless: 'seamless', selected: 'selected',
+            truespeed: 'trueSpeed', typemustmatch: 'typeMustMatch'
+        };
+        var el = locate(arguments[0], arguments[1]);
+        if (el === null) { return null; }
+        var attrs = arguments[2].map(function (name) {
+            var boolProp = BOOLEAN_PROPS[name.toLowerCase()];
+            if (boolProp !== undefined) {
+                return (el[boolProp] === true || el.hasAttribute(name)) ? 'true' : null;
+            }
+            var val = el[name];
+            if (typeof val === 'boolean') { return val ? 'true' : null; }
+            if (val === undefined || val === null || typeof val === 'object' || typeof val === 'function') {
+                return el.getAttribute(name);
+            }
+            return String(val);
+        });
+        return [el.innerText, attrs];
+    """
+
+    # Locates one element and scrolls it to the middle of the viewport; returns false if absent.
+    _LOCATE_AND_SCROLL_JS = _LOCATE_JS + """
+        var el = locate(arguments[0], arguments[1]);
+        if (el === null) { return false; }
+        el.scrollIntoView({block: 'center'});
+        return true;
+    """
+
+    # Polls a JS boolean expression (spliced in as %s) every 50ms inside the browser
+    _WAIT_FOR_JS = """
+        var done = arguments[arguments.length - 1];
+        function check() { return (%s); }
+        var value = check();
+        if (value) { done(value); return; }
+        var poll = setInterval(function () {
+            value = check();
+            if (value) { clearInterval(poll); clearTimeout(expiry); done(value); }
+        }, 50);
+        var expiry = setTimeout(function () { clearInterval(poll); done(null); }, arguments[0]);
+    """
+
     def __init__(self, driver: WebDriver, config: dict, logger: logging.Logger):
         """
         Initialize WebInterface.
@@ -49,9 +168,48 @@ class WebInterface:
         self.explicit_wait = int(config.get('explicit_wait', 20))
         self.screenshot_dir = config.get('screenshot_dir', 'screenshots')
         self.screenshots_on_failure = config.get('screenshots_on_failure', True)
+        self.poll_frequency = float(config.get('poll_frequency', 0.25))
+
+        # WebDriverWait instances cached per timeout value (see _wait)
+        self._waits: Dict[int, WebDriverWait] = {}
+
+        # ActionChains created on first use (see actions)
+        self._actions: Optional[ActionChains] = None
+
+        # Elements cached by locator for the current document (see find_element_cached)
+        self._locator_cache: Dict[Tuple[str, str], WebElement] = {}
 
         # Ensure screenshot directory exists
         os.makedirs(self.screenshot_dir, exist_ok=True)
+        self._screenshot_prefix = os.path.join(self.screenshot_dir, "")
+
+        # Prefix files with the pytest-xdist worker id so parallel workers never overwrite each other
+        worker_id = os.getenv('PYTEST_XDIST_WORKER')
+        if worker_id:
+            self._screenshot_prefix += f"{worker_id}_"
+
+    # ==================== WAIT HELPERS ====================
+
+    def _wait(self, timeout: int) -> WebDriverWait:
+        """
+        Get a cached WebDriverWait for the given timeout.
+
+        Args:
+            timeout: Timeout in seconds
+
+        Returns:
+            WebDriverWait polling at the configured frequency
+        """
+        wait = self._waits.get(timeout)
+        if wait is None:
+            wait = WebDriverWait(
+                self.driver,
+                timeout,
+                poll_frequency=self.poll_frequency,
+                ignored_exceptions=(NoSuchElementException, StaleElementReferenceException)
+            )
+            self._waits[timeout] = wait
+        return wait
 
     # ==================== NAVIGATION METHODS ====================
 
@@ -64,6 +222,7 @@ class WebInterface:
         """
         self.logger.info(f"Navigating to: {url}")
         try:
+            self._locator_cache.clear()
             self.driver.get(url)
             self.logger.info(f"Successfully navigated to: {url}")
         except Exception as e:
@@ -73,17 +232,20 @@ class WebInterface:
 
     def refresh_page(self) -> None:
         """Refresh the current page."""
-        self.logger.info("Refreshing page")
+        _trace(self.logger, "Refreshing page")
+        self._locator_cache.clear()
         self.driver.refresh()
 
     def go_back(self) -> None:
         """Navigate back in browser history."""
-        self.logger.info("Navigating back")
+        _trace(self.logger, "Navigating back")
+        self._locator_cache.clear()
         self.driver.back()
 
     def go_forward(self) -> None:
         """Navigate forward in browser history."""
-        self.logger.info("Navigating forward")
+        _trace(self.logger, "Navigating forward")
+        self._locator_cache.clear()
         self.driver.forward()
 
     def get_current_url(self) -> str:
@@ -94,7 +256,7 @@ class WebInterface:
             Current URL as string
         """
         url = self.driver.current_url
-        self.logger.debug(f"Current URL: {url}")
+        self.logger.debug("Current URL: %s", url)
         return url
 
     def get_page_title(self) -> str:
@@ -105,7 +267,7 @@ class WebInterface:
             Page title as string
         """
         title = self.driver.title
-        self.logger.debug(f"Page title: {title}")
+        self.logger.debug("Page title: %s", title)
         return title
 
     # ==================== ELEMENT FINDING METHODS ====================
@@ -117,7 +279,7 @@ class WebInterface:
         Args:
             by: Locator strategy (By.ID, By.XPATH, etc.)
             value: Locator value
-            timeout: Optional custom timeout (uses default if not provided)
+            timeout: Optional custom timeout (uses default if not provided, 0 for a direct lookup)
 
         Returns:
             WebElement if found
@@ -125,13 +287,19 @@ class WebInterface:
         Raises:
             TimeoutException: If element not found within timeout
         """
-        timeout = timeout or self.explicit_wait
-        self.logger.debug(f"Finding element: {by}='{value}' with timeout={timeout}s")
+        timeout = self.explicit_wait if timeout is None else timeout
+        self.logger.debug("Finding element: %s='%s' with timeout=%ss", by, value, timeout)
 
         try:
-            wait = WebDriverWait(self.driver, timeout)
-            element = wait.until(EC.presence_of_element_located((by, value)))
-            self.logger.debug(f"Element found: {by}='{value}'")
+            if timeout == 0:
+                # Direct lookup - no wait object, no polling tick
+                try:
+                    element = self.driver.find_element(by, value)
+                except NoSuchElementException as e:
+                    raise TimeoutException(f"Element not found: {by}='{value}'") from e
+            else:
+                element = self._wait(timeout).until(EC.presence_of_element_located((by, value)))
+            self.logger.debug("Element found: %s='%s'", by, value)
             return element
         except TimeoutException:
             self.logger.error(f"Element not found: {by}='{value}' after {timeout}s")
@@ -150,18 +318,144 @@ class WebInterface:
         Returns:
             List of WebElements (empty list if none found)
         """
-        timeout = timeout or self.explicit_wait
-        self.logger.debug(f"Finding elements: {by}='{value}' with timeout={timeout}s")
+        timeout = self.explicit_wait if timeout is None else timeout
+        self.logger.debug("Finding elements: %s='%s' with timeout=%ss", by, value, timeout)
 
         try:
-            wait = WebDriverWait(self.driver, timeout)
+            wait = self._wait(timeout)
             elements = wait.until(EC.presence_of_all_elements_located((by, value)))
-            self.logger.debug(f"Found {len(elements)} elements: {by}='{value}'")
+            self.logger.debug("Found %s elements: %s='%s'", len(elements), by, value)
             return elements
         except TimeoutException:
             self.logger.warning(f"No elements found: {by}='{value}' after {timeout}s")
             return []
 
+    @staticmethod
+    def scoped_locator(parent: Tuple[By, str], child: Tuple[By, str]) -> Optional[Tuple[By, str]]:
+        """
+        Combine a parent and child locator into one descendant locator.
+
+        Args:
+            parent: Parent (by, value) locator
+            child: Child (by, value) locator, relative to the parent
+
+        Returns:
+            Combined locator, or None if the strategies cannot be merged
+        """
+        parent_by, parent_value = parent
+        child_by, child_value = child
+
+        # IDs merge cleanly into CSS descendant selectors
+        if parent_by == By.ID:
+            parent_by, parent_value = By.CSS_SELECTOR, f'[id="{parent_value}"]'
+        if child_by == By.ID:
+            child_by, child_value = By.CSS_SELECTOR, f'[id="{child_value}"]'
+
+        if parent_by == child_by == By.CSS_SELECTOR:
+            return (By.CSS_SELECTOR, f"{parent_value} {child_value}")
+
+        if parent_by == child_by == By.XPATH:
+            if child_value.startswith("./"):
+                child_value = child_value[1:]
+            elif not child_value.startswith("/"):
+                child_value = f"/{child_value}"
+            return (By.XPATH, f"{parent_value}{child_value}")
+
+        return None
+
+    def find_scoped(self, parent: Tuple[By, str], child: Tuple[By, str],
+                    timeout: Optional[int] = None) -> WebElement:
+        """
+        Find a child element within a parent using a single lookup where possible.
+
+        Same-strategy locators (CSS/CSS, XPath/XPath, or involving IDs) are merged
+        into one locator; mixed strategies fall back to parent-then-child lookup.
+
+        Args:
+            parent: Parent (by, value) locator
+            child: Child (by, value) locator
+            timeout: Optional custom timeout
+
+        Returns:
+            Child WebElement
+        """
+        combined = self.scoped_locator(parent, child)
+        if combined:
+            return self.find_element(*combined, timeout=timeout)
+
+        self.logger.debug("Mixed locator strategies, scoping in two steps: %s -> %s", parent, child)
+        return self.find_element(*parent, timeout=timeout).find_element(*child)
+
+    def find_element_cached(self, by: By, value: str, timeout: Optional[int] = None) -> WebElement:
+        """
+        Find an element, reusing the reference from an earlier lookup on the same document.
+
+        The cache is cleared by every navigation, frame and window switch made through
+        this interface. Navigation triggered by clicks is not tracked: if a cached element
+        raises StaleElementReferenceException, call clear_locator_cache() and retry.
+
+        Args:
+            by: Locator strategy
+            value: Locator value
+            timeout: Optional custom timeout for the initial lookup
+
+        Returns:
+            WebElement (cached or freshly located)
+        """
+        key = (by, value)
+        element = self._locator_cache.get(key)
+        if element is None:
+            element = self.find_element(by, value, timeout=timeout)
+            self._locator_cache[key] = element
+        return element
+
+    def clear_locator_cache(self) -> None:
+        """Drop all cached element references (see find_element_cached)."""
+        self._locator_cache.clear()
+
+    def find_elements_bulk(self, locators: List[Tuple[By, str]]) -> List[Optional[WebElement]]:
+        """
+        Resolve several locators with a single JavaScript round-trip.
+
+        No waiting is performed - each locator is evaluated once against the current DOM.
+
+        Args:
+            locators: List of (by, value) locator tuples
+
+        Returns:
+            List with the first matching WebElement (or None) for each locator, in order
+        """
+        self.logger.debug("Bulk finding %s elements", len(locators))
+        return self.driver.execute_script(self._BULK_LOCATE_JS, [list(loc) for loc in locators], False)
+
+    def bulk_exists(self, locators: List[Tuple[By, str]]) -> List[bool]:
+        """
+        Check presence of several locators with a single JavaScript round-trip.
+
+        Args:
+            locators: List of (by, value) locator tuples
+
+        Returns:
+            List of booleans, True where the locator matched an element
+        """
+        self.logger.debug("Bulk checking existence of %s elements", len(locators))
+        return self.driver.execute_script(self._BULK_LOCATE_JS, [list(loc) for loc in locators], True)
+
+    def exists_now(self, by: By, value: str) -> bool:
+        """
+        Check if element exists right now, without waiting.
+
+        Runs as a single script call, so the driver's implicit wait does not apply.
+
+        Args:
+            by: Locator strategy
+            value: Locator value
+
+        Returns:
+            True if element exists, False otherwise
+        """
+        return self.bulk_exists([(by, value)])[0]
+
     def element_exists(self, by: By, value: str, timeout: int = 5) -> bool:
         """
         Check if element exists without raising exception.
@@ -169,11 +463,14 @@ class WebInterface:
         Args:
             by: Locator strategy
             value: Locator value
-            timeout: Timeout in seconds (default: 5)
+            timeout: Timeout in seconds (default: 5, 0 for a single immediate probe)
 
         Returns:
             True if element exists, False otherwise
         """
+        if timeout <= 0:
+            return self.exists_now(by, value)
+
         try:
             self.find_element(by, value, timeout=timeout)
             return True
@@ -182,6 +479,48 @@ class WebInterface:
 
     # ==================== INTERACTION METHODS ====================
 
+    def _await_interactable(self, by: By, value: str, timeout: int) -> WebElement:
+        """
+        Wait once for an element to be visible and enabled, ready for an action.
+
+        Args:
+            by: Locator strategy
+            value: Locator value
+            timeout: Timeout in seconds
+
+        Returns:
+            WebElement ready for interaction
+
+        Raises:
+            TimeoutException: If element not interactable within timeout
+        """
+        return self._wait(timeout).until(EC.element_to_be_clickable((by, value)))
+
+    def wait_clickable(self, by: By, value: str, timeout: Optional[int] = None) -> WebElement:
+        """
+        Wait for element to be clickable (visible and enabled).
+
+        Args:
+            by: Locator strategy
+            value: Locator value
+            timeout: Optional custom timeout
+
+        Returns:
+            WebElement ready for interaction
+
+        Raises:
+            TimeoutException: If element not clickable within timeout
+        """
+        timeout = self.explicit_wait if timeout is None else timeout
+        self.logger.debug("Waiting for element to be clickable: %s='%s'", by, value)
+
+        try:
+            return self._await_interactable(by, value, timeout)
+        except TimeoutException:
+            self.logger.error(f"Element not clickable: {by}='{value}' after {timeout}s")
+            self._take_screenshot("element_not_clickable")
+            raise
+
     def click(self, by: By, value: str, timeout: Optional[int] = None) -> None:
         """
         Click an element after waiting for it to be clickable.
@@ -191,12 +530,11 @@ class WebInterface:
             value: Locator value
             timeout: Optional custom timeout
         """
-        timeout = timeout or self.explicit_wait
+        timeout = self.explicit_wait if timeout is None else timeout
         self.logger.info(f"Clicking element: {by}='{value}'")
 
         try:
-            wait = WebDriverWait(self.driver, timeout)
-            element = wait.until(EC.element_to_be_clickable((by, value)))
+            element = self._await_interactable(by, value, timeout)
             element.click()
             self.logger.info(f"Clicked element: {by}='{value}'")
         except Exception as e:
@@ -215,11 +553,11 @@ class WebInterface:
             clear_first: Clear field before typing (default: True)
             timeout: Optional custom timeout
         """
-        timeout = timeout or self.explicit_wait
+        timeout = self.explicit_wait if timeout is None else timeout
         self.logger.info(f"Typing text into element: {by}='{value}'")
 
         try:
-            element = self.find_element(by, value, timeout=timeout)
+            element = self._await_interactable(by, value, timeout)
             if clear_first:
                 element.clear()
             element.send_keys(text)
@@ -229,6 +567,41 @@ class WebInterface:
             self._take_screenshot("type_failure")
             raise
 
+    def type_texts(self, fields: List[Tuple[Tuple[By, str], str]], clear_first: bool = True,
+                   timeout: Optional[int] = None) -> None:
+        """
+        Type text into several input fields, locating them together.
+
+        Waits for the first field to be interactable, then resolves the remaining
+        fields with one bulk lookup; any field not found that way is waited for individually.
+
+        Args:
+            fields: List of ((by, value), text) pairs, in typing order
+            clear_first: Clear each field before typing (default: True)
+            timeout: Optional custom timeout
+        """
+        if not fields:
+            return
+        timeout = self.explicit_wait if timeout is None else timeout
+        locators = [locator for locator, _ in fields]
+        self.logger.info("Typing text into %s elements", len(fields))
+
+        try:
+            elements = [self._await_interactable(*locators[0], timeout)]
+            if len(locators) > 1:
+                elements += self.find_elements_bulk(locators[1:])
+            for (locator, text), element in zip(fields, elements):
+                if element is None:
+                    element = self._await_interactable(*locator, timeout)
+                if clear_first:
+                    element.clear()
+                element.send_keys(text)
+            self.logger.info("Typed text into %s elements", len(fields))
+        except Exception as e:
+            self.logger.error(f"Failed to type text into {locators}: {str(e)}")
+            self._take_screenshot("type_failure")
+            raise
+
     def select_dropdown_by_visible_text(self, by: By, value: str, text: str, timeout: Optional[int] = None) -> None:
         """
         Select dropdown option by visible text.
@@ -239,10 +612,11 @@ class WebInterface:
             text: Visible text of option to select
             timeout: Optional custom timeout
         """
-        timeout = timeout or self.explicit_wait
+        timeout = self.explicit_wait if timeout is None else timeout
         self.logger.info(f"Selecting dropdown option '{text}' from: {by}='{value}'")
 
         try:
+            # Presence only: styled dropdowns keep the native <select> transparent
             element = self.find_element(by, value, timeout=timeout)
             select = Select(element)
             select.select_by_visible_text(text)
@@ -262,10 +636,11 @@ class WebInterface:
             option_value: Value attribute of option to select
             timeout: Optional custom timeout
         """
-        timeout = timeout or self.explicit_wait
+        timeout = self.explicit_wait if timeout is None else timeout
         self.logger.info(f"Selecting dropdown option by value '{option_value}' from: {by}='{value}'")
 
         try:
+            # Presence only: styled dropdowns keep the native <select> transparent
             element = self.find_element(by, value, timeout=timeout)
             select = Select(element)
             select.select_by_value(option_value)
@@ -275,6 +650,30 @@ class WebInterface:
             self._take_screenshot("dropdown_select_failure")
             raise
 
+    def _locate_and_read(self, by: By, value: str, attributes: List[str], timeout: int) -> Tuple[str, List[Optional[str]]]:
+        """
+        Locate an element and read its text and attributes in a single script call.
+
+        Polls until the element is present, so the common case costs one round-trip.
+
+        Args:
+            by: Locator strategy
+            value: Locator value
+            attributes: Attribute names to read
+            timeout: Timeout in seconds
+
+        Returns:
+            Tuple of (element text, list of attribute values)
+
+        Raises:
+            TimeoutException: If element not found within timeout
+        """
+        text, attr_values = self._wait(timeout).until(
+            lambda driver: driver.execute_script(self._LOCATE_AND_READ_JS, by, value, attributes),
+            message=f"Element not found: {by}='{value}' after {timeout}s"
+        )
+        return (text or "").strip(), attr_values
+
     def get_text(self, by: By, value: str, timeout: Optional[int] = None) -> str:
         """
         Get text content of an element.
@@ -287,13 +686,12 @@ class WebInterface:
         Returns:
             Element text content
         """
-        timeout = timeout or self.explicit_wait
-        self.logger.debug(f"Getting text from element: {by}='{value}'")
+        timeout = self.explicit_wait if timeout is None else timeout
+        self.logger.debug("Getting text from element: %s='%s'", by, value)
 
         try:
-            element = self.find_element(by, value, timeout=timeout)
-            text = element.text
-            self.logger.debug(f"Retrieved text: '{text}' from {by}='{value}'")
+            text, _ = self._locate_and_read(by, value, [], timeout)
+            self.logger.debug("Retrieved text: '%s' from %s='%s'", text, by, value)
             return text
         except Exception as e:
             self.logger.error(f"Failed to get text from {by}='{value}': {str(e)}")
@@ -313,19 +711,42 @@ class WebInterface:
         Returns:
             Attribute value or None
         """
-        timeout = timeout or self.explicit_wait
-        self.logger.debug(f"Getting attribute '{attribute}' from element: {by}='{value}'")
+        timeout = self.explicit_wait if timeout is None else timeout
+        self.logger.debug("Getting attribute '%s' from element: %s='%s'", attribute, by, value)
 
         try:
-            element = self.find_element(by, value, timeout=timeout)
-            attr_value = element.get_attribute(attribute)
-            self.logger.debug(f"Retrieved attribute '{attribute}': '{attr_value}' from {by}='{value}'")
+            _, (attr_value,) = self._locate_and_read(by, value, [attribute], timeout)
+            self.logger.debug("Retrieved attribute '%s': '%s' from %s='%s'", attribute, attr_value, by, value)
             return attr_value
         except Exception as e:
             self.logger.error(f"Failed to get attribute from {by}='{value}': {str(e)}")
             self._take_screenshot("get_attribute_failure")
             raise
 
+    def get_many(self, by: By, value: str, attributes: List[str], timeout: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Get text and several attributes of an element in one browser round-trip.
+
+        Args:
+            by: Locator strategy
+            value: Locator value
+            attributes: Attribute names to read
+            timeout: Optional custom timeout
+
+        Returns:
+            Dict with 'text' (element text) and 'attributes' (attribute name -> value or None)
+        """
+        timeout = self.explicit_wait if timeout is None else timeout
+        self.logger.debug("Getting text and attributes %s from element: %s='%s'", attributes, by, value)
+
+        try:
+            text, attr_values = self._locate_and_read(by, value, list(attributes), timeout)
+            return {'text': text, 'attributes': dict(zip(attributes, attr_values))}
+        except Exception as e:
+            self.logger.error(f"Failed to read element {by}='{value}': {str(e)}")
+            self._take_screenshot("get_many_failure")
+            raise
+
     def is_element_displayed(self, by: By, value: str, timeout: Optional[int] = None) -> bool:
         """
         Check if element is displayed on page.
@@ -339,7 +760,7 @@ class WebInterface:
             True if element is displayed, False otherwise
         """
         try:
-            element = self.find_element(by, value, timeout=timeout or 5)
+            element = self.find_element(by, value, timeout=5 if timeout is None else timeout)
             return element.is_displayed()
         except (TimeoutException, NoSuchElementException):
             return False
@@ -352,14 +773,31 @@ class WebInterface:
             element: WebElement to hover over
         """
         self.logger.debug("Hovering over element")
+        actions = self.actions()
         try:
-            actions = ActionChains(self.driver)
             actions.move_to_element(element).perform()
             self.logger.debug("Hovered over element successfully")
         except Exception as e:
             self.logger.error(f"Failed to hover over element: {str(e)}")
             self._take_screenshot("hover_failure")
             raise
+        finally:
+            actions.reset_actions()
+
+    def actions(self) -> ActionChains:
+        """
+        Get the shared ActionChains instance for this driver.
+
+        Chain several steps and send them as one W3C Actions request, e.g.
+        web.actions().move_to_element(menu).click(item).perform().
+        Call reset_actions() after perform() so queued steps are not replayed.
+
+        Returns:
+            Cached ActionChains instance
+        """
+        if self._actions is None:
+            self._actions = ActionChains(self.driver)
+        return self._actions
 
     def is_element_clickable(self, by: By, value: str, timeout: Optional[int] = None) -> bool:
         """
@@ -373,9 +811,9 @@ class WebInterface:
         Returns:
             True if element is clickable, False otherwise
         """
-        timeout = timeout or self.explicit_wait
+        timeout = self.explicit_wait if timeout is None else timeout
         try:
-            wait = WebDriverWait(self.driver, timeout)
+            wait = self._wait(timeout)
             wait.until(EC.element_to_be_clickable((by, value)))
             return True
         except (TimeoutException, NoSuchElementException):
@@ -398,13 +836,13 @@ class WebInterface:
         Raises:
             TimeoutException: If element not visible within timeout
         """
-        timeout = timeout or self.explicit_wait
-        self.logger.debug(f"Waiting for element to be visible: {by}='{value}'")
+        timeout = self.explicit_wait if timeout is None else timeout
+        self.logger.debug("Waiting for element to be visible: %s='%s'", by, value)
 
         try:
-            wait = WebDriverWait(self.driver, timeout)
+            wait = self._wait(timeout)
             element = wait.until(EC.visibility_of_element_located((by, value)))
-            self.logger.debug(f"Element is visible: {by}='{value}'")
+            self.logger.debug("Element is visible: %s='%s'", by, value)
             return element
         except TimeoutException:
             self.logger.error(f"Element not visible: {by}='{value}' after {timeout}s")
@@ -426,13 +864,13 @@ class WebInterface:
         Raises:
             TimeoutException: If element still visible after timeout
         """
-        timeout = timeout or self.explicit_wait
-        self.logger.debug(f"Waiting for element to be invisible: {by}='{value}'")
+        timeout = self.explicit_wait if timeout is None else timeout
+        self.logger.debug("Waiting for element to be invisible: %s='%s'", by, value)
 
         try:
-            wait = WebDriverWait(self.driver, timeout)
+            wait = self._wait(timeout)
             wait.until(EC.invisibility_of_element_located((by, value)))
-            self.logger.debug(f"Element is invisible: {by}='{value}'")
+            self.logger.debug("Element is invisible: %s='%s'", by, value)
             return True
         except TimeoutException:
             self.logger.error(f"Element still visible: {by}='{value}' after {timeout}s")
@@ -455,13 +893,13 @@ class WebInterface:
         Raises:
             TimeoutException: If text not present after timeout
         """
-        timeout = timeout or self.explicit_wait
-        self.logger.debug(f"Waiting for text '{text}' in element: {by}='{value}'")
+        timeout = self.explicit_wait if timeout is None else timeout
+        self.logger.debug("Waiting for text '%s' in element: %s='%s'", text, by, value)
 
         try:
-            wait = WebDriverWait(self.driver, timeout)
+            wait = self._wait(timeout)
             wait.until(EC.text_to_be_present_in_element((by, value), text))
-            self.logger.debug(f"Text '{text}' present in element: {by}='{value}'")
+            self.logger.debug("Text '%s' present in element: %s='%s'", text, by, value)
             return True
         except TimeoutException:
             self.logger.error(f"Text '{text}' not present in element: {by}='{value}' after {timeout}s")
@@ -482,21 +920,170 @@ class WebInterface:
         Raises:
             TimeoutException: If URL doesn't contain fragment after timeout
         """
-        timeout = timeout or self.explicit_wait
-        self.logger.debug(f"Waiting for URL to contain: '{url_fragment}'")
+        timeout = self.explicit_wait if timeout is None else timeout
+        self.logger.debug("Waiting for URL to contain: '%s'", url_fragment)
 
         try:
-            wait = WebDriverWait(self.driver, timeout)
+            wait = self._wait(timeout)
             wait.until(EC.url_contains(url_fragment))
-            self.logger.debug(f"URL contains: '{url_fragment}'")
+            self.logger.debug("URL contains: '%s'", url_fragment)
             return True
         except TimeoutException:
             self.logger.error(f"URL does not contain '{url_fragment}' after {timeout}s")
             self._take_screenshot("url_check_failure")
             raise
 
+    @staticmethod
+    def _is_navigation_error(error: WebDriverException) -> bool:
+        """
+        Tell whether a script error was caused by the page navigating away.
+
+        Only these are worth re-issuing a wait for; syntax and reference errors in
+        the script itself must surface instead of turning into a silent timeout.
+
+        Args:
+            error: Exception raised by execute_script/execute_async_script
+
+        Returns:
+            True for a stale element or a "document unloaded" JavaScript error
+        """
+        if isinstance(error, StaleElementReferenceException):
+            return True
+        return isinstance(error, JavascriptException) and "document unloaded" in (error.msg or "")
+
+    def wait_for_js(self, expression: str, timeout: Optional[int] = None) -> bool:
+        """
+        Wait for a JavaScript expression to become truthy, polling inside the browser.
+
+        The 50ms polling runs in the page, so the whole wait is one async script call
+        instead of a WebDriver round-trip per poll. If the page unloads mid-wait the
+        script is re-issued until the timeout expires.
+
+        Args:
+            expression: JavaScript expression evaluated in the page
+            timeout: Optional custom timeout (must not exceed the driver script timeout)
+
+        Returns:
+            True if the expression became truthy, False on timeout
+
+        Raises:
+            JavascriptException: If the expression itself fails to evaluate
+        """
+        return bool(self.wait_for_js_value(expression, timeout))
+
+    def wait_for_js_value(self, expression: str, timeout: Optional[int] = None) -> Any:
+        """
+        Wait for a JavaScript expression to become truthy and return its value.
+
+        Same in-browser polling as wait_for_js; use it when the expression reports
+        which of several conditions fired (e.g. cond_a && 'a' || cond_b && 'b').
+
+        Args:
+            expression: JavaScript expression evaluated in the page
+            timeout: Optional custom timeout (must not exceed the driver script timeout)
+
+        Returns:
+            The expression's first truthy value, or None on timeout
+
+        Raises:
+            JavascriptException: If the expression itself fails to evaluate
+        """
+        timeout = self.explicit_wait if timeout is None else timeout
+        self.logger.debug("Waiting for JS condition: %.100s", expression)
+        script = self._WAIT_FOR_JS % expression
+        deadline = time.monotonic() + timeout
+
+        while True:
+            remaining_ms = int((deadline - time.monotonic()) * 1000)
+            if remaining_ms <= 0:
+                return None
+            try:
+                return self.driver.execute_async_script(script, remaining_ms)
+            except (JavascriptException, StaleElementReferenceException) as e:
+                if not self._is_navigation_error(e):
+                    raise
+                # Document unloaded while waiting - navigation in progress, re-issue
+                time.sleep(self.poll_frequency)
+
+    def wait_for_staleness(self, element: WebElement, timeout: Optional[int] = None) -> bool:
+        """
+        Wait for an element to be detached from the DOM (e.g. replaced by an AJAX reload).
+
+        Args:
+            element: Previously located WebElement
+            timeout: Optional custom timeout
+
+        Returns:
+            True once the element is stale
+
+        Raises:
+            TimeoutException: If element still attached after timeout
+        """
+        timeout = self.explicit_wait if timeout is None else timeout
+        self.logger.debug("Waiting for element to go stale")
+        self._wait(timeout).until(EC.staleness_of(element))
+        return True
+
+    def wait_for_visibility_of(self, element: WebElement, timeout: Optional[int] = None) -> WebElement:
+        """
+        Wait for an already-located element to become visible.
+
+        Args:
+            element: WebElement to watch
+            timeout: Optional custom timeout
+
+        Returns:
+            The element once visible
+
+        Raises:
+            TimeoutException: If element not visible within timeout
+        """
+        timeout = self.explicit_wait if timeout is None else timeout
+        self.logger.debug("Waiting for located element to be visible")
+        return self._wait(timeout).until(EC.visibility_of(element))
+
+    def wait_for_ajax_complete(self, timeout: Optional[int] = None) -> bool:
+        """
+        Wait for jQuery to report no active AJAX requests.
+
+        Pages without jQuery are treated as idle.
+
+        Args:
+            timeout: Optional custom timeout
+
+        Returns:
+            True once no AJAX requests are active
+
+        Raises:
+            TimeoutException: If AJAX requests still active after timeout
+        """
+        timeout = self.explicit_wait if timeout is None else timeout
+        self.logger.debug("Waiting for AJAX requests to complete")
+
+        try:
+            self._wait(timeout).until(
+                lambda driver: driver.execute_script("return !window.jQuery || jQuery.active === 0;")
+            )
+            return True
+        except TimeoutException:
+            self.logger.error(f"AJAX requests still active after {timeout}s")
+            self._take_screenshot("ajax_wait_failure")
+            raise
+
     # ==================== SCREENSHOT METHODS ====================
 
+    def _screenshot_path(self, name: str) -> str:
+        """
+        Build a timestamped screenshot path (directory is created once in __init__).
+
+        Args:
+            name: Base name for screenshot file
+
+        Returns:
+            Screenshot file path
+        """
+        return f"{self._screenshot_prefix}{name}_{time.strftime('%Y%m%d_%H%M%S')}.png"
+
     def take_screenshot(self, name: str) -> str:
         """
         Take a screenshot and save with timestamp.
@@ -507,31 +1094,51 @@ class WebInterface:
         Returns:
             Path to saved screenshot
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{name}_{timestamp}.png"
-        filepath = os.path.join(self.screenshot_dir, filename)
+        filepath = self._screenshot_path(name)
 
         try:
-            self.driver.save_screenshot(filepath)
+            # Raw PNG bytes avoid save_screenshot's base64 round-trip
+            _write_png(filepath, self.driver.get_screenshot_as_png())
             self.logger.info(f"Screenshot saved: {filepath}")
             return filepath
         except Exception as e:
             self.logger.error(f"Failed to save screenshot: {str(e)}")
             raise
 
+    @classmethod
+    def _get_screenshot_pool(cls) -> ThreadPoolExecutor:
+        """
+        Get the shared screenshot writer pool, creating it on first use.
+
+        Returns:
+            ThreadPoolExecutor that writes screenshots to disk
+        """
+        if cls._screenshot_pool is None:
+            cls._screenshot_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="screenshot")
+            # Flush pending writes before the interpreter exits
+            atexit.register(cls._screenshot_pool.shutdown, wait=True)
+        return cls._screenshot_pool
+
     def _take_screenshot(self, name: str) -> Optional[str]:
         """
         Internal method to take screenshot on failure (if enabled).
 
+        The PNG is captured synchronously (one WebDriver call) and written to disk
+        in the background, so the failing operation can re-raise immediately.
+
         Args:
             name: Base name for screenshot file
 
         Returns:
-            Path to saved screenshot or None if disabled
+            Path the screenshot is being written to, or None if disabled/failed
         """
         if self.screenshots_on_failure:
             try:
-                return self.take_screenshot(name)
+                filepath = self._screenshot_path(name)
+                png = self.driver.get_screenshot_as_png()
+                self._get_screenshot_pool().submit(_write_png, filepath, png)
+                self.logger.info(f"Screenshot queued: {filepath}")
+                return filepath
             except Exception:
                 # Don't fail the test if screenshot fails
                 return None
@@ -550,7 +1157,7 @@ class WebInterface:
         Returns:
             Script execution result
         """
-        self.logger.debug(f"Executing JavaScript: {script[:100]}...")
+        self.logger.debug("Executing JavaScript: %.100s...", script)
         try:
             result = self.driver.execute_script(script, *args)
             self.logger.debug("JavaScript executed successfully")
@@ -568,19 +1175,29 @@ class WebInterface:
             value: Locator value
             timeout: Optional custom timeout
         """
-        self.logger.debug(f"Scrolling to element: {by}='{value}'")
-        element = self.find_element(by, value, timeout=timeout)
-        self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-        self.logger.debug(f"Scrolled to element: {by}='{value}'")
+        timeout = self.explicit_wait if timeout is None else timeout
+        self.logger.debug("Scrolling to element: %s='%s'", by, value)
+
+        try:
+            # Locate and scroll inside the browser: one round-trip per poll
+            self._wait(timeout).until(
+                lambda driver: driver.execute_script(self._LOCATE_AND_SCROLL_JS, by, value),
+                message=f"Element not found: {by}='{value}' after {timeout}s"
+            )
+            self.logger.debug("Scrolled to element: %s='%s'", by, value)
+        except TimeoutException:
+            self.logger.error(f"Element not found for scroll: {by}='{value}' after {timeout}s")
+            self._take_screenshot("element_not_found")
+            raise
 
     def scroll_to_bottom(self) -> None:
         """Scroll to bottom of page."""
-        self.logger.debug("Scrolling to bottom of page")
+        _trace(self.logger, "Scrolling to bottom of page")
         self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
 
     def scroll_to_top(self) -> None:
         """Scroll to top of page."""
-        self.logger.debug("Scrolling to top of page")
+        _trace(self.logger, "Scrolling to top of page")
         self.driver.execute_script("window.scrollTo(0, 0);")
 
     # ==================== WINDOW AND FRAME HANDLING ====================
@@ -595,11 +1212,12 @@ class WebInterface:
             timeout: Optional custom timeout
         """
         self.logger.info(f"Switching to frame: {by}='{value}'")
-        timeout = timeout or self.explicit_wait
+        timeout = self.explicit_wait if timeout is None else timeout
 
         try:
-            wait = WebDriverWait(self.driver, timeout)
+            wait = self._wait(timeout)
             wait.until(EC.frame_to_be_available_and_switch_to_it((by, value)))
+            self._locator_cache.clear()
             self.logger.info(f"Switched to frame: {by}='{value}'")
         except Exception as e:
             self.logger.error(f"Failed to switch to frame: {str(e)}")
@@ -608,7 +1226,8 @@ class WebInterface:
 
     def switch_to_default_content(self) -> None:
         """Switch back to main page content from frame."""
-        self.logger.info("Switching to default content")
+        _trace(self.logger, "Switching to default content")
+        self._locator_cache.clear()
         self.driver.switch_to.default_content()
 
     def switch_to_window(self, window_handle: str) -> None:
@@ -619,6 +1238,7 @@ class WebInterface:
             window_handle: Window handle string
         """
         self.logger.info(f"Switching to window: {window_handle}")
+        self._locator_cache.clear()
         self.driver.switch_to.window(window_handle)
 
     def get_window_handles(self) -> List[str]:
@@ -629,7 +1249,7 @@ class WebInterface:
             List of window handle strings
         """
         handles = self.driver.window_handles
-        self.logger.debug(f"Window handles: {handles}")
+        _trace(self.logger, "Window handles: %s", handles)
         return handles
 
     def switch_to_new_window(self) -> str:
@@ -647,7 +1267,8 @@ class WebInterface:
 
     def close_current_window(self) -> None:
         """Close the current window."""
-        self.logger.info("Closing current window")
+        _trace(self.logger, "Closing current window")
+        self._locator_cache.clear()
         self.driver.close()
 
     # ==================== UTILITY METHODS ====================
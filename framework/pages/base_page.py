@@ -8,6 +8,42 @@ from selenium.webdriver.common.by import By
 from interfaces.web_interface import WebInterface
 
 
+class CachedElement:
+    """
+    Page attribute that resolves a locator to a WebElement on access.
+
+    The element is looked up once per document through
+    WebInterface.find_element_cached and reused on later accesses, so
+    repeated reads of the same node skip the findElement round-trip.
+    Locator tuple constants stay the source of truth:
+
+        NEWSLETTER = (By.ID, "newsletter")
+        newsletter_checkbox = CachedElement(NEWSLETTER)
+
+    Only use it for elements whose state is read directly off the WebElement.
+    Elements that are clicked or typed into (login/registration submit buttons,
+    email/password fields) stay plain locators: self.web.click/type_text wait for
+    them to become clickable or visible, and a cached reference would skip that
+    wait. Fields filled by one script (e.g. the date of birth dropdowns via
+    RegistrationPage._FILL_FORM_JS) or read with get_many already cost a single
+    round-trip, so caching the element would only add a lookup.
+    """
+
+    def __init__(self, locator: tuple):
+        """
+        Initialize CachedElement.
+
+        Args:
+            locator: (By, value) locator tuple
+        """
+        self.locator = locator
+
+    def __get__(self, page, owner):
+        if page is None:
+            return self
+        return page.web.find_element_cached(*self.locator)
+
+
 class BasePage:
     """
     Base Page Object that all page objects inherit from.
@@ -16,6 +52,19 @@ class BasePage:
     - Common header navigation elements (sign in, logout, my account)
     - Common footer elements (if needed)
     - Shared utility methods
+
+    Page objects may be instantiated concurrently (one WebInterface per test),
+    so any per-page state such as element caches must live on the instance,
+    never on the class. Class attributes are reserved for immutable locators.
+
+    Locators for elements nested inside a container should be resolved with
+    self.web.find_scoped(CONTAINER, CHILD), which merges same-strategy
+    locators into a single lookup instead of finding the parent first.
+
+    Predicates (is_*/has_*) must answer a negative without an exception-driven
+    wait: check presence with self.web.exists_now / bulk_exists or a script, and
+    only wait when given a timeout. Tasks pass timeout=0 once their own wait
+    has already covered the element's appearance.
     """
 
     def __init__(self, web: WebInterface):
@@ -47,6 +96,38 @@ class BasePage:
     # Contact
     CONTACT_US_LINK = (By.CSS_SELECTOR, "[title='Contact Us']")
 
+    # Error alert shown by form pages
+    ERROR_MESSAGE = (By.CSS_SELECTOR, ".alert-danger")
+
+    # Returns the first visible error's text (list items joined) or null.
+    # The registration error container is always in the DOM but hidden until an error occurs.
+    _ERROR_TEXT_JS = """
+        var containers = document.querySelectorAll(arguments[0]);
+        for (var i = 0; i < containers.length; i++) {
+            var c = containers[i];
+            if (!c.getClientRects().length) continue;
+            var items = c.querySelectorAll('ol li');
+            if (!items.length) return c.textContent.trim();
+            return Array.prototype.map.call(items, function(item) {
+                return item.textContent.trim();
+            }).join('; ');
+        }
+        return null;
+    """
+
+    # Header auth-state table: state name -> locator, resolved together by get_header_state()
+    HEADER_STATE_LOCATORS = {
+        'signed_in': LOGOUT_LINK,
+        'signed_out': SIGN_IN_LINK,
+        'my_account': MY_ACCOUNT_LINK,
+    }
+
+    # Names the header auth state once either link is parsed: 'signed_in' (logout link)
+    # or 'signed_out' (sign in link); falsy while the header is still loading
+    _HEADER_STATE_EXPR = "(document.querySelector('%s') && 'signed_in') || (document.querySelector('%s') && 'signed_out')" % (
+        LOGOUT_LINK[1], SIGN_IN_LINK[1]
+    )
+
     # ==================== HEADER NAVIGATION METHODS ====================
 
     def click_sign_in(self) -> None:
@@ -100,32 +181,70 @@ class BasePage:
 
     # ==================== HEADER STATE VERIFICATION ====================
 
-    def is_signed_in(self) -> bool:
+    def _wait_for_auth_state(self, timeout: int):
+        """
+        Read the header auth state, waiting (bounded) for the header to be parsed.
+
+        One of the two auth links is always rendered, so this returns as soon as
+        the header exists - a negative answer does not sit out the timeout. The
+        wait covers eager page loads, where the header may not be parsed yet.
+
+        Args:
+            timeout: Maximum time to wait in seconds (0 checks once without waiting)
+
+        Returns:
+            'signed_in', 'signed_out', or None if the header did not appear
+        """
+        if timeout <= 0:
+            return self.web.execute_script("return " + self._HEADER_STATE_EXPR)
+        return self.web.wait_for_js_value(self._HEADER_STATE_EXPR, timeout=timeout)
+
+    def is_signed_in(self, timeout: int = 3) -> bool:
         """
         Check if user is signed in.
 
+        Args:
+            timeout: Maximum time to wait for the header in seconds
+
         Returns:
             True if logout link is visible (user is logged in)
         """
-        return self.web.element_exists(*self.LOGOUT_LINK, timeout=3)
+        return self._wait_for_auth_state(timeout) == 'signed_in'
 
-    def is_signed_out(self) -> bool:
+    def is_signed_out(self, timeout: int = 3) -> bool:
         """
         Check if user is signed out.
 
+        Args:
+            timeout: Maximum time to wait for the header in seconds
+
         Returns:
             True if sign in link is visible (user is logged out)
         """
-        return self.web.element_exists(*self.SIGN_IN_LINK, timeout=3)
+        return self._wait_for_auth_state(timeout) == 'signed_out'
 
-    def is_my_account_visible(self) -> bool:
+    def is_my_account_visible(self, timeout: int = 3) -> bool:
         """
         Check if My Account link is visible.
 
+        Args:
+            timeout: Maximum time to wait for the header in seconds
+
         Returns:
             True if my account link is present
         """
-        return self.web.element_exists(*self.MY_ACCOUNT_LINK, timeout=3)
+        self._wait_for_auth_state(timeout)
+        return self.web.exists_now(*self.MY_ACCOUNT_LINK)
+
+    def get_header_state(self) -> dict:
+        """
+        Check all header authentication links in a single browser round-trip.
+
+        Returns:
+            Dict with keys 'signed_in', 'signed_out', 'my_account' mapped to presence booleans
+        """
+        present = self.web.bulk_exists(list(self.HEADER_STATE_LOCATORS.values()))
+        return dict(zip(self.HEADER_STATE_LOCATORS, present))
 
     def wait_for_sign_in_link_visible(self, timeout: int = 10) -> None:
         """
@@ -139,6 +258,32 @@ class BasePage:
         """
         self.web.wait_for_element_visible(*self.SIGN_IN_LINK, timeout=timeout)
 
+    # ==================== ERROR MESSAGE HELPERS ====================
+
+    def _fetch_error(self):
+        """
+        Read the visible error message in a single script call.
+
+        Returns:
+            Error text (list items joined with "; ") or None if no error is visible
+        """
+        return self.web.execute_script(self._ERROR_TEXT_JS, self.ERROR_MESSAGE[1])
+
+    def _wait_for_error(self, timeout: int = 5):
+        """
+        Get the error message, waiting for it to appear only if it is not already shown.
+
+        Args:
+            timeout: Maximum time to wait in seconds (0 checks once without waiting)
+
+        Returns:
+            Error text or None if no error appeared within timeout
+        """
+        error_text = self._fetch_error()
+        if error_text is None and timeout > 0 and self.web.is_element_displayed(*self.ERROR_MESSAGE, timeout=timeout):
+            error_text = self._fetch_error()
+        return error_text
+
     # ==================== COMMON UTILITY METHODS ====================
 
     def get_page_url(self) -> str:
@@ -163,6 +308,15 @@ class BasePage:
         """Refresh the current page."""
         self.web.refresh_page()
 
+    def _invalidate(self) -> None:
+        """
+        Drop cached elements (see CachedElement).
+
+        Navigation through WebInterface does this automatically; call it after
+        clicks or scripts that replace the page content.
+        """
+        self.web.clear_locator_cache()
+
     def take_screenshot(self, name: str) -> str:
         """
         Take screenshot of current page.
@@ -5,11 +5,14 @@ This page represents product category pages and search results.
 Handles browsing, filtering, sorting, and quick view interactions.
 """
 
-import time
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
 from interfaces.web_interface import WebInterface
 
+# Strips currency symbol and thousands separators from price text
+_PRICE_TBL = str.maketrans("", "", "$,")
+
 
 class ProductListPage(BasePage):
     """
@@ -27,13 +30,18 @@ class ProductListPage(BasePage):
             web: WebInterface instance
         """
         super().__init__(web)
+        self._products = None
+        self._cached_prices = None
 
     # ==================== LOCATORS ====================
 
-    # Category navigation
-    WOMEN_CATEGORY = (By.LINK_TEXT, "WOMEN")
-    DRESSES_CATEGORY = (By.LINK_TEXT, "DRESSES")
-    TSHIRTS_CATEGORY = (By.LINK_TEXT, "T-SHIRTS")
+    # Category navigation (top-level menu entries; nested menu items share the same titles)
+    WOMEN_CATEGORY = (By.CSS_SELECTOR, ".sf-menu > li > a[title='Women']")
+    DRESSES_CATEGORY = (By.CSS_SELECTOR, ".sf-menu > li > a[title='Dresses']")
+    TSHIRTS_CATEGORY = (By.CSS_SELECTOR, ".sf-menu > li > a[title='T-shirts']")
+
+    # Subcategory tiles shown above the product grid
+    SUBCATEGORY_LINK_TEMPLATE = "#subcategories a[title=\"{name}\"]"
 
     # Product grid
     PRODUCT_CONTAINER = (By.CSS_SELECTOR, "ul.product_list")
@@ -61,12 +69,137 @@ class ProductListPage(BasePage):
     COLOR_BLUE = (By.CSS_SELECTOR, "input[name='layered_id_attribute_group_14']")
     COLOR_YELLOW = (By.CSS_SELECTOR, "input[name='layered_id_attribute_group_16']")
 
+    # Filter option name -> locator
+    _SIZE_MAP = {
+        "S": SIZE_S_CHECKBOX,
+        "M": SIZE_M_CHECKBOX,
+        "L": SIZE_L_CHECKBOX
+    }
+    _COLOR_MAP = {
+        "BEIGE": COLOR_BEIGE,
+        "WHITE": COLOR_WHITE,
+        "BLACK": COLOR_BLACK,
+        "ORANGE": COLOR_ORANGE,
+        "BLUE": COLOR_BLUE,
+        "YELLOW": COLOR_YELLOW
+    }
+
     # Results
     RESULTS_COUNT = (By.CSS_SELECTOR, ".product-count")
     BREADCRUMB = (By.CSS_SELECTOR, ".breadcrumb")
 
+    # Reads name and price text of every product in one script call
+    _PRODUCTS_DATA_JS = """
+        var nameSelector = arguments[1], priceSelector = arguments[2];
+        var items = document.querySelectorAll(arguments[0]);
+        return Array.prototype.map.call(items, function(item) {
+            var name = item.querySelector(nameSelector);
+            var price = item.querySelector(priceSelector);
+            return {
+                name: name ? name.textContent.trim() : '',
+                price: price ? price.textContent.trim() : ''
+            };
+        });
+    """
+
+    # Truthy once the product grid is rendered and visible (polled in-browser by wait_for_js)
+    _GRID_VISIBLE_JS = (
+        "(function (el) { return !!el && el.getClientRects().length > 0; })"
+        "(document.querySelector('%s'))" % PRODUCT_CONTAINER[1]
+    )
+
+    # Returns grid visibility and product count in one script call
+    _PAGE_STATE_JS = """
+        var container = document.querySelector(arguments[0]);
+        return {
+            loaded: !!container && container.getClientRects().length > 0,
+            product_count: document.querySelectorAll(arguments[1]).length
+        };
+    """
+
+    # Scrolls to and clicks an element by id in one script call
+    _SCROLL_AND_CLICK_BY_ID_JS = """
+        var el = document.getElementById(arguments[0]);
+        el.scrollIntoView(true);
+        el.click();
+    """
+
     # ==================== PAGE METHODS ====================
 
+    def _wait_for_product_reload(self, old_container) -> None:
+        """
+        Wait for the product grid to be re-rendered after a sort/filter action.
+
+        Args:
+            old_container: Product container element captured before the action
+        """
+        try:
+            self.web.wait_for_staleness(old_container, timeout=10)
+        except TimeoutException:
+            self.web.logger.warning("Product list was not replaced after sort/filter action")
+        self.web.wait_for_ajax_complete()
+        self.invalidate_products()
+
+    def _get_products(self) -> list:
+        """
+        Get product grid elements, looking them up once per grid render.
+
+        The cached elements go stale when the grid is re-rendered by AJAX,
+        so every action that reloads products must call invalidate_products().
+
+        Returns:
+            List of product WebElements
+        """
+        if self._products is None:
+            self._products = self.web.find_elements(*self.PRODUCT_ITEMS)
+        return self._products
+
+    def _product_locator(self, index: int) -> tuple:
+        """
+        Build a locator targeting one product directly with :nth-child.
+
+        Args:
+            index: Product index (0-based)
+
+        Returns:
+            (By, value) locator for the product
+        """
+        return (By.CSS_SELECTOR, f"{self.PRODUCT_ITEMS[1]}:nth-child({index + 1})")
+
+    def _product_at(self, index: int):
+        """
+        Get a single product element by index.
+
+        Uses the cached grid when it is already populated, otherwise waits for the
+        grid container and probes the product directly with :nth-child instead of
+        fetching the whole grid.
+
+        Args:
+            index: Product index (0-based)
+
+        Returns:
+            Product WebElement
+
+        Raises:
+            IndexError: If no product exists at index
+        """
+        if self._products is not None or index < 0:
+            products = self._get_products()
+            if index >= len(products):
+                raise IndexError(f"Product index {index} out of range")
+            return products[index]
+
+        self.web.find_elements(*self.PRODUCT_CONTAINER)
+        product = self.web.find_elements_bulk([self._product_locator(index)])[0]
+        if product is None:
+            raise IndexError(f"Product index {index} out of range")
+        return product
+
+    def invalidate_products(self) -> None:
+        """Drop cached product grid elements and prices so the next access re-reads them."""
+        self._products = None
+        self._cached_prices = None
+
     def is_page_loaded(self) -> bool:
         """
         Verify product list page is loaded.
@@ -76,6 +209,26 @@ class ProductListPage(BasePage):
         """
         return self.web.is_element_displayed(*self.PRODUCT_CONTAINER, timeout=10)
 
+    def snapshot_page_state(self, timeout: int = 10) -> dict:
+        """
+        Wait for the product grid, then read page state in a single script call.
+
+        Replaces the is_page_loaded() / has_products() / get_product_count()
+        sequence, which costs a round-trip per check.
+
+        Args:
+            timeout: Maximum time to wait for the grid in seconds
+
+        Returns:
+            Dict with 'loaded' (bool), 'product_count' (int) and 'has_products' (bool)
+        """
+        self.web.wait_for_js(self._GRID_VISIBLE_JS, timeout=timeout)
+        state = self.web.execute_script(
+            self._PAGE_STATE_JS, self.PRODUCT_CONTAINER[1], self.PRODUCT_ITEMS[1]
+        )
+        state["has_products"] = state["product_count"] > 0
+        return state
+
     # ==================== NAVIGATION METHODS ====================
 
     def click_women_category(self):
@@ -86,6 +239,7 @@ class ProductListPage(BasePage):
             self for method chaining
         """
         self.web.click(*self.WOMEN_CATEGORY)
+        self.invalidate_products()
         return self
 
     def click_dresses_category(self):
@@ -96,6 +250,7 @@ class ProductListPage(BasePage):
             self for method chaining
         """
         self.web.click(*self.DRESSES_CATEGORY)
+        self.invalidate_products()
         return self
 
     def click_tshirts_category(self):
@@ -106,6 +261,7 @@ class ProductListPage(BasePage):
             self for method chaining
         """
         self.web.click(*self.TSHIRTS_CATEGORY)
+        self.invalidate_products()
         return self
 
     def click_subcategory(self, subcategory_name: str):
@@ -118,8 +274,12 @@ class ProductListPage(BasePage):
         Returns:
             self for method chaining
         """
-        locator = (By.LINK_TEXT, subcategory_name)
+        locator = (By.CSS_SELECTOR, self.SUBCATEGORY_LINK_TEMPLATE.format(name=subcategory_name))
+        if not self.web.exists_now(*locator):
+            # Fall back to link text for subcategories without a title tile
+            locator = (By.LINK_TEXT, subcategory_name)
         self.web.click(*locator)
+        self.invalidate_products()
         return self
 
     # ==================== SORTING METHODS ====================
@@ -131,8 +291,9 @@ class ProductListPage(BasePage):
         Returns:
             self for method chaining
         """
+        old_container = self.web.find_element(*self.PRODUCT_CONTAINER)
         self.web.select_dropdown_by_value(*self.SORT_DROPDOWN, option_value="price:asc")
-        time.sleep(2)  # Wait for page to reload with sorted results
+        self._wait_for_product_reload(old_container)
         return self
 
     def sort_by_price_high_to_low(self):
@@ -142,8 +303,9 @@ class ProductListPage(BasePage):
         Returns:
             self for method chaining
         """
+        old_container = self.web.find_element(*self.PRODUCT_CONTAINER)
         self.web.select_dropdown_by_value(*self.SORT_DROPDOWN, option_value="price:desc")
-        time.sleep(2)  # Wait for page to reload with sorted results
+        self._wait_for_product_reload(old_container)
         return self
 
     def sort_by_name_a_to_z(self):
@@ -153,8 +315,9 @@ class ProductListPage(BasePage):
         Returns:
             self for method chaining
         """
+        old_container = self.web.find_element(*self.PRODUCT_CONTAINER)
         self.web.select_dropdown_by_value(*self.SORT_DROPDOWN, option_value="name:asc")
-        time.sleep(2)  # Wait for page to reload with sorted results
+        self._wait_for_product_reload(old_container)
         return self
 
     def sort_by_name_z_to_a(self):
@@ -164,8 +327,9 @@ class ProductListPage(BasePage):
         Returns:
             self for method chaining
         """
+        old_container = self.web.find_element(*self.PRODUCT_CONTAINER)
         self.web.select_dropdown_by_value(*self.SORT_DROPDOWN, option_value="name:desc")
-        time.sleep(2)  # Wait for page to reload with sorted results
+        self._wait_for_product_reload(old_container)
         return self
 
     # ==================== FILTERING METHODS ====================
@@ -180,34 +344,26 @@ class ProductListPage(BasePage):
         Returns:
             self for method chaining
         """
-        size_map = {
-            "S": self.SIZE_S_CHECKBOX,
-            "M": self.SIZE_M_CHECKBOX,
-            "L": self.SIZE_L_CHECKBOX
-        }
-
-        if size.upper() not in size_map:
+        checkbox_locator = self._SIZE_MAP.get(size.upper())
+        if checkbox_locator is None:
             raise ValueError(f"Invalid size: {size}. Must be S, M, or L")
 
         # Check if size checkbox is visible, if not expand the Size section
-        checkbox_locator = size_map[size.upper()]
         if not self.web.is_element_displayed(*checkbox_locator, timeout=2):
             # Click Size heading to expand the section
             self.web.click(*self.SIZE_HEADING)
-            time.sleep(2)  # Wait for section to expand
 
             # Wait for checkbox to become visible after expansion
-            for _ in range(5):  # Try for 5 seconds
-                if self.web.is_element_displayed(*checkbox_locator, timeout=1):
-                    break
-                time.sleep(1)
-
-        # Click the size checkbox using JavaScript (checkbox might be hidden by CSS)
-        checkbox_element = self.web.find_element(*checkbox_locator)
-        self.web.driver.execute_script("arguments[0].scrollIntoView(true);", checkbox_element)
-        time.sleep(0.5)
-        self.web.driver.execute_script("arguments[0].click();", checkbox_element)
-        time.sleep(2)  # Wait for filtered results (AJAX reload)
+            try:
+                self.web.wait_for_element_visible(*checkbox_locator, timeout=5)
+            except TimeoutException:
+                # Styled checkboxes can stay CSS-hidden; the JS click below still works
+                pass
+
+        # Scroll to and click the size checkbox in one script (checkbox might be hidden by CSS)
+        old_container = self.web.find_element(*self.PRODUCT_CONTAINER)
+        self.web.execute_script(self._SCROLL_AND_CLICK_BY_ID_JS, checkbox_locator[1])
+        self._wait_for_product_reload(old_container)
         return self
 
     def filter_by_color(self, color: str):
@@ -220,21 +376,13 @@ class ProductListPage(BasePage):
         Returns:
             self for method chaining
         """
-        color_map = {
-            "BEIGE": self.COLOR_BEIGE,
-            "WHITE": self.COLOR_WHITE,
-            "BLACK": self.COLOR_BLACK,
-            "ORANGE": self.COLOR_ORANGE,
-            "BLUE": self.COLOR_BLUE,
-            "YELLOW": self.COLOR_YELLOW
-        }
-
-        color_key = color.upper()
-        if color_key not in color_map:
+        color_locator = self._COLOR_MAP.get(color.upper())
+        if color_locator is None:
             raise ValueError(f"Invalid color: {color}")
 
-        self.web.click(*color_map[color_key])
-        time.sleep(2)  # Wait for filtered results
+        old_container = self.web.find_element(*self.PRODUCT_CONTAINER)
+        self.web.click(*color_locator)
+        self._wait_for_product_reload(old_container)
         return self
 
     # ==================== PRODUCT GRID METHODS ====================
@@ -246,9 +394,33 @@ class ProductListPage(BasePage):
         Returns:
             Count of products in the grid
         """
-        products = self.web.find_elements(*self.PRODUCT_ITEMS)
+        products = self._get_products()
         return len(products)
 
+    def get_products_data(self) -> list:
+        """
+        Get name and price of every product on the page in a single script call.
+
+        Returns:
+            List of dicts with 'name' (str) and 'price' (float, or None if unparseable)
+        """
+        raw = self.web.execute_script(
+            self._PRODUCTS_DATA_JS,
+            self.PRODUCT_ITEMS[1], self.PRODUCT_NAME[1], self.PRODUCT_PRICE[1]
+        )
+        products = []
+
+        for item in raw:
+            price_text = item["price"].translate(_PRICE_TBL).strip()
+            try:
+                price = float(price_text)
+            except ValueError:
+                self.web.logger.warning(f"Could not parse price: {price_text}")
+                price = None
+            products.append({"name": item["name"], "price": price})
+
+        return products
+
     def get_product_names(self) -> list:
         """
         Get all product names on the page.
@@ -256,14 +428,7 @@ class ProductListPage(BasePage):
         Returns:
             List of product names
         """
-        products = self.web.find_elements(*self.PRODUCT_ITEMS)
-        names = []
-
-        for product in products:
-            name_element = product.find_element(*self.PRODUCT_NAME)
-            names.append(name_element.text.strip())
-
-        return names
+        return [product["name"] for product in self.get_products_data()]
 
     def get_product_prices(self) -> list:
         """
@@ -272,18 +437,11 @@ class ProductListPage(BasePage):
         Returns:
             List of product prices as floats
         """
-        products = self.web.find_elements(*self.PRODUCT_ITEMS)
-        prices = []
-
-        for product in products:
-            price_element = product.find_element(*self.PRODUCT_PRICE)
-            price_text = price_element.text.strip().replace("$", "").replace(",", "")
-            try:
-                prices.append(float(price_text))
-            except ValueError:
-                self.web.logger.warning(f"Could not parse price: {price_text}")
-
-        return prices
+        if self._cached_prices is None:
+            self._cached_prices = [
+                product["price"] for product in self.get_products_data() if product["price"] is not None
+            ]
+        return list(self._cached_prices)
 
     def click_product_by_index(self, index: int):
         """
@@ -294,13 +452,18 @@ class ProductListPage(BasePage):
 
         Returns:
             self for method chaining
-        """
-        products = self.web.find_elements(*self.PRODUCT_ITEMS)
-        if index >= len(products):
-            raise IndexError(f"Product index {index} out of range")
 
-        product = products[index]
-        name_element = product.find_element(*self.PRODUCT_NAME)
+        Raises:
+            IndexError: If no product exists at index
+        """
+        if self._products is not None or index < 0:
+            name_element = self._product_at(index).find_element(*self.PRODUCT_NAME)
+        else:
+            # Product and name merge into one descendant selector: a single lookup
+            try:
+                name_element = self.web.find_scoped(self._product_locator(index), self.PRODUCT_NAME)
+            except TimeoutException:
+                raise IndexError(f"Product index {index} out of range")
         name_element.click()
         return self
 
@@ -316,11 +479,7 @@ class ProductListPage(BasePage):
         Returns:
             self for method chaining
         """
-        products = self.web.find_elements(*self.PRODUCT_ITEMS)
-        if index >= len(products):
-            raise IndexError(f"Product index {index} out of range")
-
-        product = products[index]
+        product = self._product_at(index)
         self.web.hover_over_element(product)
         return self
 
@@ -334,17 +493,13 @@ class ProductListPage(BasePage):
         Returns:
             self for method chaining
         """
-        products = self.web.find_elements(*self.PRODUCT_ITEMS)
-        if index >= len(products):
-            raise IndexError(f"Product index {index} out of range")
-
         # Hover to reveal Quick View button
-        product = products[index]
+        product = self._product_at(index)
         self.web.hover_over_element(product)
-        time.sleep(1)  # Brief wait for button to appear
 
-        # Click Quick View within this product
+        # Click Quick View within this product once hover reveals it
         quick_view_btn = product.find_element(*self.QUICK_VIEW_BUTTON)
+        self.web.wait_for_visibility_of(quick_view_btn, timeout=5)
         quick_view_btn.click()
         return self
 
@@ -367,7 +522,7 @@ class ProductListPage(BasePage):
             True if sorted correctly
         """
         prices = self.get_product_prices()
-        return prices == sorted(prices)
+        return all(a <= b for a, b in zip(prices, prices[1:]))
 
     def is_sorted_by_price_descending(self) -> bool:
         """
@@ -377,4 +532,4 @@ class ProductListPage(BasePage):
             True if sorted correctly
         """
         prices = self.get_product_prices()
-        return prices == sorted(prices, reverse=True)
+        return all(a >= b for a, b in zip(prices, prices[1:]))
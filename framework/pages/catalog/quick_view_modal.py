@@ -26,6 +26,7 @@ class QuickViewModal(BasePage):
             web: WebInterface instance
         """
         super().__init__(web)
+        self._qty_cache = None
 
     # ==================== LOCATORS ====================
 
@@ -59,16 +60,22 @@ class QuickViewModal(BasePage):
     AVAILABILITY_STATUS = (By.ID, "availability_value")
     IN_STOCK_LABEL = (By.ID, "availability_statut")
 
+    # Reads the quantity input value in one script call (empty input counts as 1)
+    _QUANTITY_JS = "var el = document.getElementById(arguments[0]); return el.value || '1';"
+
     # ==================== PAGE METHODS ====================
 
-    def is_modal_open(self) -> bool:
+    def is_modal_open(self, timeout: int = 10) -> bool:
         """
-        Check if quick view modal is open.
+        Check if quick view modal is open, waiting for it to appear.
+
+        Args:
+            timeout: Maximum time to wait in seconds
 
         Returns:
             True if modal container is visible
         """
-        return self.web.is_element_displayed(*self.MODAL_CONTAINER, timeout=10)
+        return self.web.is_element_displayed(*self.MODAL_CONTAINER, timeout=timeout)
 
     def switch_to_modal_iframe(self):
         """
@@ -80,6 +87,7 @@ class QuickViewModal(BasePage):
             self for method chaining
         """
         self.web.switch_to_frame(*self.MODAL_IFRAME)
+        self._qty_cache = None
         return self
 
     def switch_back_from_iframe(self):
@@ -104,8 +112,21 @@ class QuickViewModal(BasePage):
 
         # Click close button
         self.web.click(*self.CLOSE_BUTTON)
+        self._qty_cache = None
         return self
 
+    def wait_until_closed(self, timeout: int = 5) -> None:
+        """
+        Wait for the modal overlay to disappear.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Raises:
+            TimeoutException: If modal still visible after timeout
+        """
+        self.web.wait_for_element_invisible(*self.MODAL_CONTAINER, timeout=timeout)
+
     # ==================== PRODUCT DETAILS METHODS ====================
 
     def get_product_name(self) -> str:
@@ -182,6 +203,7 @@ class QuickViewModal(BasePage):
 
         # Clear and enter quantity
         self.web.type_text(*self.QUANTITY_INPUT, text=str(quantity), clear_first=True)
+        self._qty_cache = quantity
         return self
 
     def increase_quantity(self):
@@ -192,6 +214,8 @@ class QuickViewModal(BasePage):
             self for method chaining
         """
         self.web.click(*self.QUANTITY_UP)
+        if self._qty_cache is not None:
+            self._qty_cache += 1
         return self
 
     def decrease_quantity(self):
@@ -202,17 +226,24 @@ class QuickViewModal(BasePage):
             self for method chaining
         """
         self.web.click(*self.QUANTITY_DOWN)
+        if self._qty_cache is not None:
+            # The site does not let quantity drop below 1
+            self._qty_cache = max(1, self._qty_cache - 1)
         return self
 
     def get_quantity(self) -> int:
         """
         Get current quantity value.
 
+        Returns the value tracked by set/increase/decrease_quantity when known,
+        otherwise reads the input from the page.
+
         Returns:
             Current quantity as integer
         """
-        value = self.web.get_attribute(*self.QUANTITY_INPUT, attribute="value")
-        return int(value or "1")
+        if self._qty_cache is None:
+            self._qty_cache = int(self.web.execute_script(self._QUANTITY_JS, self.QUANTITY_INPUT[1]))
+        return self._qty_cache
 
     # ==================== ACTIONS ====================
 
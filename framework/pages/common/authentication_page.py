@@ -32,7 +32,8 @@ class AuthenticationPage(BasePage):
     # Page header
     AUTH_HEADER = (By.XPATH, "//*[text()='Authentication']")
 
-    # Login form (Returning Customer)
+    # Login form (Returning Customer); typed into and clicked through the web.* waits,
+    # so these stay plain locators rather than CachedElement
     LOGIN_EMAIL = (By.ID, "email")
     LOGIN_PASSWORD = (By.ID, "passwd")
     SUBMIT_LOGIN = (By.ID, "SubmitLogin")
@@ -48,14 +49,17 @@ class AuthenticationPage(BasePage):
 
     # ==================== PAGE METHODS ====================
 
-    def is_page_loaded(self) -> bool:
+    def is_page_loaded(self, timeout: int = 2) -> bool:
         """
         Verify authentication page is loaded.
 
+        Args:
+            timeout: Maximum time to wait in seconds
+
         Returns:
             True if authentication header is visible
         """
-        return self.web.is_element_displayed(*self.AUTH_HEADER, timeout=5)
+        return self.web.is_element_displayed(*self.AUTH_HEADER, timeout=timeout)
 
     # ==================== LOGIN METHODS ====================
 
@@ -132,14 +136,20 @@ class AuthenticationPage(BasePage):
 
     # ==================== ERROR MESSAGE METHODS ====================
 
-    def has_error_message(self) -> bool:
+    def has_error_message(self, timeout: int = 5) -> bool:
         """
         Check if error message is displayed.
 
+        Errors arrive by AJAX after submit, so this waits longer than the
+        other visibility checks on this page.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
         Returns:
             True if error message container is visible
         """
-        return self.web.is_element_displayed(*self.ERROR_MESSAGE, timeout=5)
+        return self._wait_for_error(timeout) is not None
 
     def get_error_message(self) -> str:
         """
@@ -148,66 +158,68 @@ class AuthenticationPage(BasePage):
         Returns:
             Error message text (all errors concatenated if multiple)
         """
-        if not self.has_error_message():
-            return ""
-
         try:
-            # Try to get individual error items from list
-            error_items = self.web.find_elements(*self.ERROR_LIST)
-            if error_items:
-                errors = [item.text for item in error_items]
-                return "; ".join(errors)
-
-            # Fallback: get entire error container text
-            return self.web.get_text(*self.ERROR_MESSAGE)
+            return self._wait_for_error() or ""
         except Exception:
             return ""
 
-    def is_login_error_displayed(self) -> bool:
+    def is_login_error_displayed(self, timeout: int = 5) -> bool:
         """
         Check if login-specific error is displayed.
 
+        Args:
+            timeout: Maximum time to wait in seconds (0 checks once without waiting)
+
         Returns:
             True if authentication failed error is shown
         """
-        if not self.has_error_message():
+        error_text = self._wait_for_error(timeout)
+        if not error_text:
             return False
 
-        error_text = self.get_error_message()
         return "Authentication failed" in error_text or "Invalid email" in error_text
 
-    def is_registration_email_error_displayed(self) -> bool:
+    def is_registration_email_error_displayed(self, timeout: int = 5) -> bool:
         """
         Check if registration email error is displayed.
 
+        Args:
+            timeout: Maximum time to wait in seconds (0 checks once without waiting)
+
         Returns:
             True if email validation error is shown
         """
-        if not self.has_error_message():
+        error_text = self._wait_for_error(timeout)
+        if not error_text:
             return False
 
-        error_text = self.get_error_message()
         return "Invalid email address" in error_text or "already been registered" in error_text
 
     # ==================== VALIDATION METHODS ====================
 
-    def is_login_form_visible(self) -> bool:
+    def is_login_form_visible(self, timeout: int = 2) -> bool:
         """
         Check if login form is visible.
 
+        Args:
+            timeout: Maximum time to wait in seconds
+
         Returns:
             True if login email field is displayed
         """
-        return self.web.is_element_displayed(*self.LOGIN_EMAIL, timeout=5)
+        return self.web.is_element_displayed(*self.LOGIN_EMAIL, timeout=timeout)
 
-    def is_registration_form_visible(self) -> bool:
+    def is_registration_form_visible(self, timeout: int = 2) -> bool:
         """
         Check if registration email form is visible.
 
+        Args:
+            timeout: Maximum time to wait in seconds
+
         Returns:
             True if email create field is displayed
         """
-        return self.web.is_element_displayed(*self.EMAIL_CREATE, timeout=5)
+        return self.web.is_element_displayed(*self.EMAIL_CREATE, timeout=timeout)
 
     def get_login_email_value(self) -> str:
         """
@@ -5,7 +5,7 @@ URL: http://www.automationpractice.pl/index.php
 """
 
 from selenium.webdriver.common.by import By
-from pages.base_page import BasePage
+from pages.base_page import BasePage, CachedElement
 from interfaces.web_interface import WebInterface
 
 
@@ -34,6 +34,7 @@ class HomePage(BasePage):
     # Header navigation
     LOGO = (By.CSS_SELECTOR, ".logo.img-responsive")
     SEARCH_BOX = (By.ID, "search_query_top")
+    search_box = CachedElement(SEARCH_BOX)
     CART_LINK = (By.CSS_SELECTOR, ".shopping_cart")
 
     # Authentication links (in header)
@@ -44,45 +45,116 @@ class HomePage(BasePage):
     # User account info (when logged in)
     USER_INFO = (By.CSS_SELECTOR, ".account span")
 
+    # Document parsed and logo rendered, checked in-browser by is_page_loaded
+    _PAGE_LOADED_JS = (
+        "document.readyState !== 'loading' && "
+        "(function (el) { return !!el && el.getClientRects().length > 0; })"
+        "(document.querySelector('%s'))" % LOGO[1]
+    )
+
+    # Fills the search box and submits its form in one script call; requestSubmit()
+    # runs the form's submit handlers and validation, unlike form.submit()
+    _SUBMIT_SEARCH_JS = """
+        var box = arguments[0];
+        box.value = arguments[1];
+        box.dispatchEvent(new Event('input', {bubbles: true}));
+        box.form.requestSubmit();
+    """
+
+    # Reads visibility of the three auth links and the user name in one script call
+    _HEADER_AUTH_JS = """
+        function visible(selector) {
+            var el = document.querySelector(selector);
+            return !!el && el.getClientRects().length > 0;
+        }
+        var user = document.querySelector(arguments[3]);
+        return {
+            login: visible(arguments[0]),
+            logout: visible(arguments[1]),
+            account: visible(arguments[2]),
+            user_name: user ? user.innerText.trim() : ''
+        };
+    """
+
     # ==================== PAGE METHODS ====================
 
-    def is_page_loaded(self) -> bool:
+    def is_page_loaded(self, timeout: int = 2) -> bool:
         """
         Verify home page is loaded.
 
+        Args:
+            timeout: Maximum time to wait in seconds
+
         Returns:
             True if logo is visible
         """
-        return self.web.is_element_displayed(*self.LOGO, timeout=5)
+        return self.web.wait_for_js(self._PAGE_LOADED_JS, timeout=timeout)
 
     # ==================== AUTHENTICATION LINKS ====================
 
-    def is_login_link_visible(self) -> bool:
+    def header_auth_state(self) -> dict:
+        """
+        Read the header authentication state in a single script call.
+
+        Returns:
+            Dict with 'login', 'logout', 'account' visibility booleans and 'user_name' text
+        """
+        return self.web.execute_script(
+            self._HEADER_AUTH_JS,
+            self.LOGIN_LINK[1], self.LOGOUT_LINK[1], self.ACCOUNT_LINK[1], self.USER_INFO[1]
+        )
+
+    def _is_header_link_visible(self, key: str, locator: tuple, timeout: int) -> bool:
+        """
+        Check a header link, waiting for it only if it is not already visible.
+
+        Args:
+            key: header_auth_state() key for the link
+            locator: Locator used for the fallback wait
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if the link is visible
+        """
+        if self.header_auth_state()[key]:
+            return True
+        return timeout > 0 and self.web.is_element_displayed(*locator, timeout=timeout)
+
+    def is_login_link_visible(self, timeout: int = 2) -> bool:
         """
         Check if login link is visible in header.
 
+        Args:
+            timeout: Maximum time to wait in seconds
+
         Returns:
             True if login link is displayed (user not logged in)
         """
-        return self.web.is_element_displayed(*self.LOGIN_LINK, timeout=3)
+        return self._is_header_link_visible("login", self.LOGIN_LINK, timeout)
 
-    def is_logout_link_visible(self) -> bool:
+    def is_logout_link_visible(self, timeout: int = 2) -> bool:
         """
         Check if logout link is visible in header.
 
+        Args:
+            timeout: Maximum time to wait in seconds
+
         Returns:
             True if logout link is displayed (user logged in)
         """
-        return self.web.is_element_displayed(*self.LOGOUT_LINK, timeout=3)
+        return self._is_header_link_visible("logout", self.LOGOUT_LINK, timeout)
 
-    def is_account_link_visible(self) -> bool:
+    def is_account_link_visible(self, timeout: int = 2) -> bool:
         """
         Check if account link is visible in header.
 
+        Args:
+            timeout: Maximum time to wait in seconds
+
         Returns:
             True if account link is displayed (user logged in)
         """
-        return self.web.is_element_displayed(*self.ACCOUNT_LINK, timeout=3)
+        return self._is_header_link_visible("account", self.ACCOUNT_LINK, timeout)
 
     def click_login_link(self):
         """
@@ -121,11 +193,13 @@ class HomePage(BasePage):
         Returns:
             User name text, or empty string if not logged in
         """
-        if not self.is_account_link_visible():
-            return ""
-
         try:
-            return self.web.get_text(*self.USER_INFO)
+            state = self.header_auth_state()
+            if not state["account"]:
+                if not self.web.is_element_displayed(*self.ACCOUNT_LINK, timeout=2):
+                    return ""
+                state = self.header_auth_state()
+            return state["user_name"]
         except Exception:
             return ""
 
@@ -163,18 +237,19 @@ class HomePage(BasePage):
         Returns:
             self for method chaining
         """
-        from selenium.webdriver.common.keys import Keys
-        self.web.type_text(*self.SEARCH_BOX, text=search_term)
-        # Submit search by pressing Enter
-        element = self.web.find_element(*self.SEARCH_BOX)
-        element.send_keys(Keys.RETURN)
+        # The cached lookup waits for the box, which may not be parsed yet on an eager page load
+        self.web.execute_script(self._SUBMIT_SEARCH_JS, self.search_box, search_term)
+        self._invalidate()
         return self
 
-    def is_search_box_visible(self) -> bool:
+    def is_search_box_visible(self, timeout: int = 2) -> bool:
         """
         Check if search box is visible.
 
+        Args:
+            timeout: Maximum time to wait in seconds
+
         Returns:
             True if search box is displayed
         """
-        return self.web.is_element_displayed(*self.SEARCH_BOX, timeout=3)
+        return self.web.is_element_displayed(*self.SEARCH_BOX, timeout=timeout)
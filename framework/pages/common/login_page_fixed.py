@@ -1,3 +1,5 @@
+from functools import partial
+
 from selenium.webdriver.common.by import By
 from framework.pages.base_page import BasePage
 from framework.interfaces.web_interface import WebInterface
@@ -19,8 +21,12 @@ class LoginPage(BasePage):
         """
         super().__init__(web)
 
+        # Locator fixed at construction; skips re-unpacking SUBMITLOGIN on every click
+        self._click_submit = partial(web.click, *self.SUBMITLOGIN)
+
     # ==================== LOCATORS ====================
 
+    # Clicked/typed through the web.* waits, so plain locators rather than CachedElement
     SUBMITLOGIN = (By.CSS_SELECTOR, "#SubmitLogin")
     EMAIL = (By.CSS_SELECTOR, "#email")
     PASSWD = (By.CSS_SELECTOR, "#passwd")
@@ -30,7 +36,7 @@ class LoginPage(BasePage):
 
     def click_submitlogin(self) -> None:
         """Click SUBMITLOGIN button."""
-        self.web.click(*self.SUBMITLOGIN)
+        self._click_submit()
 
     def enter_email(self, text: str) -> None:
         """
@@ -39,7 +45,7 @@ class LoginPage(BasePage):
         Args:
             text: Text to enter
         """
-        self.web.send_keys(*self.EMAIL, text)
+        self.web.type_text(*self.EMAIL, text)
 
     def enter_passwd(self, text: str) -> None:
         """
@@ -48,5 +54,15 @@ class LoginPage(BasePage):
         Args:
             text: Text to enter
         """
-        self.web.send_keys(*self.PASSWD, text)
+        self.web.type_text(*self.PASSWD, text)
+
+    def fill_credentials(self, email: str, password: str) -> None:
+        """
+        Enter email and password, locating both fields together.
+
+        Args:
+            email: Text for EMAIL field
+            password: Text for PASSWD field
+        """
+        self.web.type_texts([(self.EMAIL, email), (self.PASSWD, password)])
 
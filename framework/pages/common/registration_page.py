@@ -4,9 +4,10 @@ Registration Page - Account registration form page object.
 URL: http://www.automationpractice.pl/index.php?controller=authentication&account_creation
 """
 
+from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver.common.by import By
 from typing import Dict, Any, Optional
-from pages.base_page import BasePage
+from pages.base_page import BasePage, CachedElement
 from interfaces.web_interface import WebInterface
 
 
@@ -41,7 +42,7 @@ class RegistrationPage(BasePage):
     EMAIL = (By.ID, "email")
     PASSWORD = (By.ID, "passwd")
 
-    # Date of Birth
+    # Date of Birth (filled by _FILL_FORM_JS, so not CachedElement - see its docstring)
     DAY = (By.ID, "days")
     MONTH = (By.ID, "months")
     YEAR = (By.ID, "years")
@@ -49,6 +50,8 @@ class RegistrationPage(BasePage):
     # Newsletter & Offers
     NEWSLETTER = (By.ID, "newsletter")
     SPECIAL_OFFERS = (By.ID, "optin")
+    newsletter_checkbox = CachedElement(NEWSLETTER)
+    special_offers_checkbox = CachedElement(SPECIAL_OFFERS)
 
     # Address Information
     ADDRESS_FIRSTNAME = (By.ID, "firstname")
@@ -69,7 +72,7 @@ class RegistrationPage(BasePage):
     # Address Alias
     ALIAS = (By.ID, "alias")
 
-    # Submit
+    # Submit (clicked via web.click's clickable wait, so not CachedElement)
     SUBMIT_ACCOUNT = (By.ID, "submitAccount")
 
     # Success/Error Messages
@@ -77,6 +80,34 @@ class RegistrationPage(BasePage):
     ERROR_MESSAGE = (By.CSS_SELECTOR, ".alert-danger")
     ERROR_LIST = (By.CSS_SELECTOR, ".alert-danger ol li")
 
+    # Fills fields from a list of [id, kind, value] entries in one script call.
+    # kind is 'text', 'check', 'select_value' or 'select_text'. Returns the ids that were
+    # not found and the select ids that had no option matching the value.
+    _FILL_FORM_JS = """
+        var missing = [], unmatched = [];
+        arguments[0].forEach(function(field) {
+            var el = document.getElementById(field[0]), kind = field[1], value = field[2];
+            if (!el) { missing.push(field[0]); return; }
+            if (kind === 'check') {
+                if (!el.checked) el.click();
+                return;
+            }
+            if (kind === 'text') {
+                el.value = value;
+            } else {
+                for (var i = 0; i < el.options.length; i++) {
+                    var option = el.options[i];
+                    var match = kind === 'select_value' ? option.value === value : option.text.trim() === value;
+                    if (match) { el.selectedIndex = i; break; }
+                }
+                if (i === el.options.length) { unmatched.push(field[0]); return; }
+            }
+            el.dispatchEvent(new Event('input', {bubbles: true}));
+            el.dispatchEvent(new Event('change', {bubbles: true}));
+        });
+        return {missing: missing, unmatched: unmatched};
+    """
+
     # ==================== PERSONAL INFORMATION METHODS ====================
 
     def select_gender_mr(self) -> None:
@@ -97,14 +128,25 @@ class RegistrationPage(BasePage):
         Returns:
             self for method chaining
         """
+        self.web.click(*self._gender_locator(gender))
+        return self
+
+    def _gender_locator(self, gender: str) -> tuple:
+        """
+        Resolve the radio button locator for a gender/title name.
+
+        Args:
+            gender: 'mr' or 'mrs' (case-insensitive)
+
+        Returns:
+            GENDER_MR or GENDER_MRS locator
+        """
         gender_lower = gender.lower()
         if gender_lower in ['mr', 'mr.', 'male', '1']:
-            self.select_gender_mr()
+            return self.GENDER_MR
         elif gender_lower in ['mrs', 'mrs.', 'female', '2']:
-            self.select_gender_mrs()
-        else:
-            raise ValueError(f"Invalid gender value: {gender}. Use 'mr' or 'mrs'.")
-        return self
+            return self.GENDER_MRS
+        raise ValueError(f"Invalid gender value: {gender}. Use 'mr' or 'mrs'.")
 
     def select_title(self, title: str):
         """
@@ -177,36 +219,59 @@ class RegistrationPage(BasePage):
             month: Month name (January, February, etc.) or number (1-12)
             year: Year (e.g., 1990)
         """
-        self.web.select_dropdown_by_value(*self.DAY, option_value=str(day))
+        self._apply_fields(self._dob_fields(day, month, year))
+        return self
 
-        # Handle month as number or name
-        if month.isdigit():
-            self.web.select_dropdown_by_value(*self.MONTH, option_value=str(month))
-        else:
-            self.web.select_dropdown_by_visible_text(*self.MONTH, text=month)
+    def _dob_fields(self, day, month, year) -> list:
+        """
+        Build _FILL_FORM_JS entries for the three date of birth dropdowns.
 
-        self.web.select_dropdown_by_value(*self.YEAR, option_value=str(year))
-        return self
+        Args:
+            day: Day (1-31)
+            month: Month name or number (1-12)
+            year: Year
+
+        Returns:
+            List of field entries
+        """
+        month = str(month)
+        return [
+            [self.DAY[1], 'select_value', str(day)],
+            # Handle month as number or name
+            [self.MONTH[1], 'select_value' if month.isdigit() else 'select_text', month],
+            [self.YEAR[1], 'select_value', str(year)],
+        ]
+
+    def _set_checkbox(self, locator: tuple, checked: bool) -> None:
+        """
+        Wait for a checkbox to be clickable, then toggle it only if needed.
+
+        Reading is_selected() on the waited element avoids racing the page
+        scripts that initialise the checkbox state.
+
+        Args:
+            locator: Checkbox locator
+            checked: Desired state
+        """
+        checkbox = self.web.wait_clickable(*locator)
+        if checkbox.is_selected() != checked:
+            checkbox.click()
 
     def check_newsletter(self) -> None:
         """Check the newsletter checkbox."""
-        if not self.is_newsletter_checked():
-            self.web.click(*self.NEWSLETTER)
+        self._set_checkbox(self.NEWSLETTER, True)
 
     def uncheck_newsletter(self) -> None:
         """Uncheck the newsletter checkbox."""
-        if self.is_newsletter_checked():
-            self.web.click(*self.NEWSLETTER)
+        self._set_checkbox(self.NEWSLETTER, False)
 
     def check_special_offers(self) -> None:
         """Check the special offers checkbox."""
-        if not self.is_special_offers_checked():
-            self.web.click(*self.SPECIAL_OFFERS)
+        self._set_checkbox(self.SPECIAL_OFFERS, True)
 
     def uncheck_special_offers(self) -> None:
         """Uncheck the special offers checkbox."""
-        if self.is_special_offers_checked():
-            self.web.click(*self.SPECIAL_OFFERS)
+        self._set_checkbox(self.SPECIAL_OFFERS, False)
 
     def is_newsletter_checked(self) -> bool:
         """
@@ -215,8 +280,7 @@ class RegistrationPage(BasePage):
         Returns:
             True if checked
         """
-        checkbox = self.web.find_element(*self.NEWSLETTER)
-        return checkbox.is_selected()
+        return self.newsletter_checkbox.is_selected()
 
     def is_special_offers_checked(self) -> bool:
         """
@@ -225,8 +289,7 @@ class RegistrationPage(BasePage):
         Returns:
             True if checked
         """
-        checkbox = self.web.find_element(*self.SPECIAL_OFFERS)
-        return checkbox.is_selected()
+        return self.special_offers_checkbox.is_selected()
 
     # ==================== ADDRESS INFORMATION METHODS ====================
 
@@ -370,12 +433,16 @@ class RegistrationPage(BasePage):
             self for method chaining
         """
         self.web.click(*self.SUBMIT_ACCOUNT)
+        self._invalidate()
         return self
 
     def fill_registration_form(self, user_data: Dict[str, Any]) -> None:
         """
         Fill entire registration form with provided data.
 
+        All fields are set in a single script call that fires the same
+        input/change events as typing, instead of one find/clear/type per field.
+
         Args:
             user_data: Dictionary containing user information
                 Required keys: first_name, last_name, password, address (dict)
@@ -385,57 +452,102 @@ class RegistrationPage(BasePage):
                 Address dict optional keys: address2, additional_info, alias
 
                 DOB dict keys: day, month, year
+
+        Raises:
+            NoSuchElementException: If any form field is missing from the page, or a
+                dropdown has no option matching its value
+        """
+        self._apply_fields(self._build_form_fields(user_data))
+
+    def _apply_fields(self, fields: list) -> None:
+        """
+        Set form fields with one _FILL_FORM_JS call.
+
+        Args:
+            fields: [id, kind, value] entries
+
+        Raises:
+            NoSuchElementException: If any field is missing from the page, or a
+                dropdown has no option matching its value (like Select.select_by_*)
+        """
+        result = self.web.execute_script(self._FILL_FORM_JS, fields)
+        if result['missing']:
+            self.web.logger.error(f"Registration fields not found: {result['missing']}")
+            raise NoSuchElementException(f"Registration fields not found: {', '.join(result['missing'])}")
+        if result['unmatched']:
+            values = {field[0]: field[2] for field in fields}
+            unmatched = ', '.join(f"{field_id}={values[field_id]!r}" for field_id in result['unmatched'])
+            self.web.logger.error(f"No matching dropdown option: {unmatched}")
+            raise NoSuchElementException(f"No matching dropdown option: {unmatched}")
+
+    def _build_form_fields(self, user_data: Dict[str, Any]) -> list:
+        """
+        Translate user data into the [id, kind, value] entries consumed by _FILL_FORM_JS.
+
+        Args:
+            user_data: Dictionary containing user information (see fill_registration_form)
+
+        Returns:
+            List of field entries in fill order
         """
+        fields = []
+
+        def text(locator, value):
+            fields.append([locator[1], 'text', str(value)])
+
         # Personal Information
         if 'gender' in user_data:
-            self.select_gender(user_data['gender'])
+            fields.append([self._gender_locator(user_data['gender'])[1], 'check', None])
 
-        self.enter_customer_firstname(user_data['first_name'])
-        self.enter_customer_lastname(user_data['last_name'])
-        self.enter_password(user_data['password'])
+        text(self.CUSTOMER_FIRSTNAME, user_data['first_name'])
+        text(self.CUSTOMER_LASTNAME, user_data['last_name'])
+        text(self.PASSWORD, user_data['password'])
 
         # Date of Birth (optional)
         if 'dob' in user_data:
             dob = user_data['dob']
-            self.select_date_of_birth(dob['day'], dob['month'], dob['year'])
+            fields.extend(self._dob_fields(dob['day'], dob['month'], dob['year']))
 
         # Newsletter & Offers
         if user_data.get('newsletter', False):
-            self.check_newsletter()
+            fields.append([self.NEWSLETTER[1], 'check', None])
 
         if user_data.get('special_offers', False):
-            self.check_special_offers()
+            fields.append([self.SPECIAL_OFFERS[1], 'check', None])
 
         # Address Information
         address = user_data['address']
-        self.enter_address_firstname(user_data['first_name'])
-        self.enter_address_lastname(user_data['last_name'])
+        text(self.ADDRESS_FIRSTNAME, user_data['first_name'])
+        text(self.ADDRESS_LASTNAME, user_data['last_name'])
 
         if 'company' in user_data and user_data['company']:
-            self.enter_company(user_data['company'])
+            text(self.COMPANY, user_data['company'])
 
-        self.enter_address1(address['address1'])
+        text(self.ADDRESS1, address['address1'])
 
         if 'address2' in address and address['address2']:
-            self.enter_address2(address['address2'])
+            text(self.ADDRESS2, address['address2'])
 
-        self.enter_city(address['city'])
-        self.select_state(address['state'])
-        self.enter_postcode(address['zipcode'])
-        self.select_country(address.get('country', 'United States'))
+        text(self.CITY, address['city'])
+        # Country first: its change handler repopulates the state list
+        fields.append([self.COUNTRY[1], 'select_text', address.get('country', 'United States')])
+        fields.append([self.STATE[1], 'select_text', address['state']])
+        text(self.POSTCODE, address['zipcode'])
 
         if 'additional_info' in address and address['additional_info']:
-            self.enter_additional_info(address['additional_info'])
+            text(self.ADDITIONAL_INFO, address['additional_info'])
 
         # Contact Information
         if 'home_phone' in address and address['home_phone']:
-            self.enter_home_phone(address['home_phone'])
+            text(self.HOME_PHONE, address['home_phone'])
 
-        self.enter_mobile_phone(address['phone'])
+        text(self.MOBILE_PHONE, address['phone'])
 
         # Address Alias
         if 'alias' in address and address['alias']:
-            self.enter_address_alias(address['alias'])
+            text(self.ALIAS, address['alias'])
+
+        return fields
 
     def register_user(self, user_data: Dict[str, Any]) -> None:
         """
@@ -449,23 +561,29 @@ class RegistrationPage(BasePage):
 
     # ==================== ERROR & SUCCESS MESSAGE METHODS ====================
 
-    def has_error_message(self) -> bool:
+    def has_error_message(self, timeout: int = 5) -> bool:
         """
         Check if error message is displayed.
 
+        Args:
+            timeout: Maximum time to wait in seconds
+
         Returns:
             True if error message container is visible
         """
-        return self.web.is_element_displayed(*self.ERROR_MESSAGE, timeout=5)
+        return self._wait_for_error(timeout) is not None
 
-    def has_success_message(self) -> bool:
+    def has_success_message(self, timeout: int = 5) -> bool:
         """
         Check if success message is displayed.
 
+        Args:
+            timeout: Maximum time to wait in seconds
+
         Returns:
             True if success message container is visible
         """
-        return self.web.is_element_displayed(*self.SUCCESS_MESSAGE, timeout=5)
+        return self.web.is_element_displayed(*self.SUCCESS_MESSAGE, timeout=timeout)
 
     def get_error_message(self) -> str:
         """
@@ -474,18 +592,8 @@ class RegistrationPage(BasePage):
         Returns:
             Error message text (all errors concatenated if multiple)
         """
-        if not self.has_error_message():
-            return ""
-
         try:
-            # Try to get individual error items from list
-            error_items = self.web.find_elements(*self.ERROR_LIST)
-            if error_items:
-                errors = [item.text for item in error_items]
-                return "; ".join(errors)
-
-            # Fallback: get entire error container text
-            return self.web.get_text(*self.ERROR_MESSAGE)
+            return self._wait_for_error() or ""
         except Exception:
             return ""
 
@@ -503,14 +611,17 @@ class RegistrationPage(BasePage):
 
     # ==================== VALIDATION METHODS ====================
 
-    def is_page_loaded(self) -> bool:
+    def is_page_loaded(self, timeout: int = 5) -> bool:
         """
         Verify registration form page is loaded.
 
+        Args:
+            timeout: Maximum time to wait in seconds
+
         Returns:
             True if submit account button is visible
         """
-        return self.web.is_element_displayed(*self.SUBMIT_ACCOUNT, timeout=5)
+        return self.web.is_element_displayed(*self.SUBMIT_ACCOUNT, timeout=timeout)
 
     def get_email_value(self) -> str:
         """
@@ -528,6 +639,5 @@ class RegistrationPage(BasePage):
         Returns:
             True if email field is disabled/readonly
         """
-        readonly_attr = self.web.get_attribute(*self.EMAIL, attribute="readonly")
-        disabled_attr = self.web.get_attribute(*self.EMAIL, attribute="disabled")
-        return bool(readonly_attr or disabled_attr)
+        attrs = self.web.get_many(*self.EMAIL, attributes=["readonly", "disabled"])['attributes']
+        return bool(attrs["readonly"] or attrs["disabled"])
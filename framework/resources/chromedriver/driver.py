@@ -4,19 +4,64 @@ WebDriver Factory - Creates and configures ChromeDriver instances.
 Handles driver initialization with appropriate options (headless, window size, etc.).
 """
 
+import os
+from functools import lru_cache
+
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
 
 
-def create_driver(headless=False, window_size="1920x1080"):
+@lru_cache(maxsize=None)
+def _resolve_driver_path(driver_path=None):
+    """
+    Resolve the chromedriver binary path once per process.
+
+    A pinned binary (driver_path, else CHROMEDRIVER_PATH) is used as-is and
+    WebDriver Manager is never touched - the setup for CI images that bake in a
+    chromedriver matching their Chrome. Otherwise WebDriver Manager is asked
+    once; its version lookup is a network request, so later drivers in the same
+    test process reuse the result.
+
+    Args:
+        driver_path: Pinned chromedriver path (default: CHROMEDRIVER_PATH env var)
+
+    Returns:
+        str: Path to the chromedriver executable
+
+    Raises:
+        FileNotFoundError: If a pinned path is configured but does not exist
+    """
+    path = driver_path or os.getenv("CHROMEDRIVER_PATH")
+    if path:
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Pinned chromedriver not found: {path}")
+        return path
+    return ChromeDriverManager().install()
+
+
+def create_driver(headless=False, window_size="1920x1080", implicit_wait: float = 0, grid_url=None,
+                  load_images=False, driver_path=None, user_data_dir=None):
     """
     Create and configure a ChromeDriver instance.
 
+    When grid_url is given the browser is started on a Selenium Grid node via
+    webdriver.Remote and no local chromedriver is downloaded or launched.
+
+    Implicit wait is off by default: WebInterface waits explicitly, and mixing
+    implicit and explicit waits compounds timeouts (every poll of an explicit
+    wait can block for the full implicit wait).
+
     Args:
         headless: Run browser in headless mode (default: False)
         window_size: Browser window size as "WIDTHxHEIGHT" (default: "1920x1080")
+        implicit_wait: Implicit wait in seconds, only applied when > 0 (default: 0)
+        grid_url: Selenium Grid hub URL; runs locally when None (default: None)
+        load_images: Download and decode images (default: False)
+        driver_path: Pinned chromedriver binary; skips WebDriver Manager (default: CHROMEDRIVER_PATH)
+        user_data_dir: Chrome profile directory for a local browser; parallel workers pass
+            their own so they never share a profile (default: None, Chrome's temporary profile)
 
     Returns:
         WebDriver: Configured ChromeDriver instance
@@ -29,8 +74,10 @@ def create_driver(headless=False, window_size="1920x1080"):
         chrome_options.add_argument("--headless=new")  # Use new headless mode
         chrome_options.add_argument("--disable-gpu")
 
-    # Window size
+    # Window size (headed browsers also start maximized - set at launch, no post-launch resize)
     chrome_options.add_argument(f"--window-size={window_size}")
+    if not headless:
+        chrome_options.add_argument("--start-maximized")
 
     # Performance and stability options
     chrome_options.add_argument("--no-sandbox")
@@ -38,20 +85,48 @@ def create_driver(headless=False, window_size="1920x1080"):
     chrome_options.add_argument("--disable-blink-features=AutomationControlled")
     chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
     chrome_options.add_experimental_option("useAutomationExtension", False)
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--disable-background-networking")
+    chrome_options.add_argument("--disable-default-apps")
+    chrome_options.add_argument("--disable-sync")
+    chrome_options.add_argument("--no-first-run")
+    chrome_options.add_argument("--disable-features=TranslateUI,BackForwardCache")
+    if not load_images:
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+
+    # Dedicated profile (local browsers only - the path would not exist on a grid node)
+    if user_data_dir and not grid_url:
+        chrome_options.add_argument(f"--user-data-dir={user_data_dir}")
+
+    # Return from get() at DOMContentLoaded; element waits cover late subresources
+    chrome_options.page_load_strategy = "eager"
 
     # Suppress logging
     chrome_options.add_argument("--log-level=3")
     chrome_options.add_experimental_option("excludeSwitches", ["enable-logging"])
 
-    # Create driver using WebDriver Manager (auto-downloads correct chromedriver)
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=chrome_options)
+    if grid_url:
+        # Remote session on the grid - skips the chromedriver download and local browser start
+        driver = webdriver.Remote(command_executor=grid_url, options=chrome_options)
+    else:
+        # Pinned binary, or WebDriver Manager for local dev (auto-downloads correct chromedriver)
+        service = Service(executable_path=_resolve_driver_path(driver_path))
+        driver = webdriver.Chrome(service=service, options=chrome_options)
 
-    # Set implicit wait
-    driver.implicitly_wait(10)
+    # In CI, pin network emulation to "no throttling" and keep the HTTP cache on
+    # so repeat page loads within a worker are served from cache
+    if os.getenv("ENVIRONMENT", "production").lower() == "ci" and hasattr(driver, "execute_cdp_cmd"):
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.emulateNetworkConditions", {
+            "offline": False,
+            "latency": 0,
+            "downloadThroughput": -1,
+            "uploadThroughput": -1,
+        })
+        driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": False})
 
-    # Maximize window if not headless
-    if not headless:
-        driver.maximize_window()
+    # Set implicit wait (disabled by default, see docstring)
+    if implicit_wait > 0:
+        driver.implicitly_wait(implicit_wait)
 
     return driver
@@ -2,26 +2,66 @@
 Configuration module for loading environment variables and providing config access.
 """
 
+import logging
 import os
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from dotenv import load_dotenv
 
 
+logger = logging.getLogger(__name__)
+
+# Parsed configuration per env file, shared by every Config instance
+_CONFIG_CACHE: Dict[str, Dict[str, Any]] = {}
+
+
+def _env_bool(name: str, default: str) -> bool:
+    """
+    Read a boolean environment variable ('true' in any case is True).
+
+    Args:
+        name: Environment variable name
+        default: Value used when the variable is not set
+
+    Returns:
+        Parsed boolean
+    """
+    return os.getenv(name, default).lower() == 'true'
+
+
 class Config:
     """Configuration management class that loads and provides access to environment variables."""
 
     def __init__(self, env_file: str = ".env"):
         """
-        Initialize configuration by loading environment variables.
+        Initialize configuration.
+
+        Nothing is read until the first lookup (see _config), so importing or
+        constructing Config during test collection costs nothing.
 
         Args:
             env_file: Path to .env file (default: ".env")
         """
         self.env_file = env_file
-        self._load_env()
-        self._config = self._build_config()
+        self._loaded: Optional[Dict[str, Any]] = None
+
+    @property
+    def _config(self) -> Dict[str, Any]:
+        """
+        Parsed configuration, loaded on first access.
+
+        Loading and parsing happen once per env file; later instances share the result.
+
+        Returns:
+            Configuration dictionary
+        """
+        if self._loaded is None:
+            if self.env_file not in _CONFIG_CACHE:
+                self._load_env()
+                _CONFIG_CACHE[self.env_file] = self._build_config()
+            self._loaded = _CONFIG_CACHE[self.env_file]
+        return self._loaded
 
     def _load_env(self) -> None:
         """Load environment variables from .env file."""
@@ -29,14 +69,14 @@ class Config:
 
         if env_path.exists():
             load_dotenv(env_path)
-            print(f"Loaded configuration from: {env_path.absolute()}")
+            logger.debug("Loaded configuration from: %s", env_path.absolute())
         else:
-            print(f"Warning: {env_path.absolute()} not found. Using .env.example or defaults.")
+            logger.warning("%s not found. Using .env.example or defaults.", env_path.absolute())
             # Try to load from .env.example if .env doesn't exist
             example_path = Path(".env.example")
             if example_path.exists():
                 load_dotenv(example_path)
-                print(f"Loaded configuration from: {example_path.absolute()}")
+                logger.debug("Loaded configuration from: %s", example_path.absolute())
 
     def _build_config(self) -> Dict[str, Any]:
         """
@@ -52,17 +92,17 @@ class Config:
 
             # Browser Configuration
             'browser': os.getenv('BROWSER', 'chrome').lower(),
-            'headless': os.getenv('HEADLESS', 'false').lower() == 'true',
+            'headless': _env_bool('HEADLESS', 'false'),
             'window_size': os.getenv('WINDOW_SIZE', '1920x1080'),
 
             # Test Execution
-            'implicit_wait': int(os.getenv('IMPLICIT_WAIT', '10')),
             'explicit_wait': int(os.getenv('EXPLICIT_WAIT', '20')),
             'page_load_timeout': int(os.getenv('PAGE_LOAD_TIMEOUT', '30')),
+            'poll_frequency': float(os.getenv('POLL_FREQUENCY', '0.25')),
 
             # Reporting & Logging
             'log_level': os.getenv('LOG_LEVEL', 'INFO').upper(),
-            'screenshots_on_failure': os.getenv('SCREENSHOTS_ON_FAILURE', 'true').lower() == 'true',
+            'screenshots_on_failure': _env_bool('SCREENSHOTS_ON_FAILURE', 'true'),
             'screenshot_dir': os.getenv('SCREENSHOT_DIR', 'screenshots'),
             'report_dir': os.getenv('REPORT_DIR', '_reports'),
             'log_dir': os.getenv('LOG_DIR', 'logs'),
@@ -75,7 +115,7 @@ class Config:
             'environment': os.getenv('ENVIRONMENT', 'production').lower(),
 
             # Optional: Selenium Grid
-            'use_grid': os.getenv('USE_GRID', 'false').lower() == 'true',
+            'use_grid': _env_bool('USE_GRID', 'false'),
             'grid_url': os.getenv('GRID_URL', 'http://localhost:4444/wd/hub'),
         }
 
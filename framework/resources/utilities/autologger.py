@@ -6,7 +6,7 @@ Provides automatic logging of function entry/exit with timing information.
 
 import logging
 import functools
-from datetime import datetime
+import time
 
 
 # Module-level logger instance
@@ -61,34 +61,43 @@ def automation_logger(category=""):
         def test_login(web_interface):
             ...
     """
+    # Build log prefix once per decorated function
+    prefix = f"[{category}] " if category else ""
+
+    # Used until logger_init() runs; looked up once instead of per call
+    fallback = logging.getLogger(__name__)
+
     def decorator(func):
+        func_name = func.__name__
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             # Get logger instance
-            log = logger if logger else logging.getLogger(__name__)
+            log = logger or fallback
 
-            # Build log prefix
-            prefix = f"[{category}] " if category else ""
-            func_name = func.__name__
+            # Logging silenced (ERROR implies INFO is off too): skip timing entirely
+            if not log.isEnabledFor(logging.ERROR):
+                return func(*args, **kwargs)
 
-            # Log entry
-            log.info(f"{prefix}{func_name} - START")
-            start_time = datetime.now()
+            # Log entry (%-style args are only formatted if the record is emitted)
+            log.info("%s%s - START", prefix, func_name)
+            start_time = time.perf_counter()
 
             try:
                 # Execute function
                 result = func(*args, **kwargs)
 
                 # Log successful exit
-                duration = (datetime.now() - start_time).total_seconds()
-                log.info(f"{prefix}{func_name} - END ({duration:.2f}s)")
+                if log.isEnabledFor(logging.INFO):
+                    duration = time.perf_counter() - start_time
+                    log.info("%s%s - END (%.2fs)", prefix, func_name, duration)
 
                 return result
 
             except Exception as e:
                 # Log error and re-raise
-                duration = (datetime.now() - start_time).total_seconds()
-                log.error(f"{prefix}{func_name} - FAILED ({duration:.2f}s): {str(e)}")
+                duration = time.perf_counter() - start_time
+                log.error("%s%s - FAILED (%.2fs): %s", prefix, func_name, duration, e)
                 raise
 
         return wrapper
@@ -2,38 +2,123 @@
 Test data generation utility using Faker and JSON data loading.
 """
 
+import copy
 import json
+import mmap
 import os
+import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from faker import Faker
 
+try:
+    import orjson
+except ImportError:  # optional (requirements.txt): faster JSON parsing/serialization
+    orjson = None
+
+
+# Files at least this large are memory-mapped and parsed in place (orjson only)
+_MMAP_THRESHOLD = 1_000_000
+
+
+def _read_json(filepath: Path) -> Any:
+    """
+    Parse a JSON file from its raw bytes, using orjson when installed.
+
+    Args:
+        filepath: Path to JSON file
+
+    Returns:
+        Parsed JSON data
+    """
+    with open(filepath, 'rb') as f:
+        if orjson is None:
+            return json.loads(f.read())
+        if os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+            return orjson.loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                return orjson.loads(view)
+
+
+# Seed last applied to Faker's shared RNG; guarded so concurrent constructors seed once
+_seeded_with: Optional[int] = None
+_seed_lock = threading.Lock()
+
+
+def _seed_once(seed: int) -> None:
+    """
+    Seed Faker's shared RNG unless it was already seeded with the same value.
+
+    Args:
+        seed: Seed value
+    """
+    global _seeded_with
+    if _seeded_with == seed:
+        return
+    with _seed_lock:
+        if _seeded_with != seed:
+            Faker.seed(seed)
+            _seeded_with = seed
+
 
 class DataGenerator:
     """Test data generator using Faker library and JSON data files."""
 
-    def __init__(self, locale: str = 'en_US', data_dir: str = 'framework/resources/data'):
+    __slots__ = (
+        'faker', 'data_dir', '_data_dir',
+        '_first_name', '_last_name', '_email', '_phone', '_password', '_company',
+        '_street', '_city', '_state', '_zipcode', '_boolean', '_secondary', '_randint',
+        '_role_index', '_role_index_key',
+    )
+
+    def __init__(self, locale: str = 'en_US', data_dir: str = 'framework/resources/data',
+                 seed: Optional[int] = 0):
         """
         Initialize DataGenerator.
 
         Args:
             locale: Faker locale (default: en_US)
             data_dir: Directory containing JSON data files
+            seed: Seed for Faker's shared RNG, applied once per process (None to leave unseeded)
         """
         self.faker = Faker(locale)
         self.data_dir = data_dir
-        Faker.seed(0)  # Set seed for reproducibility in tests
+        self._data_dir = Path(data_dir)
+        if seed is not None:
+            _seed_once(seed)  # Set seed for reproducibility in tests
+
+        # Bound provider methods used by the generate_* hot path (skips Faker's
+        # proxy attribute dispatch on every call)
+        self._first_name = self.faker.first_name
+        self._last_name = self.faker.last_name
+        self._email = self.faker.email
+        self._phone = self.faker.phone_number
+        self._password = self.faker.password
+        self._company = self.faker.company
+        self._street = self.faker.street_address
+        self._city = self.faker.city
+        self._state = self.faker.state
+        self._zipcode = self.faker.zipcode
+        self._boolean = self.faker.boolean
+        self._secondary = self.faker.secondary_address
+        self._randint = self.faker.random.randint
+
+        # role -> first matching user index for get_user_by_role, valid while the
+        # (filename, mtime in ns) it was built from matches _role_index_key
+        self._role_index: Dict[str, Dict[str, Any]] = {}
+        self._role_index_key: Optional[Tuple[str, int]] = None
 
     # ==================== PERSONAL DATA ====================
 
     def generate_first_name(self) -> str:
         """Generate random first name."""
-        return self.faker.first_name()
+        return self._first_name()
 
     def generate_last_name(self) -> str:
         """Generate random last name."""
-        return self.faker.last_name()
+        return self._last_name()
 
     def generate_full_name(self) -> str:
         """Generate random full name."""
@@ -52,11 +137,11 @@ class DataGenerator:
         if prefix:
             domain = self.faker.free_email_domain()
             return f"{prefix}_{self.faker.random_number(digits=6)}@{domain}"
-        return self.faker.email()
+        return self._email()
 
     def generate_phone_number(self) -> str:
         """Generate random phone number."""
-        return self.faker.phone_number()
+        return self._phone()
 
     def generate_password(self, length: int = 12, special_chars: bool = True) -> str:
         """
@@ -69,7 +154,7 @@ class DataGenerator:
         Returns:
             Password string
         """
-        return self.faker.password(
+        return self._password(
             length=length,
             special_chars=special_chars,
             digits=True,
@@ -81,15 +166,15 @@ class DataGenerator:
 
     def generate_address_line(self) -> str:
         """Generate random street address."""
-        return self.faker.street_address()
+        return self._street()
 
     def generate_city(self) -> str:
         """Generate random city name."""
-        return self.faker.city()
+        return self._city()
 
     def generate_state(self) -> str:
         """Generate random state name."""
-        return self.faker.state()
+        return self._state()
 
     def generate_state_abbr(self) -> str:
         """Generate random state abbreviation."""
@@ -97,7 +182,7 @@ class DataGenerator:
 
     def generate_zipcode(self) -> str:
         """Generate random zip code."""
-        return self.faker.zipcode()
+        return self._zipcode()
 
     def generate_country(self) -> str:
         """Generate random country name."""
@@ -111,11 +196,12 @@ class DataGenerator:
             Dictionary with address components
         """
         return {
-            'address1': self.generate_address_line(),
-            'address2': self.faker.secondary_address() if self.faker.boolean(chance_of_getting_true=30) else '',
-            'city': self.generate_city(),
-            'state': self.generate_state(),
-            'zipcode': self.generate_zipcode(),
+            'address1': self._street(),
+            # Same RNG draw as faker.boolean(chance_of_getting_true=30), minus the provider layer
+            'address2': self._secondary() if self._randint(1, 100) <= 30 else '',
+            'city': self._city(),
+            'state': self._state(),
+            'zipcode': self._zipcode(),
             'country': 'United States'  # Default to US for test site
         }
 
@@ -123,7 +209,7 @@ class DataGenerator:
 
     def generate_company_name(self) -> str:
         """Generate random company name."""
-        return self.faker.company()
+        return self._company()
 
     # ==================== PAYMENT DATA ====================
 
@@ -159,21 +245,56 @@ class DataGenerator:
         Returns:
             Dictionary with complete user data
         """
-        first_name = self.generate_first_name()
-        last_name = self.generate_last_name()
-        email = self.generate_email(prefix=f"{first_name.lower()}_{last_name.lower()}")
-
-        user_data = {
-            'first_name': first_name,
-            'last_name': last_name,
-            'email': email,
-            'password': self.generate_password(length=10),
-            'phone': self.generate_phone_number(),
-            'company': self.generate_company_name() if self.faker.boolean() else '',
-            'address': self.generate_full_address()
-        }
+        return self._bulk_user(1)[0]
 
-        return user_data
+    def generate_user_data_batch(self, count: int, user_type: str = 'customer') -> List[Dict[str, Any]]:
+        """
+        Generate user data for several registrations in one pass.
+
+        Args:
+            count: Number of users to generate
+            user_type: Type of user (customer, admin, etc.)
+
+        Returns:
+            List of user data dictionaries (same shape as generate_user_data)
+        """
+        return self._bulk_user(count)
+
+    def _bulk_user(self, count: int) -> List[Dict[str, Any]]:
+        """
+        Build user data dictionaries in a single loop over the bound Faker methods.
+
+        Values are drawn in the same order as the individual generate_* methods,
+        so seeded runs produce the same users.
+
+        Args:
+            count: Number of users to generate
+
+        Returns:
+            List of user data dictionaries
+        """
+        first_name_fn, last_name_fn = self._first_name, self._last_name
+        domain_fn, number_fn = self.faker.free_email_domain, self.faker.random_number
+        password_fn, phone_fn = self._password, self._phone
+        company_fn, boolean_fn = self._company, self._boolean
+
+        users = []
+        for _ in range(count):
+            first_name = first_name_fn()
+            last_name = last_name_fn()
+            domain = domain_fn()
+            email = f"{first_name.lower()}_{last_name.lower()}_{number_fn(digits=6)}@{domain}"
+            users.append({
+                'first_name': first_name,
+                'last_name': last_name,
+                'email': email,
+                'password': password_fn(length=10, special_chars=True, digits=True,
+                                        upper_case=True, lower_case=True),
+                'phone': phone_fn(),
+                'company': company_fn() if boolean_fn() else '',
+                'address': self.generate_full_address()
+            })
+        return users
 
     # ==================== JSON DATA LOADING ====================
 
@@ -189,16 +310,15 @@ class DataGenerator:
 
         Raises:
             FileNotFoundError: If file doesn't exist
-            json.JSONDecodeError: If file contains invalid JSON
+            json.JSONDecodeError: If file contains invalid JSON (orjson.JSONDecodeError, a subclass, with orjson)
         """
-        filepath = os.path.join(self.data_dir, filename)
+        filepath = self._data_dir / filename
 
-        if not os.path.exists(filepath):
+        try:
+            return _read_json(filepath)
+        except FileNotFoundError:
             raise FileNotFoundError(f"Data file not found: {filepath}")
 
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
-
     def load_users(self, filename: str = 'users.json') -> List[Dict[str, Any]]:
         """
         Load user data from JSON file.
@@ -215,6 +335,10 @@ class DataGenerator:
         """
         Get user data by role.
 
+        The first user with each role is indexed on first lookup, so later lookups
+        copy one small record instead of re-reading the whole file. The index is
+        rebuilt when a different filename is requested or the file changes.
+
         Args:
             role: User role (e.g., 'registered_user', 'admin')
             filename: User data filename
@@ -222,11 +346,23 @@ class DataGenerator:
         Returns:
             User dictionary or None if not found
         """
-        users = self.load_users(filename)
-        for user in users:
-            if user.get('role') == role:
-                return user
-        return None
+        filepath = self._data_dir / filename
+        try:
+            key = (filename, filepath.stat().st_mtime_ns)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Data file not found: {filepath}")
+
+        if key != self._role_index_key:
+            index: Dict[str, Dict[str, Any]] = {}
+            for user in self.load_users(filename):
+                if 'role' in user and user['role'] not in index:
+                    index[user['role']] = user
+            self._role_index = index
+            self._role_index_key = key
+
+        # Copy so the caller may mutate the record without touching the index
+        user = self._role_index.get(role)
+        return copy.deepcopy(user) if user is not None else None
 
     def save_json_data(self, data: Any, filename: str) -> None:
         """
@@ -237,11 +373,20 @@ class DataGenerator:
             filename: Target filename
         """
         # Ensure data directory exists
-        Path(self.data_dir).mkdir(parents=True, exist_ok=True)
-
-        filepath = os.path.join(self.data_dir, filename)
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        self._data_dir.mkdir(parents=True, exist_ok=True)
+
+        filepath = self._data_dir / filename
+        if orjson is not None:
+            with open(filepath, 'wb') as f:
+                # OPT_NON_STR_KEYS coerces int/float/bool/None keys to strings like json.dump
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+
+        # mtime may not tick between two quick writes, so drop the index explicitly
+        if self._role_index_key is not None and self._role_index_key[0] == filename:
+            self._role_index_key = None
 
     # ==================== RANDOM DATA ====================
 
@@ -2,16 +2,70 @@
 Logging utility for the test automation framework.
 """
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
+
+
+# Queue handlers shared by every Logger writing to the same log file, keyed by absolute path
+_HANDLER_CACHE: Dict[str, logging.Handler] = {}
+
+# Background listeners draining each file's queue, stopped (and flushed) at interpreter exit
+_LISTENERS: List[logging.handlers.QueueListener] = []
+
+
+def _stop_listeners() -> None:
+    """Stop all queue listeners, writing out any records still queued."""
+    while _LISTENERS:
+        _LISTENERS.pop().stop()
+
+
+atexit.register(_stop_listeners)
+
+
+def _file_queue_handler(log_filepath: str, formatter: logging.Formatter) -> logging.Handler:
+    """
+    Get the queue handler for a log file, creating it and its listener on first use.
+
+    Records are only enqueued on the calling thread; a single listener thread per
+    file formats and writes them through a RotatingFileHandler.
+
+    Args:
+        log_filepath: Absolute path to the log file
+        formatter: Formatter for file output
+
+    Returns:
+        QueueHandler feeding the file's listener
+    """
+    handler = _HANDLER_CACHE.get(log_filepath)
+    if handler is None:
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_filepath, mode='a', maxBytes=50_000_000, backupCount=3,
+            encoding='utf-8', delay=True
+        )
+        file_handler.setLevel(logging.DEBUG)  # File gets all logs
+        file_handler.setFormatter(formatter)
+
+        log_queue = queue.Queue(-1)
+        listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+        listener.start()
+        _LISTENERS.append(listener)
+
+        handler = logging.handlers.QueueHandler(log_queue)
+        _HANDLER_CACHE[log_filepath] = handler
+    return handler
 
 
 class Logger:
     """Custom logger class for framework-wide logging."""
 
+    __slots__ = ('name', 'log_dir', 'log_level', 'logger')
+
     def __init__(self, name: str, log_dir: str = "logs", log_level: str = "INFO"):
         """
         Initialize logger.
@@ -57,11 +111,14 @@ class Logger:
         # File handler - detailed logging to file
         timestamp = datetime.now().strftime("%Y%m%d")
         log_filename = f"test_automation_{timestamp}.log"
-        log_filepath = os.path.join(self.log_dir, log_filename)
+        worker_id = os.getenv("PYTEST_XDIST_WORKER")
+        if worker_id:
+            # One file per pytest-xdist worker process
+            log_filename = f"test_automation_{timestamp}_{worker_id}.log"
+        log_filepath = os.path.abspath(os.path.join(self.log_dir, log_filename))
 
-        file_handler = logging.FileHandler(log_filepath, mode='a', encoding='utf-8')
-        file_handler.setLevel(logging.DEBUG)  # File gets all logs
-        file_handler.setFormatter(detailed_formatter)
+        # File output goes through a shared queue; the write happens on a listener thread
+        file_handler = _file_queue_handler(log_filepath, detailed_formatter)
 
         # Console handler - less verbose, for user feedback
         console_handler = logging.StreamHandler()
@@ -74,29 +131,37 @@ class Logger:
 
         return logger
 
-    def debug(self, message: str) -> None:
+    def isEnabledFor(self, level: int) -> bool:
+        """Check whether messages at the given level would be logged."""
+        return self.logger.isEnabledFor(level)
+
+    def log(self, level: int, message: str, *args) -> None:
+        """Log message at an arbitrary numeric level."""
+        self.logger.log(level, message, *args)
+
+    def debug(self, message: str, *args) -> None:
         """Log debug message."""
-        self.logger.debug(message)
+        self.logger.debug(message, *args)
 
-    def info(self, message: str) -> None:
+    def info(self, message: str, *args) -> None:
         """Log info message."""
-        self.logger.info(message)
+        self.logger.info(message, *args)
 
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args) -> None:
         """Log warning message."""
-        self.logger.warning(message)
+        self.logger.warning(message, *args)
 
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args) -> None:
         """Log error message."""
-        self.logger.error(message)
+        self.logger.error(message, *args)
 
-    def critical(self, message: str) -> None:
+    def critical(self, message: str, *args) -> None:
         """Log critical message."""
-        self.logger.critical(message)
+        self.logger.critical(message, *args)
 
-    def exception(self, message: str) -> None:
+    def exception(self, message: str, *args) -> None:
         """Log exception with traceback."""
-        self.logger.exception(message)
+        self.logger.exception(message, *args)
 
 
 def get_logger(name: str, log_dir: str = "logs", log_level: str = "INFO") -> Logger:
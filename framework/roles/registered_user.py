@@ -23,6 +23,8 @@ class RegisteredUser(Role):
     by composing task modules (authentication, catalog, cart, checkout).
     """
 
+    __slots__ = ('common_tasks',)
+
     def __init__(self, web_interface: WebInterface, user_data: Dict[str, Any], base_url: str):
         """
         Initialize RegisteredUser with credentials and task orchestrators.
@@ -61,16 +63,19 @@ class RegisteredUser(Role):
         """
         return self.common_tasks.log_in(self.email, self.password)
 
-    def logout(self) -> bool:
+    def logout(self, assume_logged_in: bool = False) -> bool:
         """
         Log out from the application.
 
         High-level business workflow that completes logout process.
 
+        Args:
+            assume_logged_in: Skip the logged-in pre-check (caller already verified the state)
+
         Returns:
             True if logout successful, False otherwise
         """
-        return self.common_tasks.log_out()
+        return self.common_tasks.log_out(assume_logged_in=assume_logged_in)
 
     def is_logged_in(self) -> bool:
         """
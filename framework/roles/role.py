@@ -5,7 +5,8 @@ Roles represent user personas (e.g., guest user, registered user, admin)
 and encapsulate their credentials and capabilities.
 """
 
-from typing import Dict, Optional, Any
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Any
 from interfaces.web_interface import WebInterface
 
 
@@ -17,8 +18,16 @@ class Role:
     - User credentials (email, password)
     - User profile data (name, address, etc.)
     - WebInterface instance for performing actions
+
+    Attributes are fixed by __slots__; subclasses declare their own slots.
     """
 
+    __slots__ = (
+        'web', 'user_data', 'email', 'password', 'first_name', 'last_name',
+        'company', 'address', 'role_type', '_user_data_view', '_address_view',
+        '_full_name', '_repr', '_str',
+    )
+
     def __init__(self, web_interface: WebInterface, user_data: Optional[Dict[str, Any]] = None):
         """
         Initialize Role with WebInterface and optional user data.
@@ -39,6 +48,22 @@ class Role:
         self.address = self.user_data.get('address')
         self.role_type = self.user_data.get('role', 'unknown')
 
+        # Read-only views handed out by get_user_data() / get_address()
+        self._user_data_view = MappingProxyType(self.user_data)
+        self._address_view = MappingProxyType(self.address) if self.address else None
+
+        # Derived display strings, computed once (user data is fixed for the role's lifetime)
+        self._full_name = f"{self.first_name} {self.last_name}" if self.first_name and self.last_name else None
+        pretty_role = self.role_type.replace('_', ' ').title()
+        if self.email:
+            self._repr = f"Role(type='{self.role_type}', email='{self.email}')"
+        else:
+            self._repr = f"Role(type='{self.role_type}', anonymous=True)"
+        if self.has_credentials():
+            self._str = f"{pretty_role}: {self.email}"
+        else:
+            self._str = f"{pretty_role} (anonymous)"
+
     def get_full_name(self) -> Optional[str]:
         """
         Get user's full name.
@@ -46,9 +71,7 @@ class Role:
         Returns:
             Full name string or None if not available
         """
-        if self.first_name and self.last_name:
-            return f"{self.first_name} {self.last_name}"
-        return None
+        return self._full_name
 
     def has_credentials(self) -> bool:
         """
@@ -68,14 +91,19 @@ class Role:
         """
         return bool(self.address)
 
-    def get_user_data(self) -> Dict[str, Any]:
+    def get_user_data(self, copy: bool = False) -> Mapping[str, Any]:
         """
-        Get complete user data dictionary.
+        Get complete user data.
+
+        Args:
+            copy: Return a mutable dict copy instead of the read-only view
 
         Returns:
-            Dictionary containing all user data
+            Read-only mapping (or dict copy) containing all user data
         """
-        return self.user_data.copy()
+        if copy:
+            return self.user_data.copy()
+        return self._user_data_view
 
     def get_email(self) -> Optional[str]:
         """
@@ -95,14 +123,14 @@ class Role:
         """
         return self.password
 
-    def get_address(self) -> Optional[Dict[str, str]]:
+    def get_address(self) -> Optional[Mapping[str, str]]:
         """
         Get user's address data.
 
         Returns:
-            Address dictionary or None
+            Read-only address mapping or None
         """
-        return self.address.copy() if self.address else None
+        return self._address_view
 
     def __repr__(self) -> str:
         """
@@ -111,9 +139,7 @@ class Role:
         Returns:
             String describing the role
         """
-        if self.email:
-            return f"Role(type='{self.role_type}', email='{self.email}')"
-        return f"Role(type='{self.role_type}', anonymous=True)"
+        return self._repr
 
     def __str__(self) -> str:
         """
@@ -122,6 +148,4 @@ class Role:
         Returns:
             String describing the role
         """
-        if self.has_credentials():
-            return f"{self.role_type.replace('_', ' ').title()}: {self.email}"
-        return f"{self.role_type.replace('_', ' ').title()} (anonymous)"
+        return self._str
@@ -10,6 +10,13 @@ TODO: Add workflow description
 from typing import Optional
 from framework.interfaces.web_interface import WebInterface
 from framework.pages.common.login_page import LoginPage
+from selenium.webdriver.common.by import By
+
+
+# Header locators used to verify auth state
+_ACCOUNT_OR_LOGOUT = (By.CSS_SELECTOR, ".account, .logout")
+_LOGOUT = (By.CSS_SELECTOR, ".logout")
+_LOGIN = (By.CSS_SELECTOR, ".login")
 
 
 
@@ -27,6 +34,8 @@ class AuthTasks:
         self.web = web
         self.base_url = base_url
 
+        self._login_url = f"{base_url}/index.php?controller=authentication"
+
         self.login_page = LoginPage(web)
 
 
@@ -50,18 +59,16 @@ class AuthTasks:
             True if login successful, False otherwise
         """
         # Navigate to authentication page
-        self.web.navigate(f"{self.base_url}/index.php?controller=authentication")
+        self.web.navigate(self._login_url)
 
         # Enter credentials
-        self.login_page.enter_email(email)
-        self.login_page.enter_passwd(password)
+        self.login_page.fill_credentials(email, password)
 
         # Submit login
         self.login_page.click_submitlogin()
 
         # Verify login success (check for account menu or logout link)
-        from selenium.webdriver.common.by import By
-        return self.web.is_element_visible(By.CSS_SELECTOR, ".account, .logout")
+        return self.web.is_element_visible(*_ACCOUNT_OR_LOGOUT)
 
     def logout(self) -> bool:
         """
@@ -74,11 +81,9 @@ class AuthTasks:
         Returns:
             True if logout successful, False otherwise
         """
-        from selenium.webdriver.common.by import By
-
         # Click logout if visible
-        if self.web.is_element_visible(By.CSS_SELECTOR, ".logout"):
-            self.web.click(By.CSS_SELECTOR, ".logout")
+        if self.web.is_element_visible(*_LOGOUT):
+            self.web.click(*_LOGOUT)
 
         # Verify logout (login link should be visible)
-        return self.web.is_element_visible(By.CSS_SELECTOR, ".login")
+        return self.web.is_element_visible(*_LOGIN)
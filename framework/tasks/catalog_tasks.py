@@ -5,8 +5,9 @@ This module provides high-level task methods that orchestrate page objects
 to accomplish catalog-related workflows like browsing, filtering, and sorting.
 """
 
-import time
 from typing import Optional
+
+from selenium.common.exceptions import TimeoutException
 from interfaces.web_interface import WebInterface
 from pages.catalog.product_list_page import ProductListPage
 from pages.catalog.quick_view_modal import QuickViewModal
@@ -15,6 +16,34 @@ from pages.catalog.quick_view_modal import QuickViewModal
 class CatalogTasks:
     """Catalog task workflows for browsing and filtering products."""
 
+    # Category name (upper-cased) -> ProductListPage click method name
+    _CATEGORY_METHOD_NAMES = {
+        "WOMEN": "click_women_category",
+        "DRESSES": "click_dresses_category",
+        "T-SHIRTS": "click_tshirts_category",
+        "TSHIRTS": "click_tshirts_category",
+    }
+
+    # Sort option (lower-cased) -> canonical sort token
+    _SORT_ALIAS = {
+        "price_asc": "PRICE_ASC",
+        "price_low_to_high": "PRICE_ASC",
+        "price_desc": "PRICE_DESC",
+        "price_high_to_low": "PRICE_DESC",
+        "name_asc": "NAME_ASC",
+        "name_a_to_z": "NAME_ASC",
+        "name_desc": "NAME_DESC",
+        "name_z_to_a": "NAME_DESC",
+    }
+
+    # Canonical sort token -> ProductListPage sort method name
+    _SORT_METHOD_NAMES = {
+        "PRICE_ASC": "sort_by_price_low_to_high",
+        "PRICE_DESC": "sort_by_price_high_to_low",
+        "NAME_ASC": "sort_by_name_a_to_z",
+        "NAME_DESC": "sort_by_name_z_to_a",
+    }
+
     def __init__(self, web: WebInterface, base_url: str):
         """
         Initialize CatalogTasks.
@@ -28,44 +57,93 @@ class CatalogTasks:
         self.product_list_page = ProductListPage(web)
         self.quick_view_modal = QuickViewModal(web)
 
+        # Seconds to wait for the quick view modal to appear after clicking
+        self.modal_open_timeout = 10
+
+        # Category whose listing is currently shown (upper-cased key), and its URL
+        # without query/fragment; lets chained workflows skip re-navigation
+        self.current_category: Optional[str] = None
+        self._category_url: Optional[str] = None
+
     # ==================== NAVIGATION METHODS ====================
 
-    def navigate_to_category(self, category_name: str) -> bool:
+    def navigate_to_category(self, category_name: str, force: bool = False) -> bool:
         """
         Navigate to a product category.
 
         Args:
             category_name: Category to navigate to ("Women", "Dresses", "T-shirts")
+            force: Reload the category even if it is already the current page
 
         Returns:
             True if navigation successful
         """
+        return self._open_category(category_name, force) is not None
+
+    def _open_category(self, category_name: str, force: bool = False) -> Optional[dict]:
+        """
+        Navigate to a product category and snapshot the loaded page.
+
+        Workflows use the returned state instead of re-querying the page for
+        load status and product count. If the category is already the current
+        page (and force is False), the existing page is reused without a reload.
+
+        Args:
+            category_name: Category to navigate to ("Women", "Dresses", "T-shirts")
+            force: Reload the category even if it is already the current page
+
+        Returns:
+            ProductListPage.snapshot_page_state() dict, or None if navigation failed
+        """
+        if not force and self.current_category == category_name.upper():
+            state = self._reuse_category_page()
+            if state is not None:
+                self.web.logger.info(f"Reusing loaded category: {category_name}")
+                return state
+        self.current_category = None
+
         # Navigate to home first
         self.web.navigate_to(self.base_url)
 
         # Click category based on name
-        category_map = {
-            "WOMEN": self.product_list_page.click_women_category,
-            "DRESSES": self.product_list_page.click_dresses_category,
-            "T-SHIRTS": self.product_list_page.click_tshirts_category,
-            "TSHIRTS": self.product_list_page.click_tshirts_category
-        }
-
         category_key = category_name.upper()
-        if category_key not in category_map:
+        if category_key not in self._CATEGORY_METHOD_NAMES:
             self.web.logger.error(f"Invalid category: {category_name}")
-            return False
+            return None
 
         # Click category
-        category_map[category_key]()
+        getattr(self.product_list_page, self._CATEGORY_METHOD_NAMES[category_key])()
 
-        # Verify page loaded
-        if not self.product_list_page.is_page_loaded():
+        # Verify page loaded (state also carries the product count for callers)
+        state = self.product_list_page.snapshot_page_state()
+        if not state["loaded"]:
             self.web.logger.error(f"Failed to load category: {category_name}")
-            return False
+            return None
 
+        self.current_category = category_key
+        self._category_url = self._strip_url(self.web.get_current_url())
         self.web.logger.info(f"Navigated to category: {category_name}")
-        return True
+        return state
+
+    def _reuse_category_page(self) -> Optional[dict]:
+        """
+        Snapshot the current category page if the browser is still on it.
+
+        The URL check catches navigation done elsewhere on the shared driver
+        (e.g. CommonTasks logging out or going home).
+
+        Returns:
+            ProductListPage.snapshot_page_state() dict, or None if the page must be reloaded
+        """
+        if self._strip_url(self.web.get_current_url()) != self._category_url:
+            return None
+        state = self.product_list_page.snapshot_page_state()
+        return state if state["loaded"] else None
+
+    @staticmethod
+    def _strip_url(url: str) -> str:
+        """Drop query string and fragment (sorting and filtering only change those)."""
+        return url.split("#", 1)[0].split("?", 1)[0]
 
     def browse_category(self, category_name: str) -> bool:
         """
@@ -80,16 +158,16 @@ class CatalogTasks:
             True if category browsed successfully and products displayed
         """
         # Navigate to category
-        if not self.navigate_to_category(category_name):
+        state = self._open_category(category_name)
+        if state is None:
             return False
 
         # Verify products are displayed
-        if not self.product_list_page.has_products():
+        if not state["has_products"]:
             self.web.logger.error(f"No products found in category: {category_name}")
             return False
 
-        product_count = self.product_list_page.get_product_count()
-        self.web.logger.info(f"Browsing {category_name}: {product_count} products found")
+        self.web.logger.info(f"Browsing {category_name}: {state['product_count']} products found")
         return True
 
     def browse_subcategory(self, category_name: str, subcategory_name: str) -> bool:
@@ -107,16 +185,18 @@ class CatalogTasks:
         if not self.navigate_to_category(category_name):
             return False
 
-        # Click subcategory
+        # Click subcategory (leaves the category page)
         self.product_list_page.click_subcategory(subcategory_name)
+        self.current_category = None
 
         # Verify page loaded
-        if not self.product_list_page.is_page_loaded():
+        state = self.product_list_page.snapshot_page_state()
+        if not state["loaded"]:
             self.web.logger.error(f"Failed to load subcategory: {subcategory_name}")
             return False
 
         # Verify products displayed
-        if not self.product_list_page.has_products():
+        if not state["has_products"]:
             self.web.logger.error(f"No products in subcategory: {subcategory_name}")
             return False
 
@@ -125,27 +205,34 @@ class CatalogTasks:
 
     # ==================== FILTERING METHODS ====================
 
-    def filter_products(self, category_name: str, size: Optional[str] = None, color: Optional[str] = None) -> bool:
+    def filter_products(self, category_name: str, size: Optional[str] = None, color: Optional[str] = None,
+                        force: bool = False) -> bool:
         """
         Filter products by size and/or color.
 
         Complete workflow: navigate to category, apply filters, verify results.
+        Filters narrow the listing, so the next workflow reloads the category.
 
         Args:
             category_name: Category to browse
             size: Optional size filter ("S", "M", "L")
             color: Optional color filter (e.g., "White", "Black")
+            force: Reload the category even if it is already the current page
 
         Returns:
             True if filtering successful
         """
         # Navigate to category
-        if not self.navigate_to_category(category_name):
+        state = self._open_category(category_name, force)
+        if state is None:
             return False
 
-        # Get initial product count
-        initial_count = self.product_list_page.get_product_count()
-        self.web.logger.info(f"Initial product count: {initial_count}")
+        # From here on the listing no longer shows the whole category
+        if size or color:
+            self.current_category = None
+
+        # Initial product count comes from the navigation snapshot
+        self.web.logger.info(f"Initial product count: {state['product_count']}")
 
         # Apply size filter if specified
         if size:
@@ -165,74 +252,62 @@ class CatalogTasks:
                 self.web.logger.error(f"Color filter error: {e}")
                 return False
 
-        # Verify filtering worked (product count should change or stay same)
+        # The count feeds the zero-match warning, which must not depend on the log level
         filtered_count = self.product_list_page.get_product_count()
-        self.web.logger.info(f"Filtered product count: {filtered_count}")
+        self.web.logger.info("Filtered product count: %d", filtered_count)
 
-        if not self.product_list_page.has_products():
-            self.web.logger.warning("No products match the filter criteria")
+        if filtered_count == 0:
             # This is still considered successful - just no matches
-            return True
+            self.web.logger.warning("No products match the filter criteria")
 
         return True
 
     # ==================== SORTING METHODS ====================
 
-    def sort_products(self, category_name: str, sort_by: str) -> bool:
+    def sort_products(self, category_name: str, sort_by: str, force: bool = False) -> bool:
         """
         Sort products in a category.
 
         Complete workflow: navigate to category, apply sort, verify sort order.
+        Sorting reorders the listing (product indexes change, and re-selecting the
+        same option fires no reload), so the next workflow reloads the category.
 
         Args:
             category_name: Category to browse
             sort_by: Sort option ("price_asc", "price_desc", "name_asc", "name_desc")
+            force: Reload the category even if it is already the current page
 
         Returns:
             True if sorting successful and verified
         """
         # Navigate to category
-        if not self.navigate_to_category(category_name):
+        if not self.navigate_to_category(category_name, force):
             return False
 
         # Apply sorting based on option
-        sort_map = {
-            "price_asc": self.product_list_page.sort_by_price_low_to_high,
-            "price_low_to_high": self.product_list_page.sort_by_price_low_to_high,
-            "price_desc": self.product_list_page.sort_by_price_high_to_low,
-            "price_high_to_low": self.product_list_page.sort_by_price_high_to_low,
-            "name_asc": self.product_list_page.sort_by_name_a_to_z,
-            "name_a_to_z": self.product_list_page.sort_by_name_a_to_z,
-            "name_desc": self.product_list_page.sort_by_name_z_to_a,
-            "name_z_to_a": self.product_list_page.sort_by_name_z_to_a
-        }
-
-        sort_key = sort_by.lower()
-        if sort_key not in sort_map:
+        canonical = self._SORT_ALIAS.get(sort_by.lower())
+        if canonical is None:
             self.web.logger.error(f"Invalid sort option: {sort_by}")
             return False
 
-        # Apply sort
-        sort_map[sort_key]()
+        # Apply sort (from here on the listing is no longer in default order)
+        self.current_category = None
+        getattr(self.product_list_page, self._SORT_METHOD_NAMES[canonical])()
         self.web.logger.info(f"Applied sort: {sort_by}")
 
-        # Verify sort order for price sorts
-        if "price" in sort_key:
-            if "asc" in sort_key or "low_to_high" in sort_key:
-                if not self.product_list_page.is_sorted_by_price_ascending():
-                    self.web.logger.error("Price ascending sort verification failed")
-                    return False
-            elif "desc" in sort_key or "high_to_low" in sort_key:
-                if not self.product_list_page.is_sorted_by_price_descending():
-                    self.web.logger.error("Price descending sort verification failed")
-                    return False
+        # Verify sort order for price sorts (one grid snapshot, checked in Python)
+        if canonical == "PRICE_ASC" or canonical == "PRICE_DESC":
+            prices = self.snapshot_products()["prices"]
+            if not self._is_sorted(prices, descending=canonical == "PRICE_DESC"):
+                self.web.logger.error(f"Price {'descending' if canonical == 'PRICE_DESC' else 'ascending'} sort verification failed")
+                return False
 
         self.web.logger.info(f"Products sorted successfully by {sort_by}")
         return True
 
     # ==================== QUICK VIEW METHODS ====================
 
-    def open_quick_view(self, category_name: str, product_index: int = 0) -> bool:
+    def open_quick_view(self, category_name: str, product_index: int = 0, force: bool = False) -> bool:
         """
         Open quick view modal for a product.
 
@@ -241,21 +316,24 @@ class CatalogTasks:
         Args:
             category_name: Category to browse
             product_index: Index of product to quick view (0-based)
+            force: Reload the category even if it is already the current page
 
         Returns:
             True if quick view opened successfully
         """
         # Navigate to category
-        if not self.navigate_to_category(category_name):
+        state = self._open_category(category_name, force)
+        if state is None:
             return False
 
         # Verify product exists
-        product_count = self.product_list_page.get_product_count()
+        product_count = state["product_count"]
         if product_index >= product_count:
             self.web.logger.error(f"Product index {product_index} out of range (total: {product_count})")
             return False
 
-        # Click quick view
+        # Click quick view (the modal and its iframe sit over the listing until closed)
+        self.current_category = None
         try:
             self.product_list_page.click_quick_view_by_index(product_index)
             self.web.logger.info(f"Clicked quick view for product at index {product_index}")
@@ -263,11 +341,8 @@ class CatalogTasks:
             self.web.logger.error(f"Failed to click quick view: {e}")
             return False
 
-        # Wait for modal to open
-        time.sleep(2)
-
-        # Verify modal opened
-        if not self.quick_view_modal.is_modal_open():
+        # Wait for modal to open (returns as soon as it is visible)
+        if not self.quick_view_modal.is_modal_open(timeout=self.modal_open_timeout):
             self.web.logger.error("Quick view modal did not open")
             return False
 
@@ -285,13 +360,21 @@ class CatalogTasks:
         """
         try:
             self.quick_view_modal.close_modal()
-            time.sleep(1)
-            self.web.logger.info("Quick view modal closed")
-            return True
         except Exception as e:
             self.web.logger.error(f"Failed to close quick view: {e}")
             return False
 
+        # Return as soon as the overlay is gone rather than after a fixed pause
+        try:
+            self.quick_view_modal.wait_until_closed(timeout=5)
+        except TimeoutException:
+            self.web.logger.warning("Quick view modal still closing after 5s")
+            if self.quick_view_modal.is_modal_open(timeout=0):
+                return False
+
+        self.web.logger.info("Quick view modal closed")
+        return True
+
     # ==================== VERIFICATION METHODS ====================
 
     def verify_products_displayed(self) -> bool:
@@ -313,14 +396,47 @@ class CatalogTasks:
         Returns:
             True if sort order matches expected
         """
-        if expected_order == "price_asc":
-            return self.product_list_page.is_sorted_by_price_ascending()
-        elif expected_order == "price_desc":
-            return self.product_list_page.is_sorted_by_price_descending()
-        else:
+        if expected_order not in ("price_asc", "price_desc"):
             self.web.logger.warning(f"Unknown sort order: {expected_order}")
             return False
 
+        prices = self.snapshot_products()["prices"]
+        return self._is_sorted(prices, descending=expected_order == "price_desc")
+
+    def snapshot_products(self) -> dict:
+        """
+        Read the whole product grid in a single browser round-trip.
+
+        Use this when several grid facts are needed together (count, names, prices)
+        instead of calling the individual getters, which each query the page.
+
+        Returns:
+            Dict with 'count' (int), 'names' (list of str) and 'prices' (list of float;
+            unparseable prices are skipped)
+        """
+        products = self.product_list_page.get_products_data()
+        return {
+            "count": len(products),
+            "names": [product["name"] for product in products],
+            "prices": [product["price"] for product in products if product["price"] is not None],
+        }
+
+    @staticmethod
+    def _is_sorted(values: list, descending: bool = False) -> bool:
+        """
+        Check that values are in order.
+
+        Args:
+            values: Values to check
+            descending: Expect high-to-low order instead of low-to-high
+
+        Returns:
+            True if every adjacent pair is in order
+        """
+        if descending:
+            return all(a >= b for a, b in zip(values, values[1:]))
+        return all(a <= b for a, b in zip(values, values[1:]))
+
     def get_product_count(self) -> int:
         """
         Get number of products currently displayed.
@@ -0,0 +1,48 @@
+"""
+On-disk memoization of MCP tool results for the dev test scripts.
+
+Tool outputs are stored under .tool_cache/ keyed by a SHA-256 of the tool name
+and its JSON-serialized arguments, so repeated dev runs read discovered elements
+from disk instead of launching a browser. Only successful results are cached.
+
+Set NO_CACHE=1 to bypass the cache (e.g. after the target page changed),
+or delete the .tool_cache/ folder to reset it.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Awaitable, Callable
+
+CACHE_DIR = Path(__file__).parent / ".tool_cache"
+
+
+async def cached(tool_fn: Callable[[dict], Awaitable[dict]], args: dict) -> dict:
+    """
+    Return the tool's result for args, calling the tool only on a cache miss.
+
+    Args:
+        tool_fn: Async tool function taking an args dict and returning a result dict
+                 (the *_dict variants of the MCP tools)
+        args: Tool arguments (must be JSON-serializable)
+
+    Returns:
+        The tool's result dict
+    """
+    if os.getenv("NO_CACHE"):
+        return await tool_fn(args)
+
+    payload = json.dumps({"tool": tool_fn.__name__, "args": args}, sort_keys=True)
+    path = CACHE_DIR / f"{hashlib.sha256(payload.encode()).hexdigest()}.json"
+    if path.exists():
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    result = await tool_fn(args)
+    if result.get("status") == "success":
+        CACHE_DIR.mkdir(exist_ok=True)
+        # Write then rename so parallel workers never read a half-written entry
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(result), encoding="utf-8")
+        os.replace(tmp_path, path)
+    return result
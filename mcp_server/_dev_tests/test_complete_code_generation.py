@@ -3,24 +3,30 @@ Final Test: Verify ALL tools generate COMPLETE code (no TODOs/scaffolding).
 
 Tests the complete workflow: Tool 1 → 5 → 6 → 4 → 3 → 2
 All tools should generate production-ready, working code.
+
+Independent tools run concurrently (asyncio.gather) following the data flow:
+  phase 1: scenarios (Tool 1) || element discovery (Tool 2, real browser)
+  phase 2: POM (needs discovery) || role || test (needs scenario)
+  phase 3: task (needs POM)
+Results are printed in the usual step order once available.
 """
 
 import asyncio
-import json
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from tools.tool_01_generate_tests_from_user_story import generate_tests_from_user_story
-from tools.tool_02_discover_page_elements import discover_elements
-from tools.tool_03_generate_page_object import generate_page_object
-from tools.tool_04_generate_task import generate_task
-from tools.tool_05_generate_role import generate_role
-from tools.tool_06_generate_test_template import generate_test_template as gen_test
+from tools.tool_01_generate_tests_from_user_story import generate_tests_from_user_story_dict
+from tools.tool_02_discover_page_elements import discover_elements_dict
+from tools.tool_03_generate_page_object import generate_page_object_dict
+from tools.tool_04_generate_task import generate_task_dict
+from tools.tool_05_generate_role import generate_role_dict
+from tools.tool_06_generate_test_template import generate_test_template_dict as gen_test
+from _cache import cached
 
 
-async def test_complete_workflow():
+async def run_complete_workflow():
     """Test that EVERY tool generates complete, working code."""
 
     print("=" * 100)
@@ -28,10 +34,6 @@ async def test_complete_workflow():
     print("=" * 100)
     print()
 
-    # -------------------------------------------------------------------------
-    print("[1/6] Tool 1: Generate Test Scenarios from User Story")
-    print("-" * 100)
-
     user_story = """
 As a user, I want to log in to my account
 
@@ -41,12 +43,22 @@ When user enters valid email and password
 Then user is logged in successfully
 """
 
-    r1 = await generate_tests_from_user_story({
-        "user_story": user_story,
-        "workflow": "auth"
-    })
+    # Phase 1: scenario generation and browser-driven discovery are independent
+    d1, d5 = await asyncio.gather(
+        generate_tests_from_user_story_dict({
+            "user_story": user_story,
+            "workflow": "auth"
+        }),
+        cached(discover_elements_dict, {
+            "url": "http://www.automationpractice.pl/index.php?controller=authentication",
+            "headless": True
+        })
+    )
+
+    # -------------------------------------------------------------------------
+    print("[1/6] Tool 1: Generate Test Scenarios from User Story")
+    print("-" * 100)
 
-    d1 = json.loads(r1)
     scenario = d1['scenarios'][0]
 
     print(f"[OK] Generated scenario: {scenario['name']}")
@@ -59,12 +71,10 @@ Then user is logged in successfully
     print("[2/6] Tool 2: Discover Page Elements")
     print("-" * 100)
 
-    r5 = await discover_elements({
-        "url": "http://www.automationpractice.pl/index.php?controller=authentication",
-        "headless": True
-    })
+    if d5['status'] != 'success':
+        print(f"[FAIL] Discovery failed: {d5.get('error')}")
+        return False
 
-    d5 = json.loads(r5)
     login_elements = [e for e in d5['elements'] if e['suggested_name'] in ['EMAIL', 'PASSWD', 'SUBMITLOGIN']]
 
     print(f"[OK] Discovered {len(login_elements)} login elements")
@@ -72,17 +82,28 @@ Then user is logged in successfully
         print(f"  - {elem['suggested_name']}: {elem['element_type']}")
     print()
 
+    # Phase 2: POM (needs discovery), role and test (need only the scenario)
+    d6, d3, d2 = await asyncio.gather(
+        generate_page_object_dict({
+            "page_name": "LoginPage",
+            "elements": login_elements,
+            "workflow": "auth"
+        }),
+        generate_role_dict({
+            "role_name": "RegisteredUser",
+            "capabilities": ["can_login", "can_logout"]
+        }),
+        gen_test({
+            "test_name": scenario['name'],
+            "workflow": scenario['workflow'],
+            "scenario": scenario
+        })
+    )
+
     # -------------------------------------------------------------------------
     print("[3/6] Tool 3: Generate Page Object")
     print("-" * 100)
 
-    r6 = await generate_page_object({
-        "page_name": "LoginPage",
-        "elements": login_elements,
-        "workflow": "auth"
-    })
-
-    d6 = json.loads(r6)
     pom_code = d6['code']
 
     has_pom_methods = 'def enter_email(' in pom_code and 'def click_submitlogin(' in pom_code
@@ -98,7 +119,8 @@ Then user is logged in successfully
     print("[4/6] Tool 4: Generate Task Workflows")
     print("-" * 100)
 
-    r4 = await generate_task({
+    # Phase 3: task generation needs the POM
+    d4 = await generate_task_dict({
         "task_name": "AuthTasks",
         "workflow_description": "Authentication workflows",
         "page_objects": [{
@@ -108,7 +130,6 @@ Then user is logged in successfully
         }]
     })
 
-    d4 = json.loads(r4)
     task_code = d4['code']
 
     has_login = 'def login(' in task_code
@@ -127,12 +148,6 @@ Then user is logged in successfully
     print("[5/6] Tool 5: Generate Role")
     print("-" * 100)
 
-    r3 = await generate_role({
-        "role_name": "RegisteredUser",
-        "capabilities": ["can_login", "can_logout"]
-    })
-
-    d3 = json.loads(r3)
     role_code = d3['code']
 
     has_role_login = 'def login(' in role_code
@@ -149,13 +164,6 @@ Then user is logged in successfully
     print("[6/6] Tool 2: Generate Test")
     print("-" * 100)
 
-    r2 = await gen_test({
-        "test_name": scenario['name'],
-        "workflow": scenario['workflow'],
-        "scenario": scenario
-    })
-
-    d2 = json.loads(r2)
     test_code = d2['code']
 
     has_test_data = 'test_email' in test_code
@@ -206,6 +214,11 @@ Then user is logged in successfully
     return all_complete
 
 
+def test_complete_workflow():
+    """Pytest entry point (one test per file, so --dist loadfile keeps the chain on one worker)."""
+    assert asyncio.run(run_complete_workflow())
+
+
 if __name__ == "__main__":
-    success = asyncio.run(test_complete_workflow())
+    success = asyncio.run(run_complete_workflow())
     sys.exit(0 if success else 1)
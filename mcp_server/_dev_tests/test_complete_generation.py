@@ -1,24 +1,52 @@
 """
 Test complete code generation workflow.
 Tests Tools 5 → 6 → 4 → 3 → 2 to see what generates complete vs scaffolding.
+
+Independent tools run concurrently (asyncio.gather) following the data flow:
+  phase 1: scenarios (Tool 1) || discovery (Tool 5, real browser) || role (Tool 3)
+  phase 2: POM (needs discovered elements) || test (needs scenario)
+  phase 3: task (needs POM methods)
+Results are printed in the usual step order once available.
 """
 
 import asyncio
-import json
+import re
 import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent))
-
-from tools.tool_05_discover_page_elements import discover_elements
-from tools.tool_06_generate_page_object import generate_page_object
-from tools.tool_04_generate_task import generate_task
-from tools.tool_03_generate_role import generate_role
-from tools.tool_02_generate_test_template import generate_test_template as gen_test
-from tools.tool_01_generate_tests_from_user_story import generate_tests_from_user_story
-
-
-async def test_complete_workflow():
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tools.tool_02_discover_page_elements import discover_elements_dict
+from tools.tool_03_generate_page_object import generate_page_object_dict
+from tools.tool_04_generate_task import generate_task_dict
+from tools.tool_05_generate_role import generate_role_dict
+from tools.tool_06_generate_test_template import generate_test_template_dict as gen_test
+from tools.tool_01_generate_tests_from_user_story import generate_tests_from_user_story_dict
+from _cache import cached
+
+# One pass over generated code: method names (group 1) and marker strings (groups 2-5)
+_CODE_SCAN = re.compile(
+    r"def (\w+)\("
+    r"|(TODO|NotImplementedError)"
+    r"|# (Act|Assert)\b"
+    r"|(pass  # Remove this line)"
+    r"|(self\.common_tasks\.log_in)"
+)
+
+
+def scan_code(code: str):
+    """Return (method names in order, set of markers found) from a single regex pass."""
+    methods = []
+    markers = set()
+    for match in _CODE_SCAN.finditer(code):
+        if match.group(1):
+            methods.append(match.group(1))
+        else:
+            markers.add(match.group(match.lastindex))
+    return methods, markers
+
+
+async def run_complete_workflow(output_dir: Path = Path(".")):
     """Test the complete workflow: 1 → 5 → 6 → 4 → 3 → 2"""
 
     print("=" * 80)
@@ -39,12 +67,22 @@ Then user is logged in successfully
 And user sees account dashboard
 """
 
-    result1 = await generate_tests_from_user_story({
-        "user_story": user_story,
-        "workflow": "auth"
-    })
+    # Phase 1: none of these depend on each other; discovery (browser) dominates
+    parsed1, parsed5, parsed3 = await asyncio.gather(
+        generate_tests_from_user_story_dict({
+            "user_story": user_story,
+            "workflow": "auth"
+        }),
+        cached(discover_elements_dict, {
+            "url": "http://www.automationpractice.pl/index.php?controller=authentication",
+            "headless": True
+        }),
+        generate_role_dict({
+            "role_name": "RegisteredUser",
+            "capabilities": ["can_login", "can_logout"]
+        })
+    )
 
-    parsed1 = json.loads(result1)
     print(f"Status: {parsed1['status']}")
     print(f"Scenarios: {parsed1['scenarios_count']}")
     print(f"First scenario: {parsed1['scenarios'][0]['name']}")
@@ -54,13 +92,10 @@ And user sees account dashboard
     print("TOOL 5: Discover Page Elements")
     print("=" * 80)
 
-    result5 = await discover_elements({
-        "url": "http://www.automationpractice.pl/index.php?controller=authentication",
-        "headless": True
-    })
-
-    parsed5 = json.loads(result5)
     print(f"Status: {parsed5['status']}")
+    if parsed5['status'] != 'success':
+        print(f"[FAIL] Tool 5 failed: {parsed5.get('error')}")
+        return False
     print(f"Total elements: {parsed5['total_elements']}")
     print(f"By type: {parsed5['elements_by_type']}")
 
@@ -71,36 +106,43 @@ And user sees account dashboard
     ]
     print(f"Login elements: {len(login_elements)}")
 
+    scenario = parsed1['scenarios'][0]
+
+    # Phase 2: the POM needs the discovered elements, the test needs the scenario
+    parsed6, parsed2 = await asyncio.gather(
+        generate_page_object_dict({
+            "page_name": "LoginPage",
+            "elements": login_elements,
+            "workflow": "auth"
+        }),
+        gen_test({
+            "test_name": scenario['name'],
+            "workflow": scenario['workflow'],
+            "scenario": scenario
+        })
+    )
+
     # -------------------------------------------------------------------------
     print("\n" + "=" * 80)
     print("TOOL 6: Generate Page Object")
     print("=" * 80)
 
-    result6 = await generate_page_object({
-        "page_name": "LoginPage",
-        "elements": login_elements,
-        "workflow": "auth"
-    })
-
-    parsed6 = json.loads(result6)
     print(f"Status: {parsed6['status']}")
     print(f"Elements: {parsed6['elements_count']}")
 
     # Check if POM has methods
     code6 = parsed6['code']
-    has_methods = 'def enter_' in code6 or 'def click_' in code6
+    methods, _ = scan_code(code6)
+    has_methods = any(m.startswith(('enter_', 'click_')) for m in methods)
     print(f"Has methods: {has_methods}")
 
     if has_methods:
-        # Extract method names
-        import re
-        methods = re.findall(r'def (\w+)\(', code6)
         print(f"Methods: {methods}")
     else:
         print("⚠️  NO METHODS GENERATED")
 
     # Save POM code for inspection
-    with open('_output_tool6_pom.py', 'w') as f:
+    with open(output_dir / '_output_tool6_pom.py', 'w') as f:
         f.write(code6)
     print("Saved: _output_tool6_pom.py")
 
@@ -114,7 +156,8 @@ And user sees account dashboard
     print("TOOL 4: Generate Task Workflows")
     print("=" * 80)
 
-    result4 = await generate_task({
+    # Phase 3: the task is built from the POM's methods
+    parsed4 = await generate_task_dict({
         "task_name": "AuthTasks",
         "workflow_description": "Authentication workflows (login, logout)",
         "page_objects": [{
@@ -124,21 +167,21 @@ And user sees account dashboard
         }]
     })
 
-    parsed4 = json.loads(result4)
     print(f"Status: {parsed4['status']}")
 
     # Check if Task has complete workflows
     code4 = parsed4['code']
-    has_login = 'def login(' in code4
-    has_logout = 'def logout(' in code4
-    has_todo = 'TODO' in code4 or 'NotImplementedError' in code4
+    methods4, markers4 = scan_code(code4)
+    has_login = 'login' in methods4
+    has_logout = 'logout' in methods4
+    has_todo = 'TODO' in markers4 or 'NotImplementedError' in markers4
 
     print(f"Has login(): {has_login}")
     print(f"Has logout(): {has_logout}")
     print(f"Has TODOs/NotImplemented: {has_todo}")
 
     # Save Task code for inspection
-    with open('_output_tool4_task.py', 'w') as f:
+    with open(output_dir / '_output_tool4_task.py', 'w') as f:
         f.write(code4)
     print("Saved: _output_tool4_task.py")
 
@@ -147,26 +190,21 @@ And user sees account dashboard
     print("TOOL 3: Generate Role")
     print("=" * 80)
 
-    result3 = await generate_role({
-        "role_name": "RegisteredUser",
-        "capabilities": ["can_login", "can_logout"]
-    })
-
-    parsed3 = json.loads(result3)
     print(f"Status: {parsed3['status']}")
 
     # Check if Role has complete methods
     code3 = parsed3['code']
-    has_login_method = 'def login(' in code3
-    has_logout_method = 'def logout(' in code3
-    has_implementation = 'self.common_tasks.log_in' in code3
+    methods3, markers3 = scan_code(code3)
+    has_login_method = 'login' in methods3
+    has_logout_method = 'logout' in methods3
+    has_implementation = 'self.common_tasks.log_in' in markers3
 
     print(f"Has login(): {has_login_method}")
     print(f"Has logout(): {has_logout_method}")
     print(f"Has implementation: {has_implementation}")
 
     # Save Role code for inspection
-    with open('_output_tool3_role.py', 'w') as f:
+    with open(output_dir / '_output_tool3_role.py', 'w') as f:
         f.write(code3)
     print("Saved: _output_tool3_role.py")
 
@@ -175,23 +213,15 @@ And user sees account dashboard
     print("TOOL 2: Generate Test Template")
     print("=" * 80)
 
-    scenario = parsed1['scenarios'][0]
-
-    result2 = await gen_test({
-        "test_name": scenario['name'],
-        "workflow": scenario['workflow'],
-        "scenario": scenario
-    })
-
-    parsed2 = json.loads(result2)
     print(f"Status: {parsed2['status']}")
 
     # Check if Test has complete logic
     code2 = parsed2['code']
-    has_act = '# Act' in code2
-    has_assert = '# Assert' in code2
-    has_todo = 'TODO' in code2
-    has_pass = 'pass  # Remove this line' in code2
+    _, markers2 = scan_code(code2)
+    has_act = 'Act' in markers2
+    has_assert = 'Assert' in markers2
+    has_todo = 'TODO' in markers2
+    has_pass = 'pass  # Remove this line' in markers2
 
     print(f"Has Act section: {has_act}")
     print(f"Has Assert section: {has_assert}")
@@ -199,7 +229,7 @@ And user sees account dashboard
     print(f"Has placeholder pass: {has_pass}")
 
     # Save Test code for inspection
-    with open('_output_tool2_test.py', 'w') as f:
+    with open(output_dir / '_output_tool2_test.py', 'w') as f:
         f.write(code2)
     print("Saved: _output_tool2_test.py")
 
@@ -222,7 +252,14 @@ And user sees account dashboard
     print("  - _output_tool3_role.py")
     print("  - _output_tool2_test.py")
     print("\nInspect these files to see what needs to be enhanced.")
+    return True
+
+
+def test_complete_workflow(tmp_path):
+    """Pytest entry point; output files go to a per-test temp dir so parallel workers never collide."""
+    assert asyncio.run(run_complete_workflow(tmp_path))
 
 
 if __name__ == "__main__":
-    asyncio.run(test_complete_workflow())
+    success = asyncio.run(run_complete_workflow())
+    sys.exit(0 if success else 1)
@@ -8,24 +8,33 @@ End-to-end test demonstrating the complete code generation workflow:
 4. Test Requirements -> Task Class (Tool 4)
 5. Page URL -> Discovered Elements (Tool 5)
 6. Discovered Elements -> Page Object Model (Tool 6)
+
+Independent tools run concurrently (asyncio.gather) following the data flow:
+  phase 1: scenarios (Tool 1) || role (Tool 3) || task (Tool 4) || discovery (Tool 5, real browser)
+  phase 2: test (needs scenario) || POM (needs discovered elements)
+Results are printed in the usual step order once available.
 """
 
 import asyncio
-import json
+import re
 import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tools.tool_01_generate_tests_from_user_story import generate_tests_from_user_story_dict
+from tools.tool_06_generate_test_template import generate_test_template_dict as gen_test_template
+from tools.tool_05_generate_role import generate_role_dict
+from tools.tool_04_generate_task import generate_task_dict
+from tools.tool_02_discover_page_elements import discover_elements_dict
+from tools.tool_03_generate_page_object import generate_page_object_dict
+from _cache import cached
 
-from tools.tool_01_generate_tests_from_user_story import generate_tests_from_user_story
-from tools.tool_02_generate_test_template import generate_test_template as gen_test_template
-from tools.tool_03_generate_role import generate_role
-from tools.tool_04_generate_task import generate_task
-from tools.tool_05_discover_page_elements import discover_elements
-from tools.tool_06_generate_page_object import generate_page_object
+# Element names relevant to the login page POM
+AUTH_RE = re.compile(r"email|passwd|submit|login", re.IGNORECASE)
 
 
-async def test_complete_workflow():
+async def run_complete_workflow():
     """Test complete code generation workflow."""
 
     print("=" * 100)
@@ -59,8 +68,29 @@ async def test_complete_workflow():
         "workflow": "auth"
     }
 
-    tool1_result_str = await generate_tests_from_user_story(tool1_args)
-    tool1_result = json.loads(tool1_result_str)
+    tool3_args = {
+        "role_name": "RegisteredUser",
+        "capabilities": ["can_login", "can_logout"],
+        "credentials": {"email": "test@example.com", "password": "Test123!"}
+    }
+
+    tool4_args = {
+        "task_name": "AuthTasks",
+        "workflow_description": "Authentication workflows: login, logout, password recovery"
+    }
+
+    tool5_args = {
+        "url": "http://www.automationpractice.pl/index.php?controller=authentication",
+        "headless": True
+    }
+
+    # Phase 1: none of these depend on each other; discovery (browser) dominates
+    tool1_result, tool3_result, tool4_result, tool5_result = await asyncio.gather(
+        generate_tests_from_user_story_dict(tool1_args),
+        generate_role_dict(tool3_args),
+        generate_task_dict(tool4_args),
+        cached(discover_elements_dict, tool5_args)
+    )
 
     if tool1_result["status"] != "success":
         print(f"[FAIL] Tool 1 failed: {tool1_result.get('error')}")
@@ -73,9 +103,12 @@ async def test_complete_workflow():
     print(f"  When: {scenario['when']}")
     print(f"  Then: {scenario['then']}")
 
-    # ========== STEP 2: Test Scenario -> Pytest Test ==========
-    print("\n[STEP 2] Test Scenario -> Pytest Test (Tool 2)")
-    print("-" * 100)
+    if tool5_result["status"] != "success":
+        print(f"[FAIL] Tool 5 failed: {tool5_result.get('error')}")
+        return False
+
+    # Filter relevant auth elements
+    auth_elements = [e for e in tool5_result["elements"] if AUTH_RE.search(e["suggested_name"])]
 
     tool2_args = {
         "test_name": scenario["name"],
@@ -83,8 +116,21 @@ async def test_complete_workflow():
         "scenario": scenario
     }
 
-    tool2_result_str = await gen_test_template(tool2_args)
-    tool2_result = json.loads(tool2_result_str)
+    tool6_args = {
+        "page_name": "LoginPage",
+        "elements": auth_elements,
+        "workflow": "auth"
+    }
+
+    # Phase 2: the test needs the scenario, the POM needs the discovered elements
+    tool2_result, tool6_result = await asyncio.gather(
+        gen_test_template(tool2_args),
+        generate_page_object_dict(tool6_args)
+    )
+
+    # ========== STEP 2: Test Scenario -> Pytest Test ==========
+    print("\n[STEP 2] Test Scenario -> Pytest Test (Tool 2)")
+    print("-" * 100)
 
     if tool2_result["status"] != "success":
         print(f"[FAIL] Tool 2 failed: {tool2_result.get('error')}")
@@ -100,15 +146,6 @@ async def test_complete_workflow():
     print("\n[STEP 3] Test Requirements -> Role Class (Tool 3)")
     print("-" * 100)
 
-    tool3_args = {
-        "role_name": "RegisteredUser",
-        "capabilities": ["can_login", "can_logout"],
-        "credentials": {"email": "test@example.com", "password": "Test123!"}
-    }
-
-    tool3_result_str = await generate_role(tool3_args)
-    tool3_result = json.loads(tool3_result_str)
-
     if tool3_result["status"] != "success":
         print(f"[FAIL] Tool 3 failed: {tool3_result.get('error')}")
         return False
@@ -122,14 +159,6 @@ async def test_complete_workflow():
     print("\n[STEP 4] Test Requirements -> Task Class (Tool 4)")
     print("-" * 100)
 
-    tool4_args = {
-        "task_name": "AuthTasks",
-        "workflow_description": "Authentication workflows: login, logout, password recovery"
-    }
-
-    tool4_result_str = await generate_task(tool4_args)
-    tool4_result = json.loads(tool4_result_str)
-
     if tool4_result["status"] != "success":
         print(f"[FAIL] Tool 4 failed: {tool4_result.get('error')}")
         return False
@@ -142,43 +171,14 @@ async def test_complete_workflow():
     print("\n[STEP 5] Page URL -> Discovered Elements (Tool 5)")
     print("-" * 100)
 
-    tool5_args = {
-        "url": "http://www.automationpractice.pl/index.php?controller=authentication",
-        "headless": True
-    }
-
-    tool5_result_str = await discover_elements(tool5_args)
-    tool5_result = json.loads(tool5_result_str)
-
-    if tool5_result["status"] != "success":
-        print(f"[FAIL] Tool 5 failed: {tool5_result.get('error')}")
-        return False
-
     print(f"[PASS] Tool 5: Discovered {tool5_result['total_elements']} elements")
     print(f"  Elements by type: {tool5_result['elements_by_type']}")
-
-    # Filter relevant auth elements
-    auth_elements = []
-    for elem in tool5_result["elements"]:
-        name = elem["suggested_name"]
-        if any(keyword in name.lower() for keyword in ["email", "passwd", "submit", "login"]):
-            auth_elements.append(elem)
-
     print(f"  Filtered to {len(auth_elements)} auth-related elements")
 
     # ========== STEP 6: Discovered Elements -> Page Object Model ==========
     print("\n[STEP 6] Discovered Elements -> Page Object Model (Tool 6)")
     print("-" * 100)
 
-    tool6_args = {
-        "page_name": "LoginPage",
-        "elements": auth_elements,
-        "workflow": "auth"
-    }
-
-    tool6_result_str = await generate_page_object(tool6_args)
-    tool6_result = json.loads(tool6_result_str)
-
     if tool6_result["status"] != "success":
         print(f"[FAIL] Tool 6 failed: {tool6_result.get('error')}")
         return False
@@ -220,6 +220,11 @@ async def test_complete_workflow():
     return True
 
 
+def test_complete_workflow():
+    """Pytest entry point (one test per file, so --dist loadfile keeps the chain on one worker)."""
+    assert asyncio.run(run_complete_workflow())
+
+
 if __name__ == "__main__":
-    success = asyncio.run(test_complete_workflow())
+    success = asyncio.run(run_complete_workflow())
     sys.exit(0 if success else 1)
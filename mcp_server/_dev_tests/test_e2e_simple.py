@@ -11,6 +11,7 @@ Then provides instructions to execute with pytest.
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -108,9 +109,9 @@ def main():
     print("File: tests/auth/test_login_e2e.py\n")
 
     # =================================================================
-    # STEP 5: Save All Files
+    # STEP 5: Save and Display All Generated Code
     # =================================================================
-    print_section("STEP 5: Save Generated Files", "-")
+    print_section("STEP 5: Save and Display Generated Files")
 
     output_dir = Path(__file__).parent / "generated_e2e"
     output_dir.mkdir(exist_ok=True)
@@ -122,26 +123,27 @@ def main():
         ("test_login_e2e.py", test_code, "Test")
     ]
 
-    for filename, code, file_type in files:
-        file_path = output_dir / filename
-        file_path.write_text(code, encoding='utf-8')
-        print(f"[OK] Saved {file_type}: {filename}")
+    # Dispatch all writes at once, echo each artifact while they run, then
+    # confirm each save (result() re-raises a failed write)
+    with ThreadPoolExecutor(max_workers=len(files)) as pool:
+        writes = [
+            pool.submit((output_dir / filename).write_text, code, encoding='utf-8')
+            for filename, code, _ in files
+        ]
+        for (filename, code, file_type), write in zip(files, writes):
+            print(f"\n{'=' * 100}")
+            print(f"FILE: {filename} ({file_type})")
+            print('=' * 100)
+            sys.stdout.write(code)
+            if not code.endswith("\n"):
+                sys.stdout.write("\n")
+            write.result()
+            print(f"[OK] Saved {file_type}: {filename}")
 
     # =================================================================
-    # STEP 6: Display All Generated Code
+    # STEP 6: Copy Instructions
     # =================================================================
-    print_section("STEP 6: All Generated Code")
-
-    for filename, code, file_type in files:
-        print(f"\n{'=' * 100}")
-        print(f"FILE: {filename} ({file_type})")
-        print('=' * 100)
-        print(code)
-
-    # =================================================================
-    # STEP 7: Copy Instructions
-    # =================================================================
-    print_section("STEP 7: Instructions to Execute Test")
+    print_section("STEP 6: Instructions to Execute Test")
 
     print(f"[OK] All files generated in: {output_dir}")
     print("\nTo execute the test with pytest (browser will open!):\n")
@@ -5,17 +5,21 @@ Verify that Tool 5 (discover elements) output can be used as input to Tool 6 (ge
 """
 
 import asyncio
-import json
+import re
 import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from tools.tool_05_discover_page_elements import discover_elements
-from tools.tool_06_generate_page_object import generate_page_object
+from tools.tool_02_discover_page_elements import discover_elements_dict
+from tools.tool_03_generate_page_object import generate_page_object_dict
+from _cache import cached
 
+# Authentication-related element names (login and create-account forms)
+AUTH_RE = re.compile(r"email|passwd|submit|login|create", re.IGNORECASE)
 
-async def test_tools_chain():
+
+async def run_tools_chain():
     """Test complete workflow: discover elements -> generate POM."""
 
     print("=" * 80)
@@ -31,8 +35,7 @@ async def test_tools_chain():
         "headless": True
     }
 
-    tool5_result_str = await discover_elements(tool5_args)
-    tool5_result = json.loads(tool5_result_str)
+    tool5_result = await cached(discover_elements_dict, tool5_args)
 
     if tool5_result["status"] != "success":
         print(f"[FAIL] Tool 5 FAILED: {tool5_result.get('error')}")
@@ -46,12 +49,7 @@ async def test_tools_chain():
     print("-" * 80)
 
     # For login page, we want: email inputs, password input, submit buttons
-    relevant_elements = []
-    for elem in tool5_result["elements"]:
-        name = elem["suggested_name"]
-        # Select authentication-related elements
-        if any(keyword in name.lower() for keyword in ["email", "passwd", "submit", "login", "create"]):
-            relevant_elements.append(elem)
+    relevant_elements = [e for e in tool5_result["elements"] if AUTH_RE.search(e["suggested_name"])]
 
     print(f"[PASS] Filtered to {len(relevant_elements)} relevant elements:")
     for elem in relevant_elements:
@@ -67,8 +65,7 @@ async def test_tools_chain():
         "workflow": "auth"
     }
 
-    tool6_result_str = await generate_page_object(tool6_args)
-    tool6_result = json.loads(tool6_result_str)
+    tool6_result = await generate_page_object_dict(tool6_args)
 
     if tool6_result["status"] != "success":
         print(f"[FAIL] Tool 6 FAILED: {tool6_result.get('error')}")
@@ -90,6 +87,11 @@ async def test_tools_chain():
     return True
 
 
+def test_tools_chain():
+    """Pytest entry point (one test per file, so --dist loadfile keeps the chain on one worker)."""
+    assert asyncio.run(run_tools_chain())
+
+
 if __name__ == "__main__":
-    success = asyncio.run(test_tools_chain())
+    success = asyncio.run(run_tools_chain())
     sys.exit(0 if success else 1)
@@ -123,7 +123,7 @@ Then I should see my account dashboard
     print(f"Discovering elements on: {page_url}")
     print("[INFO] This will open a browser window...")
 
-    tool2_result = await discover_elements({"page_url": page_url})
+    tool2_result = await discover_elements({"url": page_url, "headless": True})
     tool2_data = json.loads(tool2_result)
 
     # Handle different response formats
@@ -9,14 +9,14 @@ import json
 import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from tools.tool_01_generate_tests_from_user_story import generate_tests_from_user_story
-from tools.tool_02_generate_test_template import generate_test_template as gen_test_template
-from tools.tool_03_generate_role import generate_role
+from tools.tool_06_generate_test_template import generate_test_template as gen_test_template
+from tools.tool_05_generate_role import generate_role
 from tools.tool_04_generate_task import generate_task
-from tools.tool_05_discover_page_elements import discover_elements
-from tools.tool_06_generate_page_object import generate_page_object
+from tools.tool_02_discover_page_elements import discover_elements
+from tools.tool_03_generate_page_object import generate_page_object
 
 
 def print_section(title):
@@ -33,7 +33,7 @@ def print_code_block(language, code):
     print("```")
 
 
-async def test_workflow_detailed():
+async def run_workflow_detailed():
     """Test workflow with detailed output display."""
 
     print_section("COMPLETE MCP WORKFLOW: Tools 1->2->3->4->5->6 - DETAILED OUTPUT")
@@ -152,6 +152,10 @@ async def test_workflow_detailed():
 
     print(f"\nOUTPUT: Discovered Elements Summary")
     print("-" * 100)
+    if tool5_result["status"] != "success":
+        print(f"[FAIL] Tool 5 failed: {tool5_result.get('error')}")
+        return False
+
     print(f"Total Elements: {tool5_result['total_elements']}")
     print(f"Elements by Type: {tool5_result['elements_by_type']}")
 
@@ -226,7 +230,14 @@ async def test_workflow_detailed():
     print("\n" + "=" * 100)
     print("SUCCESS: Complete framework generated from user story!")
     print("=" * 100)
+    return True
+
+
+def test_workflow_detailed():
+    """Pytest entry point (one test per file, so --dist loadfile keeps the chain on one worker)."""
+    assert asyncio.run(run_workflow_detailed())
 
 
 if __name__ == "__main__":
-    asyncio.run(test_workflow_detailed())
+    success = asyncio.run(run_workflow_detailed())
+    sys.exit(0 if success else 1)
@@ -20,6 +20,11 @@ from utils.requirements_parser import (
 
 
 async def generate_tests_from_user_story(arguments: dict) -> str:
+    """Convert a user story into test scenarios, returned as a JSON string."""
+    return json.dumps(await generate_tests_from_user_story_dict(arguments), indent=2)
+
+
+async def generate_tests_from_user_story_dict(arguments: dict) -> dict:
     """
     Convert user story into structured test scenarios.
 
@@ -30,22 +35,22 @@ async def generate_tests_from_user_story(arguments: dict) -> str:
         }
 
     Returns:
-        JSON string with array of test scenarios
+        Result dict with array of test scenarios
     """
     user_story = arguments.get("user_story", "")
     workflow = arguments.get("workflow", "")
 
     if not user_story:
-        return json.dumps({
+        return {
             "error": "user_story is required",
             "status": "error"
-        }, indent=2)
+        }
 
     if not workflow:
-        return json.dumps({
+        return {
             "error": "workflow is required (auth, catalog, cart, checkout)",
             "status": "error"
-        }, indent=2)
+        }
 
     try:
         # Parse user story
@@ -55,11 +60,11 @@ async def generate_tests_from_user_story(arguments: dict) -> str:
         scenarios = parsed["scenarios"]
 
         if not scenarios:
-            return json.dumps({
+            return {
                 "error": "No scenarios found in user story. Please include Given-When-Then scenarios.",
                 "status": "error",
                 "hint": "Format: Given <context> When <action> Then <expected outcome>"
-            }, indent=2)
+            }
 
         # Generate test scenarios
         test_scenarios = []
@@ -91,16 +96,16 @@ async def generate_tests_from_user_story(arguments: dict) -> str:
             "next_step": "Use generate_test_template to create pytest test code from these scenarios"
         }
 
-        return json.dumps(result, indent=2)
+        return result
 
     except Exception as e:
         import traceback
         traceback.print_exc()  # Print full traceback for debugging
-        return json.dumps({
+        return {
             "error": f"Failed to parse user story: {str(e)}",
             "status": "error",
             "traceback": traceback.format_exc()
-        }, indent=2)
+        }
 
 
 # For standalone testing
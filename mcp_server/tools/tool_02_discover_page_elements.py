@@ -5,8 +5,11 @@ Discover interactive elements on a web page using Selenium.
 Runs after parsing user story, discovers elements needed for the scenario.
 """
 
+import asyncio
+import atexit
 import json
 import sys
+import threading
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -14,7 +17,69 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from utils.element_discovery import discover_page_elements
 
 
+# One browser per headless mode, reused across discover_elements calls for the
+# life of the process (startup costs seconds; a reset costs milliseconds)
+_DRIVERS = {}
+
+# Serializes discovery: a WebDriver session handles one command stream at a time
+_DRIVER_LOCK = threading.Lock()
+
+
+def _get_driver(headless: bool):
+    """
+    Get the cached browser for a headless mode, starting it on first use.
+
+    Must be called with _DRIVER_LOCK held.
+
+    Args:
+        headless: Run browser in headless mode
+
+    Returns:
+        Chrome WebDriver instance
+    """
+    driver = _DRIVERS.get(headless)
+    if driver is not None:
+        try:
+            # Reset state left by the previous discovery; a dead session raises here
+            driver.delete_all_cookies()
+            return driver
+        except Exception:
+            _DRIVERS.pop(headless, None)
+
+    # Import Selenium dependencies
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
+    # Configure driver
+    options = Options()
+    if headless:
+        options.add_argument("--headless")
+        options.add_argument("--disable-gpu")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+
+    driver = webdriver.Chrome(options=options)
+    _DRIVERS[headless] = driver
+    return driver
+
+
+@atexit.register
+def _quit_drivers() -> None:
+    """Quit all cached browsers at interpreter exit."""
+    while _DRIVERS:
+        _, driver = _DRIVERS.popitem()
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
 async def discover_elements(arguments: dict) -> str:
+    """Discover interactive elements on a page, returned as a JSON string."""
+    return json.dumps(await discover_elements_dict(arguments), indent=2)
+
+
+async def discover_elements_dict(arguments: dict) -> dict:
     """
     Discover interactive elements on a web page.
 
@@ -25,86 +90,86 @@ async def discover_elements(arguments: dict) -> str:
         }
 
     Returns:
-        JSON string with discovered elements
+        Result dict with discovered elements
     """
     url = arguments.get("url", "")
     headless = arguments.get("headless", True)
 
+    # Selenium calls block; run them in a worker thread so the event loop
+    # (other MCP requests, concurrent tool steps) keeps running meanwhile
+    return await asyncio.to_thread(_discover_elements_sync, url, headless)
+
+
+def _discover_elements_sync(url: str, headless: bool) -> dict:
+    """
+    Blocking implementation of discover_elements.
+
+    Args:
+        url: Page URL to inspect
+        headless: Run browser in headless mode
+
+    Returns:
+        Result dict with discovered elements
+    """
     if not url:
-        return json.dumps({
+        return {
             "error": "url is required",
             "status": "error"
-        }, indent=2)
+        }
 
     # Validate URL format
     if not url.startswith("http"):
-        return json.dumps({
+        return {
             "error": "url must start with http:// or https://",
             "status": "error"
-        }, indent=2)
+        }
 
     try:
-        # Import Selenium dependencies
-        from selenium import webdriver
-        from selenium.webdriver.chrome.options import Options
+        with _DRIVER_LOCK:
+            # Reuse (or start) the browser for this mode
+            driver = _get_driver(headless)
 
-        # Configure driver
-        options = Options()
-        if headless:
-            options.add_argument("--headless")
-            options.add_argument("--disable-gpu")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-
-        # Create driver
-        driver = webdriver.Chrome(options=options)
-
-        try:
             # Discover elements
             elements = discover_page_elements(url, driver)
 
-            # Group elements by type
-            grouped = {}
-            for elem in elements:
-                elem_type = elem["element_type"]
-                if elem_type not in grouped:
-                    grouped[elem_type] = []
-                grouped[elem_type].append(elem)
-
-            result = {
-                "status": "success",
-                "url": url,
-                "total_elements": len(elements),
-                "elements_by_type": {k: len(v) for k, v in grouped.items()},
-                "elements": elements,
-                "next_steps": [
-                    "Review discovered elements",
-                    "Select relevant elements for POM",
-                    "Use Tool 6 (generate_page_object) to create POM code",
-                    "Optionally filter elements before passing to Tool 6"
-                ]
-            }
-
-            return json.dumps(result, indent=2)
-
-        finally:
-            # Clean up driver
-            driver.quit()
+        # Group elements by type
+        grouped = {}
+        for elem in elements:
+            elem_type = elem["element_type"]
+            if elem_type not in grouped:
+                grouped[elem_type] = []
+            grouped[elem_type].append(elem)
+
+        result = {
+            "status": "success",
+            "url": url,
+            "total_elements": len(elements),
+            "elements_by_type": {k: len(v) for k, v in grouped.items()},
+            "elements": elements,
+            "next_steps": [
+                "Review discovered elements",
+                "Select relevant elements for POM",
+                "Use Tool 6 (generate_page_object) to create POM code",
+                "Optionally filter elements before passing to Tool 6"
+            ]
+        }
+
+        return result
 
     except ImportError as e:
-        return json.dumps({
+        return {
             "error": "Selenium not installed. Run: pip install selenium webdriver-manager",
             "status": "error",
             "details": str(e)
-        }, indent=2)
+        }
 
     except Exception as e:
         import traceback
-        return json.dumps({
+        return {
             "error": f"Failed to discover elements: {str(e)}",
             "status": "error",
             "traceback": traceback.format_exc()
-        }, indent=2)
+        }
 
 
 if __name__ == "__main__":
@@ -15,6 +15,11 @@ from utils.code_generator import generate_page_object_template, get_file_path_fo
 
 
 async def generate_page_object(arguments: dict) -> str:
+    """Generate POM code from discovered elements, returned as a JSON string."""
+    return json.dumps(await generate_page_object_dict(arguments), indent=2)
+
+
+async def generate_page_object_dict(arguments: dict) -> dict:
     """
     Generate POM code from discovered elements.
 
@@ -26,23 +31,23 @@ async def generate_page_object(arguments: dict) -> str:
         }
 
     Returns:
-        JSON string with generated POM code
+        Result dict with generated POM code
     """
     page_name = arguments.get("page_name", "")
     elements = arguments.get("elements", [])
     workflow = arguments.get("workflow", "")
 
     if not page_name:
-        return json.dumps({
+        return {
             "error": "page_name is required",
             "status": "error"
-        }, indent=2)
+        }
 
     if not elements:
-        return json.dumps({
+        return {
             "error": "elements list is required (use Tool 5 to discover elements)",
             "status": "error"
-        }, indent=2)
+        }
 
     try:
         # Transform Tool 5 output to code_generator format
@@ -83,15 +88,15 @@ async def generate_page_object(arguments: dict) -> str:
             ]
         }
 
-        return json.dumps(result, indent=2)
+        return result
 
     except Exception as e:
         import traceback
-        return json.dumps({
+        return {
             "error": f"Failed to generate POM: {str(e)}",
             "status": "error",
             "traceback": traceback.format_exc()
-        }, indent=2)
+        }
 
 
 if __name__ == "__main__":
@@ -34,6 +34,11 @@ def extract_method_names_from_pom(pom_code: str) -> list:
 
 
 async def generate_task(arguments: dict) -> str:
+    """Generate a task class with complete workflows, returned as a JSON string."""
+    return json.dumps(await generate_task_dict(arguments), indent=2)
+
+
+async def generate_task_dict(arguments: dict) -> dict:
     """
     Generate task class with COMPLETE workflow implementations.
 
@@ -50,17 +55,17 @@ async def generate_task(arguments: dict) -> str:
         }
 
     Returns:
-        JSON string with generated task code
+        Result dict with generated task code
     """
     task_name = arguments.get("task_name", "")
     workflow_description = arguments.get("workflow_description", "")
     page_objects_input = arguments.get("page_objects", [])
 
     if not task_name:
-        return json.dumps({
+        return {
             "error": "task_name is required",
             "status": "error"
-        }, indent=2)
+        }
 
     try:
         # Transform page objects to include extracted methods
@@ -106,15 +111,15 @@ async def generate_task(arguments: dict) -> str:
             ]
         }
 
-        return json.dumps(result, indent=2)
+        return result
 
     except Exception as e:
         import traceback
-        return json.dumps({
+        return {
             "error": f"Failed to generate task: {str(e)}",
             "status": "error",
             "traceback": traceback.format_exc()
-        }, indent=2)
+        }
 
 
 if __name__ == "__main__":
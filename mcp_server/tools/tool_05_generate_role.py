@@ -15,6 +15,11 @@ from utils.code_generator import generate_role_template, get_file_path_for_compo
 
 
 async def generate_role(arguments: dict) -> str:
+    """Generate a role class template, returned as a JSON string."""
+    return json.dumps(await generate_role_dict(arguments), indent=2)
+
+
+async def generate_role_dict(arguments: dict) -> dict:
     """
     Generate role class template.
 
@@ -26,17 +31,17 @@ async def generate_role(arguments: dict) -> str:
         }
 
     Returns:
-        JSON string with generated role code
+        Result dict with generated role code
     """
     role_name = arguments.get("role_name", "")
     capabilities = arguments.get("capabilities", [])
     credentials = arguments.get("credentials", {})
 
     if not role_name:
-        return json.dumps({
+        return {
             "error": "role_name is required",
             "status": "error"
-        }, indent=2)
+        }
 
     try:
         # Generate role code
@@ -58,15 +63,15 @@ async def generate_role(arguments: dict) -> str:
             ]
         }
 
-        return json.dumps(result, indent=2)
+        return result
 
     except Exception as e:
         import traceback
-        return json.dumps({
+        return {
             "error": f"Failed to generate role: {str(e)}",
             "status": "error",
             "traceback": traceback.format_exc()
-        }, indent=2)
+        }
 
 
 if __name__ == "__main__":
@@ -16,6 +16,11 @@ from utils.code_generator import generate_test_template, get_file_path_for_compo
 
 
 async def generate_test_template(arguments: dict) -> str:
+    """Generate a pytest test from a scenario, returned as a JSON string."""
+    return json.dumps(await generate_test_template_dict(arguments), indent=2)
+
+
+async def generate_test_template_dict(arguments: dict) -> dict:
     """
     Generate pytest test template from scenario.
 
@@ -28,7 +33,7 @@ async def generate_test_template(arguments: dict) -> str:
         }
 
     Returns:
-        JSON string with generated test code
+        Result dict with generated test code
     """
     test_name = arguments.get("test_name", "")
     workflow = arguments.get("workflow", "")
@@ -37,22 +42,22 @@ async def generate_test_template(arguments: dict) -> str:
 
     # Validation
     if not test_name:
-        return json.dumps({
+        return {
             "error": "test_name is required",
             "status": "error"
-        }, indent=2)
+        }
 
     if not workflow:
-        return json.dumps({
+        return {
             "error": "workflow is required (auth, catalog, cart, checkout)",
             "status": "error"
-        }, indent=2)
+        }
 
     if not role:
-        return json.dumps({
+        return {
             "error": "role is required (e.g., RegisteredUser, GuestUser, PayrollManager)",
             "status": "error"
-        }, indent=2)
+        }
 
     # Ensure test_name starts with 'test_'
     if not test_name.startswith("test_"):
@@ -83,15 +88,15 @@ async def generate_test_template(arguments: dict) -> str:
             ]
         }
 
-        return json.dumps(result, indent=2)
+        return result
 
     except Exception as e:
         import traceback
-        return json.dumps({
+        return {
             "error": f"Failed to generate test template: {str(e)}",
             "status": "error",
             "traceback": traceback.format_exc()
-        }, indent=2)
+        }
 
 
 # For standalone testing
@@ -58,8 +58,8 @@ def test_logout_after_successful_login(web_interface, config, test_users):
     # Verify logged in before logout
     assert user.is_logged_in(), "User should be logged in before logout"
 
-    # Act: Logout
-    logout_result = user.logout()
+    # Act: Logout (state verified above)
+    logout_result = user.logout(assume_logged_in=True)
 
     # Assert: Verify logout successful
     assert logout_result is True, "Logout should return True"
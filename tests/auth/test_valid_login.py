@@ -75,8 +75,8 @@ def test_valid_login_then_logout(web_interface, config, test_users):
     assert login_result is True, f"Login failed for user: {user_data['email']}"
     assert user.is_logged_in() is True, "User should be logged in"
 
-    # Act: Logout
-    logout_result = user.logout()
+    # Act: Logout (state verified above)
+    logout_result = user.logout(assume_logged_in=True)
 
     # Assert: Verify logout successful
     assert logout_result is True, "Logout should return True"
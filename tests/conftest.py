@@ -35,25 +35,114 @@ def pytest_addoption(parser):
                      help="Environment to test against (default: DEFAULT)")
     parser.addoption("--headless", action="store", default="False",
                      help="Run browser in headless mode (default: False)")
+    parser.addoption("--grid-url", action="store",
+                     default=os.getenv("GRID_URL") if os.getenv("USE_GRID", "false").lower() == "true" else None,
+                     help="Selenium Grid hub URL; runs local Chrome when omitted (default: GRID_URL if USE_GRID=true)")
+    parser.addoption("--reuse-browser", action="store", default="True",
+                     help="Reuse one browser per worker, resetting state between tests (default: True)")
+
+
+def pytest_xdist_auto_num_workers(config):
+    """
+    Number of workers used by `-n auto`.
+
+    Defaults to CPU count minus two so the browsers spawned by each worker
+    are not starved; override with the WORKER_COUNT environment variable.
+    """
+    return int(os.getenv("WORKER_COUNT", max(1, (os.cpu_count() or 1) - 2)))
 
 
 # ------------------------------------------------------------------------------
 # Fixtures
 # ------------------------------------------------------------------------------
 
-@pytest.fixture()
-def driver(request):
+def _start_driver(request):
     """
-    Create and teardown ChromeDriver for each test.
+    Create a ChromeDriver from the command line options.
 
-    Function-scoped: New driver instance per test.
+    Each driver gets a fresh profile directory under the worker's own pytest temp
+    dir, so pytest-xdist workers never collide on a Chrome profile.
     """
     headless_str = request.config.getoption("--headless").strip().lower()
     headless_bool = headless_str == "true"
 
-    chromedriver = create_driver(headless=headless_bool)
+    worker_id = os.getenv("PYTEST_XDIST_WORKER", "main")
+    profile_dir = request.getfixturevalue("tmp_path_factory").mktemp(f"chrome-profile-{worker_id}")
+
+    return create_driver(headless=headless_bool, grid_url=request.config.getoption("--grid-url"),
+                         user_data_dir=str(profile_dir))
+
+
+def _reset_browser(chromedriver):
+    """
+    Return a reused browser to a clean state between tests.
+
+    Closes extra windows, clears storage of the current origin and all cookies
+    (login state lives in cookies), then parks on about:blank.
+    """
+    handles = chromedriver.window_handles
+    for handle in handles[1:]:
+        chromedriver.switch_to.window(handle)
+        chromedriver.close()
+    chromedriver.switch_to.window(handles[0])
+
+    try:
+        chromedriver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+    except Exception:
+        pass  # about:blank and data: pages have no storage
+
+    if hasattr(chromedriver, "execute_cdp_cmd"):
+        # delete_all_cookies only covers the current domain
+        chromedriver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    else:
+        chromedriver.delete_all_cookies()
+    chromedriver.get("about:blank")
+
+
+@pytest.fixture(scope="session")
+def _shared_driver(request):
+    """
+    One ChromeDriver per session (i.e. per pytest-xdist worker).
+
+    Session-scoped: Started lazily by the first test that reuses the browser.
+    """
+    holder = {}
+    yield holder
+    if "driver" in holder:
+        holder["driver"].quit()
+
+
+@pytest.fixture()
+def driver(request, _shared_driver):
+    """
+    Provide a ChromeDriver for each test.
+
+    By default the worker's browser is reused and reset after every test,
+    which avoids a browser + chromedriver start per test. With
+    --reuse-browser=False a new driver is created and quit per test.
+    No driver is ever used by two tests at once, so the suite can run in
+    parallel with pytest-xdist (-n).
+    """
+    if request.config.getoption("--reuse-browser").strip().lower() != "true":
+        chromedriver = _start_driver(request)
+        yield chromedriver
+        chromedriver.quit()
+        return
+
+    if "driver" not in _shared_driver:
+        _shared_driver["driver"] = _start_driver(request)
+    chromedriver = _shared_driver["driver"]
     yield chromedriver
-    chromedriver.quit()
+
+    try:
+        _reset_browser(chromedriver)
+    except Exception:
+        # Browser crashed or is wedged - start a fresh one for the next test
+        broken = _shared_driver.pop("driver")
+        try:
+            broken.quit()
+        except Exception:
+            pass
 
 
 @pytest.fixture(scope="session")
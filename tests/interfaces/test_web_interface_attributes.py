@@ -0,0 +1,51 @@
+"""
+Test suite for WebInterface attribute reads.
+
+Tests cover:
+- Bare boolean attributes (e.g. <input readonly>) read as "true", like WebElement.get_attribute
+- Absent boolean attributes read as None
+- Non-boolean attributes read their value
+
+Uses an inline data: URL page, so no application access is needed.
+"""
+
+import sys
+import pytest
+from pathlib import Path
+
+# Add framework to path
+FRAMEWORK_PATH = str(Path(__file__).parent.parent.parent / "framework")
+sys.path.insert(0, FRAMEWORK_PATH)
+
+from selenium.webdriver.common.by import By
+
+
+FORM_PAGE = (
+    "data:text/html,"
+    "<input id='locked' value='a@b.com' readonly>"
+    "<input id='open' name='email' value='c@d.com'>"
+    "<input id='agree' type='checkbox' checked disabled>"
+)
+
+
+@pytest.mark.smoke
+def test_bare_boolean_attributes_read_as_true(web_interface):
+    """
+    Test that bare boolean attributes resolve to "true" and absent ones to None.
+
+    Expected Result:
+        get_attribute/get_many match Selenium's WebElement.get_attribute for
+        boolean attributes, so read-only checks see a bare readonly attribute.
+    """
+    # Arrange
+    web_interface.navigate_to(FORM_PAGE)
+
+    # Act
+    locked = web_interface.get_many(By.ID, "locked", attributes=["readonly", "disabled", "value"])
+    open_attrs = web_interface.get_many(By.ID, "open", attributes=["readonly", "name"])
+    checked = web_interface.get_attribute(By.ID, "agree", attribute="checked")
+
+    # Assert
+    assert locked["attributes"] == {"readonly": "true", "disabled": None, "value": "a@b.com"}
+    assert open_attrs["attributes"] == {"readonly": None, "name": "email"}
+    assert checked == "true"
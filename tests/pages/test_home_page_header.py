@@ -0,0 +1,72 @@
+"""
+Test suite for header auth-state checks on HomePage.
+
+Tests cover:
+- is_signed_in/is_signed_out answer from BasePage's header expression on a HomePage
+  (HomePage keeps its own header script for header_auth_state())
+- A signed-out header answers without sitting out the timeout
+
+Uses inline data: URL pages, so no application access is needed.
+"""
+
+import sys
+import time
+import pytest
+from pathlib import Path
+
+# Add framework to path
+FRAMEWORK_PATH = str(Path(__file__).parent.parent.parent / "framework")
+sys.path.insert(0, FRAMEWORK_PATH)
+
+from pages.common.home_page import HomePage
+
+
+SIGNED_IN_PAGE = (
+    "data:text/html,"
+    "<a class='logout' href='#'>Sign out</a>"
+    "<a class='account' href='#'><span>Jane Doe</span></a>"
+)
+SIGNED_OUT_PAGE = "data:text/html,<a class='login' href='#'>Sign in</a>"
+
+
+@pytest.mark.smoke
+def test_home_page_reports_signed_in(web_interface):
+    """
+    Test that a HomePage reads the signed-in header state.
+
+    Expected Result:
+        is_signed_in() is True, is_signed_out() is False and My Account is visible.
+    """
+    # Arrange
+    web_interface.navigate_to(SIGNED_IN_PAGE)
+    home_page = HomePage(web_interface)
+
+    # Act / Assert
+    assert home_page.is_signed_in()
+    assert not home_page.is_signed_out()
+    assert home_page.is_my_account_visible()
+    assert home_page.is_signed_in(timeout=0)
+
+
+@pytest.mark.smoke
+def test_home_page_reports_signed_out_without_waiting(web_interface):
+    """
+    Test that a HomePage reads the signed-out header state immediately.
+
+    Expected Result:
+        is_signed_out() is True and is_signed_in() is False, each well inside the timeout.
+    """
+    # Arrange
+    web_interface.navigate_to(SIGNED_OUT_PAGE)
+    home_page = HomePage(web_interface)
+
+    # Act
+    start = time.monotonic()
+    signed_in = home_page.is_signed_in(timeout=3)
+    signed_out = home_page.is_signed_out(timeout=3)
+    elapsed = time.monotonic() - start
+
+    # Assert
+    assert not signed_in
+    assert signed_out
+    assert elapsed < 2